@@ -47,7 +47,7 @@ from pathlib import Path
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -59,7 +59,15 @@ from src.managers.database import create_database_manager
 from src.managers.redis import create_redis_manager
 from src.managers.oidc import create_oidc_config_manager
 from src.managers.session import create_session_manager
+from src.managers.wiki import create_wiki_manager
 from src.services import create_sync_service, create_user_sync_service, create_oidc_service
+from src.repositories import (
+    create_user_repository,
+    create_session_repository,
+    create_note_repository,
+    create_archive_repository,
+    create_audit_log_repository,
+)
 from src.api.middleware.auth_middleware import AuthMiddleware
 from src.api.routes.health import router as health_router
 from src.api.routes.sessions import router as sessions_router
@@ -197,6 +205,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     )
     logger.info("User sync service initialized")
 
+    # Repositories are stateless - build once and share across requests
+    app.state.user_repository = create_user_repository(database_manager, logging_manager)
+    app.state.session_repository = create_session_repository(database_manager, logging_manager)
+    app.state.note_repository = create_note_repository(database_manager, logging_manager)
+    app.state.archive_repository = create_archive_repository(database_manager, logging_manager)
+    app.state.audit_log_repository = create_audit_log_repository(database_manager, logging_manager)
+    logger.info("Repositories initialized")
+
+    # Wiki manager is shared by every wiki request - create it once here
+    app.state.wiki_manager = create_wiki_manager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+    )
+    logger.info("Wiki manager initialized")
+
     # =========================================================================
     # OIDC Authentication Services (Phase 10)
     # =========================================================================
@@ -295,6 +318,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if session_manager:
         await session_manager.close()
 
+    # Stop the wiki PDF process pool
+    app.state.wiki_manager.close()
+
+    # Stop the archive sealing process pool (manager is created on first use)
+    archive_manager = getattr(app.state, "archive_manager", None)
+    if archive_manager:
+        archive_manager.close()
+
     # Cleanup Redis connection (Ash-Bot data)
     if redis_manager:
         await redis_manager.close()
@@ -317,6 +348,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -474,6 +506,8 @@ def main() -> None:
         reload=debug,
         workers=1 if debug else workers,
         log_level="debug" if debug else "info",
+        # uvloop where installed (uvicorn[standard]), stdlib loop otherwise
+        loop="auto",
     )
 
 
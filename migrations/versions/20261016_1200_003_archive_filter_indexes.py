@@ -0,0 +1,49 @@
+"""
+============================================================================
+Ash-DASH: Discord Crisis Detection Dashboard
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+Add indexes for archive list filters
+
+Revision ID: 003_archive_filter_indexes
+Revises: 002_archive_metadata
+Create Date: 2026-10-16
+Phase: Phase 9 - Archive System Implementation
+============================================================================
+
+Changes:
+- Add (discord_user_id, archived_at) index so per-user archive history is
+  served in sort order without a separate sort step
+- Add archived_by index for the "archived by" filter
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# Revision identifiers
+revision: str = "003_archive_filter_indexes"
+down_revision: Union[str, None] = "002_archive_metadata"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add archive list filter indexes."""
+
+    # Per-user history ordered by archive date
+    op.create_index(
+        "ix_archives_user_date",
+        "archives",
+        ["discord_user_id", "archived_at"],
+    )
+
+    # Filter by archiving CRT member
+    op.create_index("ix_archives_archived_by", "archives", ["archived_by"])
+
+
+def downgrade() -> None:
+    """Remove archive list filter indexes."""
+
+    op.drop_index("ix_archives_archived_by", table_name="archives")
+    op.drop_index("ix_archives_user_date", table_name="archives")
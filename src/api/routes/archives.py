@@ -43,7 +43,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -505,17 +505,19 @@ async def list_archives(
     )
     
     # Get archives
-    archives, total = await archive_manager.list_archives(
+    archives_json, total = await archive_manager.list_archives(
         filters=filters,
         skip=skip,
         limit=limit,
     )
     
-    return ArchiveListResponse(
-        archives=[ArchiveListItem(**a) for a in archives],
-        total=total,
-        skip=skip,
-        limit=limit,
+    # PostgreSQL already serialized the page in the ArchiveListItem shape;
+    # splice it into the envelope verbatim (response_model still documents
+    # the shape)
+    return Response(
+        content=b'{"archives":%b,"total":%d,"skip":%d,"limit":%d}'
+        % (archives_json, total, skip, limit),
+        media_type="application/json",
     )
 
 
@@ -539,7 +541,8 @@ async def get_statistics(
     
     stats = await archive_manager.get_statistics()
     
-    return ArchiveStatistics(**stats)
+    # Built from trusted rows - skip response_model re-validation
+    return ORJSONResponse(ArchiveStatistics(**stats).model_dump(mode="json"))
 
 
 @router.get(
@@ -563,7 +566,9 @@ async def get_expiring_archives(
     
     expiring = await archive_manager.get_expiring_soon(days=days)
     
-    return [ExpiringArchive(**e) for e in expiring]
+    # The manager already returns ExpiringArchive-shaped dicts with ISO
+    # timestamps; serialize them directly
+    return ORJSONResponse(expiring)
 
 
 # =============================================================================
@@ -597,7 +602,8 @@ async def get_archive(
             detail=f"Archive {archive_id} not found",
         )
     
-    return ArchiveMetadata(**metadata)
+    # Drops the storage-only keys; skip response_model re-validation
+    return ORJSONResponse(ArchiveMetadata(**metadata).model_dump(mode="json"))
 
 
 @router.get(
@@ -880,20 +886,12 @@ async def delete_archive(
             detail=f"Archive {archive_id} not found",
         )
     
-    # Delete from MinIO
-    from src.managers.archive import create_minio_manager
-    
-    config_manager = get_config_manager(request)
-    secrets_manager = get_secrets_manager(request)
-    
-    minio_manager = await create_minio_manager(
-        config_manager=config_manager,
-        secrets_manager=secrets_manager,
-        logging_manager=logging_manager,
-    )
+    # Delete from MinIO (reusing the archive manager's connection pool)
+    minio_manager = archive_manager.minio_manager
     
     try:
         await minio_manager.delete_archive(metadata["storage_key"])
+        archive_manager.discard_cached_archive(metadata["storage_key"])
     except Exception as e:
         logger.error(f"Failed to delete archive from MinIO: {e}")
         raise HTTPException(
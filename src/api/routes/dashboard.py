@@ -38,10 +38,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.session import Session
 from src.models.user import User
-from src.repositories import (
-    create_session_repository,
-    create_user_repository,
-)
 
 __version__ = "v5.0-7-7.4-2"
 
@@ -100,19 +96,13 @@ class ActiveSessionItem(BaseModel):
 # =============================================================================
 
 def get_session_repo(request: Request):
-    """Get SessionRepository from app state."""
-    return create_session_repository(
-        request.app.state.database_manager,
-        request.app.state.logging_manager,
-    )
+    """Get shared SessionRepository from app state."""
+    return request.app.state.session_repository
 
 
 def get_user_repo(request: Request):
-    """Get UserRepository from app state."""
-    return create_user_repository(
-        request.app.state.database_manager,
-        request.app.state.logging_manager,
-    )
+    """Get shared UserRepository from app state."""
+    return request.app.state.user_repository
 
 
 # =============================================================================
@@ -38,18 +38,21 @@ AUTHORIZATION (Phase 10):
     - All audit logs include user_id for tracking
 """
 
+import logging
 from datetime import datetime, timezone
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
-from src.repositories import (
-    create_session_repository,
-    create_note_repository,
-    create_audit_log_repository,
+from src.utils.serialization import (
+    model_field_names,
+    trusted_construct_enabled,
 )
+from src.utils.http_cache import make_etag, etag_matches, PRIVATE_REVALIDATE
 
 # Phase 10: Import auth dependencies
 from src.api.dependencies.auth import (
@@ -60,6 +63,9 @@ from src.api.middleware.auth_middleware import UserContext
 
 __version__ = "v5.0-10-10.2.6-1"
 
+# Initialize module logger
+logger = logging.getLogger(__name__)
+
 # Create router
 router = APIRouter(prefix="/api/sessions", tags=["Sessions"])
 
@@ -88,6 +94,26 @@ class SessionSummary(BaseModel):
         from_attributes = True
 
 
+class SessionResponse(BaseModel):
+    """Plain session response schema (database columns only)."""
+    id: str
+    discord_user_id: int
+    discord_username: Optional[str] = None
+    severity: str
+    status: str
+    crisis_score: Optional[float] = None
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+    duration_seconds: Optional[int] = None
+    message_count: int = 0
+    crt_user_id: Optional[UUID] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class PaginatedSessionList(BaseModel):
     """Paginated list of session summaries."""
     items: List[SessionSummary]
@@ -191,6 +217,28 @@ class NoteResponse(BaseModel):
         from_attributes = True
 
 
+# Field names resolved once at import (from_orm() / column selection)
+SESSION_RESPONSE_FIELDS = model_field_names(SessionResponse)
+_NOTE_RESPONSE_FIELDS = model_field_names(NoteResponse)
+
+# Summary fields copied verbatim from ORM rows (computed fields are
+# filled in by build_session_summary / build_note_summary)
+_SESSION_SUMMARY_COLUMNS = (
+    "id",
+    "discord_user_id",
+    "discord_username",
+    "severity",
+    "status",
+    "started_at",
+    "ended_at",
+    "crt_user_id",
+)
+_get_session_summary_columns = attrgetter(*_SESSION_SUMMARY_COLUMNS)
+
+_NOTE_SUMMARY_COLUMNS = ("id", "author_id", "created_at", "is_locked")
+_get_note_summary_columns = attrgetter(*_NOTE_SUMMARY_COLUMNS)
+
+
 class AssignRequest(BaseModel):
     """Request to assign CRT user to session."""
     crt_user_id: UUID = Field(..., description="CRT user UUID to assign")
@@ -261,17 +309,11 @@ def build_session_summary(session, crt_name: Optional[str] = None) -> SessionSum
     if duration is None and session.status == "active" and session.started_at:
         duration = calculate_elapsed_seconds(session.started_at)
     
-    return SessionSummary(
-        id=session.id,
-        discord_user_id=session.discord_user_id,
-        discord_username=session.discord_username,
-        severity=session.severity,
-        status=session.status,
-        started_at=session.started_at,
-        ended_at=session.ended_at,
+    # Rows come from our own database - build without re-validation
+    return SessionSummary.model_construct(
+        **dict(zip(_SESSION_SUMMARY_COLUMNS, _get_session_summary_columns(session))),
         duration_seconds=duration,
         duration_display=format_duration(duration),
-        crt_user_id=session.crt_user_id,
         crt_member_name=crt_name or (
             session.crt_user.display_name if session.crt_user else None
         ),
@@ -302,13 +344,43 @@ def build_note_summary(note) -> NoteSummary:
     if len(note.content or "") > 200:
         content_preview += "..."
     
-    return NoteSummary(
-        id=note.id,
-        author_id=note.author_id,
+    return NoteSummary.model_construct(
+        **dict(zip(_NOTE_SUMMARY_COLUMNS, _get_note_summary_columns(note))),
         author_name=note.author.display_name if note.author else None,
         content_preview=content_preview,
-        created_at=note.created_at,
-        is_locked=note.is_locked,
+    )
+
+
+def build_session_detail(session) -> SessionDetail:
+    """Build SessionDetail from a session loaded with all relations."""
+    # Calculate duration for display
+    duration = session.duration_seconds
+    if duration is None and session.status == "active" and session.started_at:
+        duration = calculate_elapsed_seconds(session.started_at)
+    
+    # Build notes list
+    notes = [build_note_summary(n) for n in session.notes] if session.notes else []
+    
+    return SessionDetail(
+        id=session.id,
+        discord_user_id=session.discord_user_id,
+        discord_username=session.discord_username,
+        severity=session.severity,
+        status=session.status,
+        started_at=session.started_at,
+        ended_at=session.ended_at,
+        duration_seconds=duration,
+        duration_display=format_duration(duration),
+        message_count=session.message_count,
+        crt_user_id=session.crt_user_id,
+        crt_member_name=session.crt_user.display_name if session.crt_user else None,
+        ash_summary=session.ash_summary,
+        analysis=build_ash_analysis(session),
+        notes=notes,
+        is_archived=(session.status == "archived"),
+        archive_date=session.archive.archived_at if session.archive else None,
+        created_at=session.created_at,
+        updated_at=session.updated_at,
     )
 
 
@@ -325,32 +397,60 @@ def get_user_id_for_audit(user: UserContext) -> Optional[str]:
     return None
 
 
+async def write_audit_log(db_manager, audit_repo, entry: Dict[str, Any]) -> None:
+    """Write an audit log entry in its own short-lived DB session."""
+    try:
+        async with db_manager.session() as db:
+            await audit_repo.log_action(db, **entry)
+            await db.commit()
+    except Exception as e:
+        logger.error(f"❌ Background audit write failed ({entry.get('action')}): {e}")
+
+
+async def record_audit(
+    request: Request,
+    background: BackgroundTasks,
+    db,
+    audit_repo,
+    **entry: Any,
+) -> None:
+    """
+    Record an audit log entry for a session action.
+    
+    With api.background_audit_writes enabled the INSERT runs after the
+    response is sent; otherwise it joins the caller's transaction.
+    Entry values must be plain data (no ORM objects).
+    """
+    config_manager = request.app.state.config_manager
+    if config_manager.get("api", "background_audit_writes", True):
+        background.add_task(
+            write_audit_log,
+            request.app.state.database_manager,
+            audit_repo,
+            entry,
+        )
+        return
+    
+    await audit_repo.log_action(db, **entry)
+
+
 # =============================================================================
 # Dependency Injection Helpers
 # =============================================================================
 
 def get_session_repo(request: Request):
-    """Get SessionRepository from app state."""
-    return create_session_repository(
-        request.app.state.database_manager,
-        request.app.state.logging_manager,
-    )
+    """Get shared SessionRepository from app state."""
+    return request.app.state.session_repository
 
 
 def get_note_repo(request: Request):
-    """Get NoteRepository from app state."""
-    return create_note_repository(
-        request.app.state.database_manager,
-        request.app.state.logging_manager,
-    )
+    """Get shared NoteRepository from app state."""
+    return request.app.state.note_repository
 
 
 def get_audit_repo(request: Request):
-    """Get AuditLogRepository from app state."""
-    return create_audit_log_repository(
-        request.app.state.database_manager,
-        request.app.state.logging_manager,
-    )
+    """Get shared AuditLogRepository from app state."""
+    return request.app.state.audit_log_repository
 
 
 # =============================================================================
@@ -513,7 +613,18 @@ async def get_session_stats(
 # Session Detail Endpoints
 # =============================================================================
 
-@router.get("/{session_id}", response_model=SessionDetail)
+def _session_detail_etag(
+    session_id: str,
+    status: str,
+    updated_at: Any,
+    notes_updated_at: Any,
+    note_count: int,
+) -> str:
+    """ETag for a session detail view (see SessionRepository.get_detail_version)."""
+    return make_etag(session_id, status, updated_at, notes_updated_at, note_count)
+
+
+@router.get("/{session_id}", responses={200: {"model": SessionDetail}})
 async def get_session(
     request: Request,
     session_id: str,
@@ -530,48 +641,59 @@ async def get_session(
     
     Returns:
         Full session details with analysis, notes summary, and metadata
+    
+    Caching:
+        Closed/archived sessions carry an ETag; a matching If-None-Match
+        returns 304 without loading relations. Active sessions are not
+        cached because their duration is computed from the current time.
     """
     session_repo = get_session_repo(request)
     db_manager = request.app.state.database_manager
+    if_none_match = request.headers.get("if-none-match")
     
     async with db_manager.session() as db:
+        # The version pre-check only pays off for conditional requests;
+        # otherwise the ETag is derived from the full load below
+        if if_none_match:
+            version = await session_repo.get_detail_version(db, session_id)
+            if version is None:
+                raise HTTPException(status_code=404, detail="Session not found")
+            
+            if version.status != "active":
+                etag = _session_detail_etag(
+                    session_id,
+                    version.status,
+                    version.updated_at,
+                    version.notes_updated_at,
+                    version.note_count,
+                )
+                if etag_matches(if_none_match, etag):
+                    return Response(
+                        status_code=304,
+                        headers={"ETag": etag, "Cache-Control": PRIVATE_REVALIDATE},
+                    )
+        
         session = await session_repo.get_with_all_relations(db, session_id)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # Calculate duration for display
-    duration = session.duration_seconds
-    if duration is None and session.status == "active" and session.started_at:
-        duration = calculate_elapsed_seconds(session.started_at)
-    
-    # Build notes list
-    notes = [build_note_summary(n) for n in session.notes] if session.notes else []
-    
-    return SessionDetail(
-        id=session.id,
-        discord_user_id=session.discord_user_id,
-        discord_username=session.discord_username,
-        severity=session.severity,
-        status=session.status,
-        started_at=session.started_at,
-        ended_at=session.ended_at,
-        duration_seconds=duration,
-        duration_display=format_duration(duration),
-        message_count=session.message_count,
-        crt_user_id=session.crt_user_id,
-        crt_member_name=session.crt_user.display_name if session.crt_user else None,
-        ash_summary=session.ash_summary,
-        analysis=build_ash_analysis(session),
-        notes=notes,
-        is_archived=(session.status == "archived"),
-        archive_date=session.archive.archived_at if session.archive else None,
-        created_at=session.created_at,
-        updated_at=session.updated_at,
-    )
+    # SessionDetail is built server-side - skip response_model re-validation
+    response = ORJSONResponse(build_session_detail(session).model_dump(mode="json"))
+    if session.status != "active":
+        # Same parts as get_detail_version, taken from the loaded notes
+        response.headers["ETag"] = _session_detail_etag(
+            session_id,
+            session.status,
+            session.updated_at,
+            max((n.updated_at for n in session.notes), default=None),
+            len(session.notes),
+        )
+        response.headers["Cache-Control"] = PRIVATE_REVALIDATE
+    return response
 
 
-@router.get("/{session_id}/notes", response_model=List[NoteResponse])
+@router.get("/{session_id}/notes", responses={200: {"model": List[NoteResponse]}})
 async def get_session_notes(
     request: Request,
     session_id: str,
@@ -590,15 +712,27 @@ async def get_session_notes(
     note_repo = get_note_repo(request)
     db_manager = request.app.state.database_manager
     
+    trusted = trusted_construct_enabled(request.app.state.config_manager)
+    
     async with db_manager.session() as db:
-        # Verify session exists
-        session = await session_repo.get(db, session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
+        if trusted:
+            # Plain column dicts - no ORM hydration or Pydantic pass
+            notes = await note_repo.get_by_session_as_mappings(
+                db, session_id, _NOTE_RESPONSE_FIELDS
+            )
+        else:
+            notes = await note_repo.get_by_session(db, session_id)
         
-        notes = await note_repo.get_by_session(db, session_id)
+        # Only an empty result needs the existence check (404 vs no notes)
+        if not notes and not await session_repo.exists(db, session_id):
+            raise HTTPException(status_code=404, detail="Session not found")
+    
+    if trusted:
+        return ORJSONResponse(notes)
     
-    return [NoteResponse.model_validate(n) for n in notes]
+    return ORJSONResponse([
+        NoteResponse.model_validate(n).model_dump(mode="json") for n in notes
+    ])
 
 
 # =============================================================================
@@ -665,6 +799,7 @@ async def get_user_sessions(
 async def assign_session(
     request: Request,
     session_id: str,
+    background: BackgroundTasks,
     assign_request: AssignRequest,
     user: UserContext = Depends(require_member),
 ):
@@ -685,21 +820,21 @@ async def assign_session(
     db_manager = request.app.state.database_manager
     
     async with db_manager.session() as db:
-        # Get current session
-        session = await session_repo.get(db, session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        old_crt_id = session.crt_user_id
-        
-        # Assign new user
-        await session_repo.assign_to_crt(
+        # Assign new user (UPDATE ... RETURNING reports the previous assignee)
+        previous = await session_repo.assign_to_crt(
             db, session_id, assign_request.crt_user_id
         )
+        if previous is None:
+            raise HTTPException(status_code=404, detail="Session not found")
+        
+        old_crt_id = previous.crt_user_id
         
         # Log the action with user tracking (Phase 10)
-        await audit_repo.log_action(
+        await record_audit(
+            request,
+            background,
             db,
+            audit_repo,
             action="session_assign",
             user_id=user.db_user_id or assign_request.crt_user_id,
             entity_type="session",
@@ -716,13 +851,14 @@ async def assign_session(
         # Fetch updated session with relations
         updated = await session_repo.get_with_all_relations(db, session_id)
     
-    return await get_session(request, session_id, user)
+    return build_session_detail(updated)
 
 
 @router.post("/{session_id}/unassign", response_model=SessionDetail)
 async def unassign_session(
     request: Request,
     session_id: str,
+    background: BackgroundTasks,
     user: UserContext = Depends(require_member),
 ):
     """
@@ -739,17 +875,18 @@ async def unassign_session(
     db_manager = request.app.state.database_manager
     
     async with db_manager.session() as db:
-        session = await session_repo.get(db, session_id)
-        if not session:
+        previous = await session_repo.unassign(db, session_id)
+        if previous is None:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        old_crt_id = session.crt_user_id
-        
-        await session_repo.unassign(db, session_id)
+        old_crt_id = previous.crt_user_id
         
         # Log with user tracking (Phase 10)
-        await audit_repo.log_action(
+        await record_audit(
+            request,
+            background,
             db,
+            audit_repo,
             action="session_unassign",
             user_id=user.db_user_id,
             entity_type="session",
@@ -762,14 +899,17 @@ async def unassign_session(
         )
         
         await db.commit()
+        
+        updated = await session_repo.get_with_all_relations(db, session_id)
     
-    return await get_session(request, session_id, user)
+    return build_session_detail(updated)
 
 
 @router.post("/{session_id}/close", response_model=SessionDetail)
 async def close_session(
     request: Request,
     session_id: str,
+    background: BackgroundTasks,
     close_request: Optional[CloseRequest] = None,
     user: UserContext = Depends(require_member),
 ):
@@ -797,27 +937,28 @@ async def close_session(
     db_manager = request.app.state.database_manager
     
     async with db_manager.session() as db:
-        session = await session_repo.get(db, session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
+        summary = close_request.summary if close_request else None
         
-        if session.status != "active":
+        # Close the session (only matches while status is 'active')
+        previous = await session_repo.close_session(db, session_id, summary)
+        if previous is None:
+            session = await session_repo.get(db, session_id)
+            if not session:
+                raise HTTPException(status_code=404, detail="Session not found")
             raise HTTPException(
                 status_code=400,
                 detail=f"Session is already {session.status}"
             )
         
-        summary = close_request.summary if close_request else None
-        
-        # Close the session
-        await session_repo.close_session(db, session_id, summary)
-        
         # Lock all notes
         await note_repo.lock_session_notes(db, session_id)
         
         # Log the action with user tracking (Phase 10)
-        await audit_repo.log_action(
+        await record_audit(
+            request,
+            background,
             db,
+            audit_repo,
             action="session_close",
             user_id=user.db_user_id,
             entity_type="session",
@@ -830,14 +971,17 @@ async def close_session(
         )
         
         await db.commit()
+        
+        updated = await session_repo.get_with_all_relations(db, session_id)
     
-    return await get_session(request, session_id, user)
+    return build_session_detail(updated)
 
 
 @router.post("/{session_id}/reopen", response_model=SessionDetail)
 async def reopen_session(
     request: Request,
     session_id: str,
+    background: BackgroundTasks,
     user: UserContext = Depends(require_lead),  # Phase 10: Lead+ only
 ):
     """
@@ -865,33 +1009,35 @@ async def reopen_session(
     logger = logging_manager.get_logger("sessions")
     
     async with db_manager.session() as db:
-        session = await session_repo.get(db, session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
-        
-        if session.status == "archived":
-            raise HTTPException(
-                status_code=403,
-                detail="Cannot reopen archived sessions. Archived sessions are permanently sealed."
-            )
-        
-        if session.status != "closed":
+        # Reopen the session (only matches while status is 'closed')
+        previous = await session_repo.reopen_session(db, session_id)
+        if previous is None:
+            session = await session_repo.get(db, session_id)
+            if not session:
+                raise HTTPException(status_code=404, detail="Session not found")
+            
+            if session.status == "archived":
+                raise HTTPException(
+                    status_code=403,
+                    detail="Cannot reopen archived sessions. Archived sessions are permanently sealed."
+                )
+            
             raise HTTPException(
                 status_code=400,
                 detail=f"Cannot reopen session with status: {session.status}"
             )
         
-        old_status = session.status
-        
-        # Reopen the session
-        await session_repo.reopen_session(db, session_id)
+        old_status = previous.status
         
         # Unlock all notes
         await note_repo.unlock_session_notes(db, session_id)
         
         # Log the action with user tracking (Phase 10)
-        await audit_repo.log_action(
+        await record_audit(
+            request,
+            background,
             db,
+            audit_repo,
             action="session_reopen",
             user_id=user.db_user_id,
             entity_type="session",
@@ -907,8 +1053,10 @@ async def reopen_session(
         await db.commit()
         
         logger.info(f"Session {session_id} reopened by {user.email} (role: {user.role.value})")
+        
+        updated = await session_repo.get_with_all_relations(db, session_id)
     
-    return await get_session(request, session_id, user)
+    return build_session_detail(updated)
 
 
 __all__ = ["router"]
@@ -27,17 +27,21 @@ ENDPOINTS:
     GET /api/users/{id}/sessions - Get sessions assigned to user
 """
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
-from src.repositories import (
-    create_user_repository,
-    create_session_repository,
+from src.utils.serialization import (
+    from_orm,
+    model_field_names,
+    trusted_construct_enabled,
 )
+from src.utils.http_cache import make_etag, etag_matches, PRIVATE_REVALIDATE
 
 __version__ = "v5.0-2-2.8-1"
 
@@ -84,36 +88,36 @@ class UserDetailResponse(UserResponse):
     session_summary: Optional[UserSessionSummary] = None
 
 
+# Field names resolved once at import for from_orm()
+_USER_FIELDS = model_field_names(UserResponse)
+
+
 # =============================================================================
 # Dependency Injection Helpers
 # =============================================================================
 
 def get_user_repo(request: Request):
-    """Get UserRepository from app state."""
-    return create_user_repository(
-        request.app.state.database_manager,
-        request.app.state.logging_manager,
-    )
+    """Get shared UserRepository from app state."""
+    return request.app.state.user_repository
 
 
 def get_session_repo(request: Request):
-    """Get SessionRepository from app state."""
-    return create_session_repository(
-        request.app.state.database_manager,
-        request.app.state.logging_manager,
-    )
+    """Get shared SessionRepository from app state."""
+    return request.app.state.session_repository
 
 
 # =============================================================================
 # User List Endpoints
 # =============================================================================
 
-@router.get("", response_model=UserListResponse)
+@router.get("", responses={200: {"model": UserListResponse}})
 async def list_users(
     request: Request,
     role: Optional[str] = Query(None, description="Filter by role"),
     active_only: bool = Query(True, description="Only active users"),
     search: Optional[str] = Query(None, description="Search by name/email"),
+    skip: int = Query(0, ge=0, description="Records to skip"),
+    take: int = Query(50, ge=1, le=200, description="Records to return"),
 ):
     """
     List CRT users with optional filters.
@@ -122,29 +126,34 @@ async def list_users(
         role: Filter by role (admin, crt_member)
         active_only: Only return active users (default: true)
         search: Search by display name or email
+        skip: Records to skip (default: 0)
+        take: Records to return (default: 50, max: 200)
     """
     user_repo = get_user_repo(request)
     db_manager = request.app.state.database_manager
     
     async with db_manager.session() as db:
-        if search:
-            users = await user_repo.search_users(
-                db, query=search, active_only=active_only
-            )
-        elif role:
-            users = await user_repo.get_by_role(db, role, active_only=active_only)
-        elif active_only:
-            users = await user_repo.get_active_users(db)
-        else:
-            users = await user_repo.get_all(db, limit=1000)
+        users, total = await user_repo.list_users(
+            db,
+            role=role,
+            active_only=active_only,
+            search=search,
+            skip=skip,
+            limit=take,
+        )
+    
+    trusted = trusted_construct_enabled(request.app.state.config_manager)
     
-    return UserListResponse(
-        users=[UserResponse.model_validate(u) for u in users],
-        total=len(users),
+    response = UserListResponse.model_construct(
+        users=[from_orm(UserResponse, _USER_FIELDS, u, trusted) for u in users],
+        total=total,
     )
+    
+    # Built from trusted rows - skip response_model re-validation
+    return ORJSONResponse(response.model_dump(mode="json"))
 
 
-@router.get("/admins", response_model=List[UserResponse])
+@router.get("/admins", responses={200: {"model": List[UserResponse]}})
 async def get_admins(request: Request):
     """Get all admin users."""
     user_repo = get_user_repo(request)
@@ -153,10 +162,16 @@ async def get_admins(request: Request):
     async with db_manager.session() as db:
         admins = await user_repo.get_admins(db)
     
-    return [UserResponse.model_validate(u) for u in admins]
+    trusted = trusted_construct_enabled(request.app.state.config_manager)
+    
+    # Built from trusted rows - skip response_model re-validation
+    return ORJSONResponse([
+        from_orm(UserResponse, _USER_FIELDS, u, trusted).model_dump(mode="json")
+        for u in admins
+    ])
 
 
-@router.get("/crt", response_model=List[UserResponse])
+@router.get("/crt", responses={200: {"model": List[UserResponse]}})
 async def get_crt_members(request: Request):
     """Get all CRT members."""
     user_repo = get_user_repo(request)
@@ -165,7 +180,13 @@ async def get_crt_members(request: Request):
     async with db_manager.session() as db:
         members = await user_repo.get_crt_members(db)
     
-    return [UserResponse.model_validate(u) for u in members]
+    trusted = trusted_construct_enabled(request.app.state.config_manager)
+    
+    # Built from trusted rows - skip response_model re-validation
+    return ORJSONResponse([
+        from_orm(UserResponse, _USER_FIELDS, u, trusted).model_dump(mode="json")
+        for u in members
+    ])
 
 
 # =============================================================================
@@ -199,7 +220,7 @@ async def get_current_user(request: Request):
 # User Detail Endpoints
 # =============================================================================
 
-@router.get("/{user_id}", response_model=UserDetailResponse)
+@router.get("/{user_id}", responses={200: {"model": UserDetailResponse}})
 async def get_user(request: Request, user_id: UUID):
     """
     Get a single user by ID with session summary.
@@ -211,32 +232,45 @@ async def get_user(request: Request, user_id: UUID):
     session_repo = get_session_repo(request)
     db_manager = request.app.state.database_manager
     
-    async with db_manager.session() as db:
-        user = await user_repo.get(db, user_id)
-        
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-        
-        # Get session summary
-        active_sessions = await session_repo.get_by_crt_user(
-            db, user_id, status="active"
-        )
-        all_sessions = await session_repo.get_by_crt_user(db, user_id)
-        
-        # Count sessions this month (using get_filtered would need date filter)
-        sessions_this_month = len([
-            s for s in all_sessions 
-            if s.created_at and s.created_at.month == datetime.utcnow().month
-        ])
+    month_start = datetime.now(timezone.utc).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+    
+    # Independent reads - each needs its own session (one asyncpg
+    # connection can't run queries concurrently)
+    async def load_user():
+        async with db_manager.session() as db:
+            return await user_repo.get(db, user_id)
+    
+    async def load_session_counts():
+        async with db_manager.session() as db:
+            return await session_repo.count_by_crt_user(db, user_id, month_start)
+    
+    user, counts = await asyncio.gather(load_user(), load_session_counts())
+    
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Counts are part of the version - assignments don't touch users.updated_at
+    etag = make_etag(
+        user_id,
+        user.updated_at,
+        counts["active"],
+        counts["total"],
+        counts["since"],
+    )
+    headers = {"ETag": etag, "Cache-Control": PRIVATE_REVALIDATE}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
     
     response = UserDetailResponse.model_validate(user)
     response.session_summary = UserSessionSummary(
-        active_sessions=len(active_sessions),
-        total_sessions=len(all_sessions),
-        sessions_this_month=sessions_this_month,
+        active_sessions=counts["active"],
+        total_sessions=counts["total"],
+        sessions_this_month=counts["since"],
     )
     
-    return response
+    return ORJSONResponse(response.model_dump(mode="json"), headers=headers)
 
 
 @router.get("/{user_id}/sessions")
@@ -267,5 +301,10 @@ async def get_user_sessions(
         sessions = await session_repo.get_by_crt_user(db, user_id, status=status)
     
     # Import here to avoid circular import
-    from src.api.routes.sessions import SessionResponse
-    return [SessionResponse.model_validate(s) for s in sessions]
+    from src.api.routes.sessions import SessionResponse, SESSION_RESPONSE_FIELDS
+    
+    trusted = trusted_construct_enabled(request.app.state.config_manager)
+    return [
+        from_orm(SessionResponse, SESSION_RESPONSE_FIELDS, s, trusted)
+        for s in sessions
+    ]
@@ -36,16 +36,21 @@ AUTHORIZATION (Phase 11):
     - Non-admin users cannot see or access restricted documents
 """
 
+import asyncio
+import hashlib
 import logging
-from io import BytesIO
-from typing import List, Optional
+import re
+import time
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import StreamingResponse, Response
+from fastapi.responses import Response
+from pydantic import BaseModel
 
 from src.managers.wiki import (
     WikiManager,
-    create_wiki_manager,
     WikiDocument,
     WikiDocumentSummary,
     WikiSearchResult,
@@ -61,6 +66,14 @@ from src.managers.wiki import (
 # Phase 11: Import auth dependencies
 from src.api.dependencies.auth import require_member
 from src.api.middleware.auth_middleware import UserContext
+from src.utils.http_cache import (
+    make_etag,
+    etag_matches,
+    PRIVATE_REVALIDATE,
+    compress_variants,
+    pick_encoding,
+    encoding_headers,
+)
 
 # Module version
 __version__ = "v5.0-11-11.11-1"
@@ -71,6 +84,30 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter(prefix="/api/wiki", tags=["Wiki"])
 
+# Wiki CSS never changes while the process runs - build both variants once
+_CSS_NO_SYNTAX = get_wiki_styles().encode("utf-8")
+_CSS_WITH_SYNTAX = (
+    get_wiki_styles()
+    + "\n\n/* Syntax Highlighting */\n"
+    + get_pygments_styles("monokai")
+).encode("utf-8")
+_CSS_NO_SYNTAX_ETAG = f'"{hashlib.blake2b(_CSS_NO_SYNTAX, digest_size=8).hexdigest()}"'
+_CSS_WITH_SYNTAX_ETAG = f'"{hashlib.blake2b(_CSS_WITH_SYNTAX, digest_size=8).hexdigest()}"'
+_CSS_NO_SYNTAX_VARIANTS = compress_variants(_CSS_NO_SYNTAX)
+_CSS_WITH_SYNTAX_VARIANTS = compress_variants(_CSS_WITH_SYNTAX)
+
+# Cached JSON payloads are compressed once per docs rescan on the event
+# loop, so use cheaper settings than the import-time CSS
+_JSON_GZIP_LEVEL = 6
+_JSON_BROTLI_QUALITY = 5
+
+# Concurrent /refresh calls (e.g. a deploy hook plus a manual click) within
+# this window share one rescan instead of each walking the docs tree
+REFRESH_COALESCE_SECONDS = 2.0
+_refresh_lock = asyncio.Lock()
+_last_refresh_at = 0.0
+_last_refresh_documents: List[WikiDocument] = []
+
 
 # =============================================================================
 # Category Access Control
@@ -85,41 +122,100 @@ ADMIN_ONLY_CATEGORIES = frozenset({
     "Operations",
 })
 
+# Lowercased once at import for case-insensitive category checks. Note this
+# is three names ("administration" is the admin category's display name),
+# and the check sits behind _category_admin's lru_cache, so a set probe only
+# runs once per distinct category string.
+_ADMIN_ONLY_CATEGORIES_LOWER = frozenset(c.lower() for c in ADMIN_ONLY_CATEGORIES)
+
 # Directory prefixes that map to admin-only categories
-ADMIN_ONLY_PREFIXES = frozenset({
+# (a tuple so str.startswith can check them all in one call)
+ADMIN_ONLY_PREFIXES = (
     "admin/",
     "operations/",
-})
+)
+
+# All prefixes as one anchored, case-insensitive pattern (no lowered copy
+# of the slug, one pass over its head)
+_ADMIN_PREFIX_RE = re.compile(
+    "|".join(re.escape(prefix) for prefix in ADMIN_ONLY_PREFIXES),
+    re.IGNORECASE,
+)
+
+
+# Slugs and category names form a small, closed set - memoize the checks
+# (cleared on /refresh)
+CLASSIFIER_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CLASSIFIER_CACHE_SIZE)
+def _category_admin(category: str) -> bool:
+    return category.lower() in _ADMIN_ONLY_CATEGORIES_LOWER
+
+
+@lru_cache(maxsize=CLASSIFIER_CACHE_SIZE)
+def _slug_admin(slug: str) -> bool:
+    return _ADMIN_PREFIX_RE.match(slug) is not None
 
 
 def is_admin_only_category(category: Optional[str]) -> bool:
     """Check if a category is restricted to admin users."""
     if not category:
         return False
-    return category.lower() in {c.lower() for c in ADMIN_ONLY_CATEGORIES}
+    return _category_admin(category)
 
 
 def is_admin_only_slug(slug: str) -> bool:
     """Check if a document slug is in an admin-only directory."""
-    slug_lower = slug.lower()
-    return any(slug_lower.startswith(prefix) for prefix in ADMIN_ONLY_PREFIXES)
+    return _slug_admin(slug)
+
+
+def _deny_admin_only(slug: str, user: UserContext) -> None:
+    """Log and raise the 403 for an admin-only document."""
+    logger.warning(
+        f"Access denied to admin-only document: {slug} "
+        f"(user: {user.email}, role: {user.role})"
+    )
+    raise HTTPException(
+        status_code=403,
+        detail="Access denied: Admin role required for this documentation",
+    )
 
 
 def check_document_access(slug: str, user: UserContext) -> None:
     """
     Check if user has access to a document based on its path.
     
+    Run before the lookup: admin-only directories get a 403 whether or
+    not the document exists, so their contents can't be probed.
+    
     Raises HTTPException 403 if access denied.
     """
-    if is_admin_only_slug(slug) and not user.is_admin:
-        logger.warning(
-            f"Access denied to admin-only document: {slug} "
-            f"(user: {user.email}, role: {user.role})"
-        )
-        raise HTTPException(
-            status_code=403,
-            detail="Access denied: Admin role required for this documentation",
-        )
+    if not user.is_admin and is_admin_only_slug(slug.lstrip("/")):
+        _deny_admin_only(slug, user)
+
+
+def check_category_access(
+    category: Optional[str],
+    user: UserContext,
+    slug: str,
+) -> None:
+    """
+    Check if user has access to a looked-up document's category.
+    
+    Covers documents whose category is admin-only even though the
+    requested slug did not match an admin-only prefix.
+    
+    Raises HTTPException 403 if access denied.
+    """
+    if not user.is_admin and is_admin_only_category(category):
+        _deny_admin_only(slug, user)
+
+
+def _doc_is_restricted(doc: WikiDocumentSummary) -> bool:
+    """Check a document summary's category and slug in one call."""
+    category = doc.category
+    return bool(category and _category_admin(category)) or _slug_admin(doc.slug)
 
 
 def filter_documents_by_role(
@@ -130,10 +226,8 @@ def filter_documents_by_role(
     if user.is_admin:
         return documents
     
-    return [
-        doc for doc in documents
-        if not is_admin_only_category(doc.category) and not is_admin_only_slug(doc.slug)
-    ]
+    is_restricted = _doc_is_restricted
+    return [doc for doc in documents if not is_restricted(doc)]
 
 
 def filter_categories_by_role(
@@ -144,10 +238,8 @@ def filter_categories_by_role(
     if user.is_admin:
         return categories
     
-    return [
-        cat for cat in categories
-        if not is_admin_only_category(cat.name)
-    ]
+    is_restricted = is_admin_only_category
+    return [cat for cat in categories if not is_restricted(cat.name)]
 
 
 def filter_search_results_by_role(
@@ -158,10 +250,20 @@ def filter_search_results_by_role(
     if user.is_admin:
         return results
     
-    return [
-        result for result in results
-        if not is_admin_only_category(result.category) and not is_admin_only_slug(result.slug)
+    is_restricted = _doc_is_restricted
+    return [result for result in results if not is_restricted(result.document)]
+
+
+def build_member_navigation(navigation: WikiNavigation) -> WikiNavigation:
+    """Build a copy of the navigation without admin-only categories."""
+    categories = [
+        cat for cat in navigation.categories
+        if not is_admin_only_category(cat.name)
     ]
+    return WikiNavigation.model_construct(
+        categories=categories,
+        total_documents=sum(len(cat.documents) for cat in categories),
+    )
 
 
 # =============================================================================
@@ -173,22 +275,88 @@ def get_wiki_manager(request: Request) -> WikiManager:
     """
     Get WikiManager instance from application state.
     
-    Creates a new instance if not already initialized.
+    The manager is created once during application startup (see main.py
+    lifespan).
     """
-    # Check if wiki manager exists in app state
-    if not hasattr(request.app.state, "wiki_manager") or request.app.state.wiki_manager is None:
-        # Create wiki manager with config and logging from app state
-        config_manager = getattr(request.app.state, "config_manager", None)
-        logging_manager = getattr(request.app.state, "logging_manager", None)
-        
-        request.app.state.wiki_manager = create_wiki_manager(
-            config_manager=config_manager,
-            logging_manager=logging_manager,
-        )
-    
     return request.app.state.wiki_manager
 
 
+async def check_wiki_etag(
+    request: Request,
+    response: Response,
+    wiki: WikiManager,
+    user: Optional[UserContext] = None,
+) -> Optional[Response]:
+    """
+    Tag a wiki response with an ETag keyed on the docs tree hash.
+    
+    The hash covers every document's path and modification time, so the
+    tag changes exactly when the underlying data can - including across
+    restarts, which an in-process counter would not survive. Pass user
+    for role-filtered endpoints (admin and member views differ).
+    
+    Returns:
+        A 304 response if the client's copy is current, otherwise None
+        (the ETag header is set on the outgoing response)
+    """
+    # Make sure a stale cache is rebuilt before reading the hash; the
+    # check may hash (or rescan) the docs tree, so keep it off the loop
+    await asyncio.to_thread(wiki.scan_documents)
+    
+    role_key = "all" if user is None else ("admin" if user.is_admin else "member")
+    etag = make_etag(wiki.cache_hash, role_key)
+    headers = {"ETag": etag, "Cache-Control": PRIVATE_REVALIDATE}
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    response.headers.update(headers)
+    return None
+
+
+def _dump_model(obj: Any) -> Any:
+    """orjson fallback serializer for Pydantic models."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def cached_json_response(
+    request: Request,
+    wiki: WikiManager,
+    response: Response,
+    key: Tuple[Any, ...],
+    build: Callable[[], Any],
+) -> Response:
+    """
+    Serve a wiki payload as JSON bytes cached until the next docs rescan.
+    
+    build() produces the Pydantic model (or list of models) for the
+    response and only runs on a miss; hits skip validation, serialization
+    and compression entirely. Headers already set on the injected response
+    (ETag, Cache-Control) are carried over. Call after check_wiki_etag(),
+    which brings the document cache up to date.
+    """
+    variants = wiki.get_cached_view(
+        ("json",) + key,
+        lambda: compress_variants(
+            orjson.dumps(build(), default=_dump_model),
+            gzip_level=_JSON_GZIP_LEVEL,
+            brotli_quality=_JSON_BROTLI_QUALITY,
+        ),
+    )
+    encoding = pick_encoding(request.headers.get("accept-encoding"), variants)
+    
+    headers = dict(response.headers)
+    headers.update(encoding_headers(encoding, headers.pop("etag", None)))
+    
+    return Response(
+        content=variants[encoding],
+        media_type="application/json",
+        headers=headers,
+    )
+
+
 # =============================================================================
 # Document Endpoints
 # =============================================================================
@@ -202,6 +370,8 @@ def get_wiki_manager(request: Request) -> WikiManager:
                 "Admin and Operations categories are only visible to Admin users.",
 )
 async def list_documents(
+    request: Request,
+    response: Response,
     category: Optional[str] = Query(
         None,
         description="Filter by category name (e.g., 'CRT Operations')",
@@ -212,30 +382,40 @@ async def list_documents(
     ),
     wiki: WikiManager = Depends(get_wiki_manager),
     user: UserContext = Depends(require_member),
-) -> WikiDocumentListResponse:
+) -> Response:
     """
     List all wiki documents with optional filtering.
     
     Returns document summaries (without full content) for efficient loading.
     Admin and Operations categories are filtered out for non-admin users.
     """
-    # Check if requesting an admin-only category without admin role
-    if category and is_admin_only_category(category) and not user.is_admin:
+    # Reject admin-only categories for non-admins before touching the
+    # manager (no rescan, hash check or cache lookup for a guaranteed 403)
+    if not user.is_admin and is_admin_only_category(category):
         raise HTTPException(
             status_code=403,
             detail="Access denied: Admin role required for this category",
         )
     
-    documents = wiki.list_documents(category=category, tag=tag)
+    not_modified = await check_wiki_etag(request, response, wiki, user)
+    if not_modified:
+        return not_modified
     
-    # Filter documents based on user role
-    filtered_docs = filter_documents_by_role(documents, user)
+    def build() -> WikiDocumentListResponse:
+        filtered_docs = filter_documents_by_role(
+            wiki.list_documents(category=category, tag=tag), user
+        )
+        # Summaries are already validated - skip re-validating the wrapper
+        return WikiDocumentListResponse.model_construct(
+            documents=filtered_docs,
+            total=len(filtered_docs),
+            category_filter=category,
+            tag_filter=tag,
+        )
     
-    return WikiDocumentListResponse(
-        documents=filtered_docs,
-        total=len(filtered_docs),
-        category_filter=category,
-        tag_filter=tag,
+    # Role-filtered payload is cached until the next docs rescan
+    return cached_json_response(
+        request, wiki, response, ("documents", category, tag, user.is_admin), build
     )
 
 
@@ -270,13 +450,11 @@ async def get_document(
     
     Documents in admin/ or operations/ directories require Admin role.
     """
-    # Check access before retrieving document
+    # Check access before retrieving document (403 even if it doesn't exist)
     check_document_access(slug, user)
     
-    if render:
-        doc = wiki.get_rendered_document(slug)
-    else:
-        doc = wiki.get_document(slug)
+    # Scanning/parsing is blocking I/O - keep it off the event loop
+    doc = await asyncio.to_thread(wiki.get_document, slug)
     
     if not doc:
         raise HTTPException(
@@ -285,11 +463,11 @@ async def get_document(
         )
     
     # Double-check category access (in case slug didn't match pattern)
-    if is_admin_only_category(doc.category) and not user.is_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Access denied: Admin role required for this documentation",
-        )
+    check_category_access(doc.category, user, doc.slug)
+    
+    # Rendering Markdown is CPU work - only done once access is granted
+    if render and not doc.content_html:
+        doc = await asyncio.to_thread(wiki.render_document, doc)
     
     return doc
 
@@ -309,7 +487,7 @@ async def download_pdf(
     slug: str,
     wiki: WikiManager = Depends(get_wiki_manager),
     user: UserContext = Depends(require_member),
-) -> StreamingResponse:
+) -> Response:
     """
     Download a wiki document as a PDF file.
     
@@ -341,29 +519,26 @@ async def download_pdf(
         )
     
     # Double-check category access
-    if is_admin_only_category(doc.category) and not user.is_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Access denied: Admin role required for this documentation",
-        )
+    check_category_access(doc.category, user, doc.slug)
     
     try:
         logger.info(f"📄 Generating PDF for: {doc.title}")
         
-        # Generate PDF
-        pdf_bytes = wiki.generate_pdf(slug)
+        # Generate PDF in the process pool (keeps the event loop free)
+        pdf_bytes = await wiki.generate_pdf_async(slug)
         
         # Generate filename from slug
         filename = slug.split("/")[-1] + ".pdf"
         
         logger.info(f"✅ PDF generated: {filename} ({len(pdf_bytes):,} bytes)")
         
-        return StreamingResponse(
-            BytesIO(pdf_bytes),
+        # PDF is already fully rendered in memory - send it as a single body
+        # (Content-Length is set by Response)
+        return Response(
+            content=pdf_bytes,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Length": str(len(pdf_bytes)),
             },
         )
         
@@ -389,9 +564,11 @@ async def download_pdf(
                 "Admin and Operations categories are only visible to Admin users.",
 )
 async def get_navigation(
+    request: Request,
+    response: Response,
     wiki: WikiManager = Depends(get_wiki_manager),
     user: UserContext = Depends(require_member),
-) -> WikiNavigation:
+) -> Response:
     """
     Get the wiki navigation structure.
     
@@ -400,20 +577,20 @@ async def get_navigation(
     
     Admin and Operations categories are filtered out for non-admin users.
     """
-    navigation = wiki.get_navigation()
-    
-    # Filter categories based on user role
-    if not user.is_admin:
-        navigation.categories = [
-            cat for cat in navigation.categories
-            if not is_admin_only_category(cat.name)
-        ]
-        # Recalculate total after filtering
-        navigation.total_documents = sum(
-            len(cat.documents) for cat in navigation.categories
-        )
-    
-    return navigation
+    not_modified = await check_wiki_etag(request, response, wiki, user)
+    if not_modified:
+        return not_modified
+    
+    def build() -> WikiNavigation:
+        if user.is_admin:
+            return wiki.get_navigation()
+        # A new object - the manager's cached navigation is shared
+        return build_member_navigation(wiki.get_navigation())
+    
+    # Role-filtered payload is cached until the next docs rescan
+    return cached_json_response(
+        request, wiki, response, ("navigation", user.is_admin), build
+    )
 
 
 # =============================================================================
@@ -443,7 +620,7 @@ async def search_documents(
     ),
     wiki: WikiManager = Depends(get_wiki_manager),
     user: UserContext = Depends(require_member),
-) -> WikiSearchResponse:
+) -> Response:
     """
     Search wiki documents by query.
     
@@ -457,15 +634,23 @@ async def search_documents(
     Results include snippets with highlighted matches.
     Admin and Operations documents are filtered out for non-admin users.
     """
-    results = wiki.search(q, limit=limit)
+    results = await asyncio.to_thread(wiki.search, q, limit=limit)
     
     # Filter results based on user role
     filtered_results = filter_search_results_by_role(results, user)
     
-    return WikiSearchResponse(
-        query=q,
-        results=filtered_results,
-        total=len(filtered_results),
+    # Results are already validated models - serialize once with orjson
+    # instead of letting FastAPI re-validate them against response_model
+    return Response(
+        content=orjson.dumps(
+            WikiSearchResponse.model_construct(
+                query=q,
+                results=filtered_results,
+                total=len(filtered_results),
+            ),
+            default=_dump_model,
+        ),
+        media_type="application/json",
     )
 
 
@@ -482,9 +667,11 @@ async def search_documents(
                 "Admin and Operations categories are only visible to Admin users.",
 )
 async def list_categories(
+    request: Request,
+    response: Response,
     wiki: WikiManager = Depends(get_wiki_manager),
     user: UserContext = Depends(require_member),
-) -> List[WikiCategory]:
+) -> Response:
     """
     Get all wiki categories with document counts.
     
@@ -493,12 +680,15 @@ async def list_categories(
     
     Admin and Operations categories are filtered out for non-admin users.
     """
-    categories = wiki.get_categories()
-    
-    # Filter categories based on user role
-    filtered_categories = filter_categories_by_role(categories, user)
-    
-    return filtered_categories
+    not_modified = await check_wiki_etag(request, response, wiki, user)
+    if not_modified:
+        return not_modified
+    
+    # Role-filtered payload is cached until the next docs rescan
+    return cached_json_response(
+        request, wiki, response, ("categories", user.is_admin),
+        lambda: filter_categories_by_role(wiki.get_categories(), user),
+    )
 
 
 @router.get(
@@ -508,9 +698,11 @@ async def list_categories(
     description="Get all tags with document counts.",
 )
 async def list_tags(
+    request: Request,
+    response: Response,
     wiki: WikiManager = Depends(get_wiki_manager),
     user: UserContext = Depends(require_member),
-) -> List[WikiTag]:
+) -> Response:
     """
     Get all wiki tags with document counts.
     
@@ -520,7 +712,14 @@ async def list_tags(
     Note: Tags are not filtered by role. A tag may exist in both
     restricted and unrestricted documents.
     """
-    return wiki.get_tags()
+    # Tags are role-independent - one ETag for everyone
+    not_modified = await check_wiki_etag(request, response, wiki)
+    if not_modified:
+        return not_modified
+    
+    return cached_json_response(
+        request, wiki, response, ("tags",), wiki.get_tags
+    )
 
 
 # =============================================================================
@@ -535,6 +734,7 @@ async def list_tags(
     response_class=Response,
 )
 async def get_styles(
+    request: Request,
     include_syntax: bool = Query(
         True,
         description="Include syntax highlighting CSS",
@@ -550,18 +750,26 @@ async def get_styles(
     If include_syntax=True (default), also includes Pygments CSS
     for syntax highlighting.
     """
-    css = get_wiki_styles()
-    
     if include_syntax:
-        css += "\n\n/* Syntax Highlighting */\n"
-        css += get_pygments_styles("monokai")
+        variants, etag = _CSS_WITH_SYNTAX_VARIANTS, _CSS_WITH_SYNTAX_ETAG
+    else:
+        variants, etag = _CSS_NO_SYNTAX_VARIANTS, _CSS_NO_SYNTAX_ETAG
+    
+    # Compressed once at import - just pick what the client accepts
+    encoding = pick_encoding(request.headers.get("accept-encoding"), variants)
+    headers = {
+        "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
+        **encoding_headers(encoding, etag),
+    }
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
     
     return Response(
-        content=css,
+        content=variants[encoding],
         media_type="text/css",
-        headers={
-            "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
-        },
+        headers=headers,
     )
 
 
@@ -587,8 +795,21 @@ async def refresh_cache(
     
     Note: Any authenticated CRT member can refresh the cache.
     """
-    wiki.invalidate_cache()
-    documents = wiki.scan_documents(force_refresh=True)
+    global _last_refresh_at, _last_refresh_documents
+    
+    async with _refresh_lock:
+        if time.monotonic() - _last_refresh_at < REFRESH_COALESCE_SECONDS:
+            # Another request just rescanned - reuse its result
+            documents = _last_refresh_documents
+        else:
+            # No invalidate_cache(): the forced scan builds a new cache and
+            # swaps it in, so concurrent readers keep the old one meanwhile
+            # instead of rescanning on the event loop
+            _slug_admin.cache_clear()
+            _category_admin.cache_clear()
+            documents = await asyncio.to_thread(wiki.scan_documents, force_refresh=True)
+            _last_refresh_at = time.monotonic()
+            _last_refresh_documents = documents
     
     # Count visible documents for this user
     visible_count = len([
@@ -621,18 +842,29 @@ async def get_status(
     
     Document count reflects only documents visible to the current user.
     """
-    # Get categories visible to user
-    all_categories = wiki.get_categories()
-    visible_categories = filter_categories_by_role(all_categories, user)
-    
-    # Calculate visible document count
-    visible_doc_count = sum(cat.document_count for cat in visible_categories)
+    def build() -> Tuple[int, int, int]:
+        # One pass over the categories for both counts (no filtered list)
+        doc_count = 0
+        category_count = 0
+        for cat in wiki.get_categories():
+            if not user.is_admin and is_admin_only_category(cat.name):
+                continue
+            doc_count += cat.document_count
+            category_count += 1
+        return doc_count, category_count, len(wiki.get_tags())
+    
+    # Per-role counts are cached until the next docs rescan (stale docs are
+    # rescanned first, off the event loop)
+    await asyncio.to_thread(wiki.scan_documents)
+    visible_doc_count, category_count, tag_count = wiki.get_cached_view(
+        ("status", user.is_admin), build
+    )
     
     return {
         "status": "operational",
         "docs_path": str(wiki.docs_path),
         "document_count": visible_doc_count,
         "pdf_available": wiki.is_pdf_available(),
-        "categories": len(visible_categories),
-        "tags": len(wiki.get_tags()),
+        "categories": category_count,
+        "tags": tag_count,
     }
@@ -28,10 +28,12 @@ ARCHIVE INFRASTRUCTURE:
   - ash-documents: Document backups
   - ash-exports: PDF exports and reports
 
-ENCRYPTION:
-- AES-256-GCM client-side encryption before storage
-- PBKDF2 key derivation with unique salt per archive
-- Double encryption: application layer + ZFS storage layer
+ENCRYPTION (per bucket):
+- ash-archives: AES-256-GCM client-side encryption before storage
+  (per-archive key via HKDF from a PBKDF2-derived KEK) + ZFS at rest
+- ash-documents, ash-exports: ZFS at rest + TLS in flight only - no
+  crisis-session PII is stored there, so no application-layer pass
+- Objects carry an "encrypted" metadata marker ("true"/"false")
 
 USAGE:
     from src.managers.archive import (
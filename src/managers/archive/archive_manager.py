@@ -30,9 +30,11 @@ RESPONSIBILITIES:
 ENCRYPTION FLOW:
     Session + Notes (JSON)
         ↓
-    AES-256-GCM Encryption (ArchiveEncryption)
+    zstd Compression (archive.compression_level)
         ↓
-    Encrypted Blob
+    AES-256-GCM / ChaCha20-Poly1305 Encryption (ArchiveEncryption)
+        ↓
+    Encrypted Blob (raw binary envelope - never base64/JSON wrapped)
         ↓
     MinIO Upload (MinIOManager)
         ↓
@@ -68,22 +70,30 @@ USAGE:
     data = await archive_manager.retrieve_archive(archive.id)
 """
 
-import hashlib
-import io
-import json
+import asyncio
 import logging
-from dataclasses import dataclass, asdict
-from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+import multiprocessing
+import os
+import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from dateutil import parser as date_parser
+import orjson
+import zstandard
 
 from src.utils.encryption import (
     ArchiveEncryption,
+    CHECKSUM_ALGORITHM,
+    CHECKSUM_SHA256,
     create_archive_encryption,
     DecryptionError,
     EncryptionError,
+    new_checksum,
 )
 
 # Module version
@@ -103,16 +113,55 @@ RETENTION_TIERS = {
     "permanent": 2555,    # ~7 years
 }
 
-# Archive package version for forward compatibility
+# Archive package version for forward compatibility. The payload stays JSON:
+# orjson encodes it at C speed and zstd removes the repeated keys a binary
+# format like msgpack would save, while every archive (old and new) remains
+# readable by any JSON tool once decrypted.
 ARCHIVE_PACKAGE_VERSION = "1.0"
 
+# orjson options for archive packages: session data may use non-string
+# keys (stdlib json stringified them too); anything orjson cannot encode
+# natively falls back to str() via default=
+ARCHIVE_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Default zstd level for archive plaintext (0 disables compression)
+DEFAULT_COMPRESSION_LEVEL = 3
+
+# Every zstd frame starts with this magic number. Archive JSON always starts
+# with "{", so decrypted plaintext is unambiguous: archives written before
+# compression was added decode unchanged.
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Expired archives removed per cleanup batch (MinIOManager deletes them as
+# concurrent 1000-key DeleteObjects requests) and batches per cleanup run
+CLEANUP_BATCH_SIZE = 4000
+CLEANUP_MAX_BATCHES = 5
+
+# Sessions sealed and uploaded at once by archive_sessions_bulk (matches
+# the MinIO pool size divided by multipart parts per upload)
+BULK_ARCHIVE_CONCURRENCY = 8
+
+# Bulk archiving seals packages in worker processes (compress + encrypt +
+# checksum is CPU-bound, and the GIL serializes the Python around it);
+# single archives stay on a worker thread, where a process hop isn't worth it
+BULK_SEAL_MAX_WORKERS = BULK_ARCHIVE_CONCURRENCY
+
+# Recently retrieved archives are kept (still encrypted) so re-opening one
+# skips the MinIO download; bounded by entries, total bytes and age
+BLOB_CACHE_MAX_ENTRIES = 32
+BLOB_CACHE_MAX_BYTES = 64 * 1024 * 1024
+BLOB_CACHE_TTL_SECONDS = 300.0
+
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
+# Slotted (no per-instance __dict__): these are created on every archive
+# operation and in list paths
+
 
-@dataclass
+@dataclass(slots=True)
 class ArchivePackage:
     """
     Structure of an archived session package.
@@ -125,18 +174,37 @@ class ArchivePackage:
     notes: List[Dict[str, Any]]
     metadata: Dict[str, Any]
     
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Shallow dict view of the package.
+        
+        Unlike dataclasses.asdict() this does not deep-copy session/notes,
+        so the returned dict shares them with the package - don't mutate.
+        """
+        return {
+            "version": self.version,
+            "archived_at": self.archived_at,
+            "session": self.session,
+            "notes": self.notes,
+            "metadata": self.metadata,
+        }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes (the plaintext that gets encrypted)."""
+        return orjson.dumps(self.to_dict(), default=str, option=ARCHIVE_JSON_OPTIONS)
+    
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(asdict(self), indent=2, default=str)
+        return self.to_json_bytes().decode("utf-8")
     
     @classmethod
-    def from_json(cls, json_str: str) -> "ArchivePackage":
-        """Deserialize from JSON string."""
-        data = json.loads(json_str)
+    def from_json(cls, json_data: Union[str, bytes]) -> "ArchivePackage":
+        """Deserialize from JSON (str or UTF-8 bytes, compact or indented)."""
+        data = orjson.loads(json_data)
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArchiveResult:
     """Result of an archive operation."""
     success: bool
@@ -144,10 +212,11 @@ class ArchiveResult:
     storage_key: Optional[str] = None
     size_bytes: int = 0
     checksum: Optional[str] = None
+    checksum_algorithm: str = CHECKSUM_ALGORITHM
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArchiveListFilter:
     """Filters for listing archives."""
     discord_user_id: Optional[int] = None
@@ -158,6 +227,54 @@ class ArchiveListFilter:
     archived_by: Optional[UUID] = None
 
 
+# =============================================================================
+# Package Sealing
+# =============================================================================
+
+
+def _seal_plaintext(
+    plaintext: bytes,
+    encryption: ArchiveEncryption,
+    compression_level: int,
+) -> Tuple[bytes, str]:
+    """Compress (level > 0) then encrypt and checksum serialized package JSON."""
+    if compression_level > 0:
+        plaintext = zstandard.ZstdCompressor(level=compression_level).compress(plaintext)
+    
+    # Encrypt and checksum the encrypted data in one pass
+    return encryption.encrypt_with_checksum(plaintext)
+
+
+# Per-process state for seal_package_in_worker (set by the pool initializer)
+_worker_encryption: Optional[ArchiveEncryption] = None
+_worker_compression_level = 0
+
+
+def _init_seal_worker(kek: bytes, cipher: str, compression_level: int) -> None:
+    """Process pool initializer: rebuild the encryption once per worker."""
+    global _worker_encryption, _worker_compression_level
+    _worker_encryption = ArchiveEncryption.from_worker_state(kek, cipher)
+    _worker_compression_level = compression_level
+
+
+def seal_package_in_worker(plaintext: bytes) -> Tuple[bytes, str]:
+    """
+    Seal serialized package JSON inside a process pool worker.
+    
+    Module-level so it can be pickled by ProcessPoolExecutor. The KEK is
+    handed over once by the pool initializer; each archive's key is
+    derived from it and a fresh salt here, so no per-archive key (and
+    never the master key) crosses the pickle stream.
+    
+    Args:
+        plaintext: ArchivePackage.to_json_bytes() output
+        
+    Returns:
+        Tuple of (encrypted blob, checksum of the blob)
+    """
+    return _seal_plaintext(plaintext, _worker_encryption, _worker_compression_level)
+
+
 # =============================================================================
 # Archive Manager Class
 # =============================================================================
@@ -218,6 +335,29 @@ class ArchiveManager:
             ),
         }
         
+        # Tier -> retention period, built once for the archiving hot path
+        self._retention_periods = {
+            tier: timedelta(days=days) for tier, days in self._retention_days.items()
+        }
+        
+        # Archive JSON compresses well (repeated keys, timestamps, IDs);
+        # compressing before encryption shrinks both GCM work and upload size
+        compression_level = config_manager.get(
+            "archive", "compression_level", DEFAULT_COMPRESSION_LEVEL
+        )
+        # zstd contexts are not thread-safe, so the worker threads that seal
+        # and open packages create their own (0 disables compression)
+        self._compression_level: int = compression_level
+        self._compression = "zstd" if compression_level > 0 else "none"
+        
+        # storage_key -> (cached_at, checksum, encrypted blob), LRU ordered.
+        # Only ciphertext is cached - plaintext never outlives a request.
+        self._blob_cache: "OrderedDict[str, Tuple[float, str, bytes]]" = OrderedDict()
+        self._blob_cache_bytes = 0
+        
+        # Process pool for bulk sealing (created on first bulk archive)
+        self._seal_executor: Optional[ProcessPoolExecutor] = None
+        
         self._logger.info("✅ ArchiveManager initialized")
     
     # =========================================================================
@@ -238,10 +378,10 @@ class ArchiveManager:
         
         Workflow:
         1. Build archive package (session + notes + metadata)
-        2. Serialize to JSON
-        3. Encrypt with AES-256-GCM
-        4. Calculate checksum
-        5. Upload to MinIO
+        2. Serialize to JSON and compress with zstd
+        3-4. Encrypt and checksum in one pass over 64 KiB slices, written
+           straight into the pre-sized upload buffer (no second pass)
+        5. Upload to MinIO (multipart above MULTIPART_PART_SIZE)
         6. Store metadata in PostgreSQL (using dedicated columns)
         
         Args:
@@ -255,20 +395,126 @@ class ArchiveManager:
         Returns:
             ArchiveResult with success status and details
         """
+        results = await self.archive_sessions_bulk(
+            [{
+                "session_id": session_id,
+                "session_data": session_data,
+                "notes": notes,
+                "retention_tier": retention_tier,
+            }],
+            archived_by_id=archived_by_id,
+            archived_by_name=archived_by_name,
+        )
+        return results[0]
+    
+    async def archive_sessions_bulk(
+        self,
+        sessions: List[Dict[str, Any]],
+        archived_by_id: UUID,
+        archived_by_name: str,
+    ) -> List[ArchiveResult]:
+        """
+        Archive several sessions, inserting all metadata in one transaction.
+        
+        Packages are sealed and uploaded concurrently (bounded by
+        BULK_ARCHIVE_CONCURRENCY), sealing in the process pool when there
+        is more than one; the metadata rows of every successful
+        upload are then written with a single batched INSERT. If that
+        transaction fails, the uploaded objects are removed again so no
+        orphans are left in MinIO.
+        
+        Args:
+            sessions: Dicts with session_id, session_data, notes and an
+                optional retention_tier (default "standard")
+            archived_by_id: UUID of CRT member archiving
+            archived_by_name: Display name of CRT member
+            
+        Returns:
+            One ArchiveResult per input session, in input order
+        """
+        semaphore = asyncio.Semaphore(BULK_ARCHIVE_CONCURRENCY)
+        seal_executor = self._get_seal_executor() if len(sessions) > 1 else None
+        
+        async def _prepare(item: Dict[str, Any]):
+            async with semaphore:
+                return await self._seal_and_upload(
+                    session_id=item["session_id"],
+                    session_data=item["session_data"],
+                    notes=item["notes"],
+                    archived_by_id=archived_by_id,
+                    archived_by_name=archived_by_name,
+                    retention_tier=item.get("retention_tier", "standard"),
+                    seal_executor=seal_executor,
+                )
+        
+        prepared = await asyncio.gather(*(_prepare(item) for item in sessions))
+        rows = [row for row, _ in prepared if row is not None]
+        if not rows:
+            return [result for _, result in prepared]
+        
+        # Store metadata in PostgreSQL with dedicated columns, one round-trip
+        try:
+            async with self._db.session() as db_session:
+                archives = await self._archive_repo.create_archives(db_session, rows)
+                await db_session.commit()
+        except Exception as e:
+            self._logger.exception(f"❌ Failed to store archive metadata: {e}")
+            await self._minio.delete_archives([row["storage_key"] for row in rows])
+            return [
+                result if row is None
+                else ArchiveResult(success=False, error=str(e))
+                for row, result in prepared
+            ]
+        
+        created = iter(archives)
+        results = []
+        for row, result in prepared:
+            if row is not None:
+                result.archive_id = next(created).id
+                self._logger.info(
+                    f"✅ Archived session {row['session_id']} → {row['storage_key']} "
+                    f"({row['size_bytes']:,} bytes, {row['retention_tier']} tier)"
+                )
+            results.append(result)
+        return results
+    
+    async def _seal_and_upload(
+        self,
+        session_id: str,
+        session_data: Dict[str, Any],
+        notes: List[Dict[str, Any]],
+        archived_by_id: UUID,
+        archived_by_name: str,
+        retention_tier: str,
+        seal_executor: Optional[ProcessPoolExecutor] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], ArchiveResult]:
+        """
+        Seal one session package and upload it to MinIO.
+        
+        The package is sealed in seal_executor's worker processes if given,
+        otherwise in a worker thread.
+        
+        Returns:
+            Tuple of (create_archive() fields, ArchiveResult); the fields
+            are None when the session failed and the result says why
+        """
         self._logger.info(f"📦 Archiving session {session_id} ({retention_tier} tier)")
         
         # Validate retention tier
         if retention_tier not in RETENTION_TIERS:
-            return ArchiveResult(
+            return None, ArchiveResult(
                 success=False,
                 error=f"Invalid retention tier: {retention_tier}. Must be 'standard' or 'permanent'"
             )
         
         try:
+            # One clock read for the package stamp, storage key and row
+            now = datetime.now(timezone.utc)
+            
             # 1. Build archive package
             archive_package = ArchivePackage(
                 version=ARCHIVE_PACKAGE_VERSION,
-                archived_at=datetime.now(timezone.utc).isoformat(),
+                archived_at=now.isoformat(),
                 session=session_data,
                 notes=notes,
                 metadata={
@@ -279,23 +525,28 @@ class ArchiveManager:
                 },
             )
             
-            # 2. Serialize to JSON
-            json_data = archive_package.to_json()
-            plaintext = json_data.encode("utf-8")
-            
-            self._logger.debug(f"Package size before encryption: {len(plaintext):,} bytes")
-            
-            # 3. Encrypt
-            encrypted = self._encryption.encrypt(plaintext)
+            # 2-4. Serialize, compress, encrypt and checksum off the event loop
+            if seal_executor is None:
+                encrypted, checksum = await asyncio.to_thread(
+                    self._seal_package, archive_package
+                )
+            else:
+                # Only the serialized bytes go to the worker
+                loop = asyncio.get_running_loop()
+                encrypted, checksum = await loop.run_in_executor(
+                    seal_executor,
+                    seal_package_in_worker,
+                    archive_package.to_json_bytes(),
+                )
             
             self._logger.debug(f"Encrypted size: {len(encrypted):,} bytes")
             
-            # 4. Calculate checksum of encrypted data
-            checksum = hashlib.sha256(encrypted).hexdigest()
-            
-            # 5. Generate storage key
-            timestamp = int(datetime.now(timezone.utc).timestamp())
-            storage_key = f"sessions/{session_id}/archive_{timestamp}.enc"
+            # 5. Generate storage key (random suffix: two archives of one
+            # session in the same second must not overwrite each other)
+            timestamp = int(now.timestamp())
+            storage_key = (
+                f"sessions/{session_id}/archive_{timestamp}_{secrets.token_hex(4)}.enc"
+            )
             
             # 6. Upload to MinIO
             upload_success = await self._minio.upload_archive(
@@ -305,60 +556,50 @@ class ArchiveManager:
                     "session_id": session_id,
                     "retention_tier": retention_tier,
                     "checksum": checksum,
+                    "checksum_algorithm": CHECKSUM_ALGORITHM,
                     "encrypted": "true",
+                    "compression": self._compression,
                     "archived_by": archived_by_name,
                 },
             )
             
             if not upload_success:
                 self._logger.error(f"Failed to upload archive to MinIO for session {session_id}")
-                return ArchiveResult(
+                return None, ArchiveResult(
                     success=False,
                     error="Failed to upload archive to storage"
                 )
             
-            # 7. Calculate retention date
-            retention_days = self._retention_days.get(retention_tier, 365)
-            
-            # 8. Parse session timestamps
-            session_started_at = self._parse_datetime(session_data.get("started_at"))
-            session_ended_at = self._parse_datetime(session_data.get("ended_at"))
-            
-            # 9. Store metadata in PostgreSQL with dedicated columns
-            async with self._db.session() as db_session:
-                archive = await self._archive_repo.create_archive(
-                    session=db_session,
-                    session_id=session_id,
-                    storage_key=storage_key,
-                    checksum=checksum,
-                    size_bytes=len(encrypted),
-                    archived_by=archived_by_id,
-                    archived_by_name=archived_by_name,
-                    storage_bucket="ash-archives",
-                    retention_days=retention_days,
-                    retention_tier=retention_tier,
-                    # Queryable metadata columns
-                    discord_user_id=session_data.get("user_id"),
-                    discord_user_name=session_data.get("user_name"),
-                    severity=session_data.get("severity"),
-                    notes_count=len(notes),
-                    session_started_at=session_started_at,
-                    session_ended_at=session_ended_at,
-                    # Legacy JSONB for any additional data
-                    extra_data={
-                        "package_version": ARCHIVE_PACKAGE_VERSION,
-                    },
-                )
-                await db_session.commit()
-            
-            self._logger.info(
-                f"✅ Archived session {session_id} → {storage_key} "
-                f"({len(encrypted):,} bytes, {retention_tier} tier)"
-            )
+            # 7. Metadata row (retention date and timestamps resolved here)
+            row = {
+                "session_id": session_id,
+                "storage_key": storage_key,
+                "checksum": checksum,
+                "size_bytes": len(encrypted),
+                "archived_at": now,
+                "archived_by": archived_by_id,
+                "archived_by_name": archived_by_name,
+                "storage_bucket": "ash-archives",
+                # Anchored to archived_at (tier validated above)
+                "retention_until": now + self._retention_periods[retention_tier],
+                "retention_tier": retention_tier,
+                # Queryable metadata columns
+                "discord_user_id": session_data.get("user_id"),
+                "discord_user_name": session_data.get("user_name"),
+                "severity": session_data.get("severity"),
+                "notes_count": len(notes),
+                "session_started_at": self._parse_datetime(session_data.get("started_at")),
+                "session_ended_at": self._parse_datetime(session_data.get("ended_at")),
+                # Legacy JSONB for any additional data
+                "extra_data": {
+                    "package_version": ARCHIVE_PACKAGE_VERSION,
+                    "compression": self._compression,
+                    "checksum_algorithm": CHECKSUM_ALGORITHM,
+                },
+            }
             
-            return ArchiveResult(
+            return row, ArchiveResult(
                 success=True,
-                archive_id=archive.id,
                 storage_key=storage_key,
                 size_bytes=len(encrypted),
                 checksum=checksum,
@@ -366,22 +607,107 @@ class ArchiveManager:
             
         except EncryptionError as e:
             self._logger.error(f"❌ Encryption failed for session {session_id}: {e}")
-            return ArchiveResult(success=False, error=f"Encryption failed: {e}")
+            return None, ArchiveResult(success=False, error=f"Encryption failed: {e}")
             
         except Exception as e:
             self._logger.exception(f"❌ Failed to archive session {session_id}: {e}")
-            return ArchiveResult(success=False, error=str(e))
+            return None, ArchiveResult(success=False, error=str(e))
+    
+    def _seal_package(self, package: ArchivePackage) -> Tuple[bytes, str]:
+        """
+        Serialize, compress, encrypt and checksum a package (CPU-bound).
+        
+        Runs in a worker thread for single archives, keeping the event loop
+        free; bulk archives use seal_package_in_worker in the process pool
+        instead, so their CPU work is not serialized by the GIL.
+        
+        Args:
+            package: Archive package to seal
+            
+        Returns:
+            Tuple of (encrypted blob, checksum of the blob)
+        """
+        # Serialize to JSON (compact bytes, no str round-trip)
+        plaintext = package.to_json_bytes()
+        self._logger.debug(f"Package size before compression: {len(plaintext):,} bytes")
+        
+        return _seal_plaintext(plaintext, self._encryption, self._compression_level)
+    
+    def _get_seal_executor(self) -> ProcessPoolExecutor:
+        """Get (or lazily create) the bulk sealing process pool."""
+        if self._seal_executor is None:
+            workers = min(BULK_SEAL_MAX_WORKERS, os.cpu_count() or 1)
+            
+            # spawn: don't fork the running event loop and its threads
+            self._seal_executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_seal_worker,
+                initargs=(*self._encryption.worker_state(), self._compression_level),
+            )
+            self._logger.info(f"🔐 Archive sealing process pool started ({workers} workers)")
+        
+        return self._seal_executor
+    
+    def close(self) -> None:
+        """Shut down the sealing process pool (call at application shutdown)."""
+        if self._seal_executor is not None:
+            self._seal_executor.shutdown(wait=False, cancel_futures=True)
+            self._seal_executor = None
+            self._logger.info("🔐 Archive sealing process pool stopped")
+    
+    def _open_package(self, encrypted: bytes) -> ArchivePackage:
+        """
+        Decrypt, decompress and deserialize a package (CPU-bound).
+        
+        Runs in a worker thread, like _seal_package.
+        
+        Args:
+            encrypted: Verified encrypted blob
+            
+        Returns:
+            Decoded ArchivePackage
+        """
+        return self._decode_package(self._encryption.decrypt(encrypted))
+    
+    def _finish_package(self, decryptor, encrypted: Optional[bytes] = None) -> ArchivePackage:
+        """
+        Finish a streamed decryption and deserialize the package (CPU-bound).
+        
+        Args:
+            decryptor: StreamDecryptor fed the whole, checksum-verified blob
+            encrypted: The blob itself, if it was kept (see StreamDecryptor.finalize)
+            
+        Returns:
+            Decoded ArchivePackage
+        """
+        return self._decode_package(decryptor.finalize(encrypted))
+    
+    @staticmethod
+    def _decode_package(plaintext: bytes) -> ArchivePackage:
+        """Decompress (zstd archives only) and deserialize decrypted plaintext."""
+        # Archives written before compression are plain JSON
+        if plaintext[:4] == ZSTD_FRAME_MAGIC:
+            plaintext = zstandard.ZstdDecompressor().decompress(plaintext)
+        
+        # orjson reads the UTF-8 bytes directly
+        return ArchivePackage.from_json(plaintext)
     
     def _parse_datetime(self, value: Any) -> Optional[datetime]:
-        """Parse a datetime from various formats."""
+        """
+        Parse a datetime from a datetime or an ISO-8601 string.
+        
+        Session payloads always carry isoformat() strings, so the stdlib
+        parser (which accepts a trailing "Z" on Python 3.11+) is enough.
+        """
         if value is None:
             return None
         if isinstance(value, datetime):
             return value
         if isinstance(value, str):
             try:
-                return date_parser.parse(value)
-            except (ValueError, TypeError):
+                return datetime.fromisoformat(value)
+            except ValueError:
                 return None
         return None
     
@@ -393,11 +719,13 @@ class ArchiveManager:
         Retrieve and decrypt an archived session.
         
         Workflow:
-        1. Get metadata from PostgreSQL
-        2. Download encrypted blob from MinIO
+        1. Get metadata from PostgreSQL (always - deletions apply at once)
+        2. Download encrypted blob from MinIO (skipped on a blob cache hit),
+           hashing and decrypting each chunk as it arrives
         3. Verify checksum
-        4. Decrypt
-        5. Deserialize to ArchivePackage
+        4. Verify the GCM tag (or decrypt, for cached / non-streamable blobs)
+        5. Decompress (zstd archives only)
+        6. Deserialize to ArchivePackage
         
         Args:
             archive_id: Archive UUID
@@ -418,30 +746,68 @@ class ArchiveManager:
                 
                 storage_key = archive.storage_key
                 storage_bucket = archive.storage_bucket
+                storage_size = archive.size_bytes
                 expected_checksum = archive.checksum
+                checksum_algorithm = (archive.extra_data or {}).get(
+                    "checksum_algorithm", CHECKSUM_SHA256
+                )
             
-            # 2. Download from MinIO
-            encrypted = await self._minio.download_archive(storage_key)
+            # 2-3. Reuse a recently verified blob, or download and verify
+            encrypted = self._get_cached_blob(storage_key, expected_checksum)
+            decryptor = None
             
-            if not encrypted:
-                self._logger.error(f"Failed to download archive from MinIO: {storage_key}")
-                return None
-            
-            # 3. Verify checksum
-            actual_checksum = hashlib.sha256(encrypted).hexdigest()
-            if actual_checksum != expected_checksum:
-                self._logger.error(
-                    f"Checksum mismatch for archive {archive_id}: "
-                    f"expected {expected_checksum}, got {actual_checksum}"
+            if encrypted is None:
+                # Hash and decrypt while the download streams in. The whole
+                # ciphertext is only assembled if it will be cached; otherwise
+                # the decryptor consumes each chunk as it arrives
+                keep = storage_size <= BLOB_CACHE_MAX_BYTES
+                digest = new_checksum(checksum_algorithm)
+                decryptor = self._encryption.stream_decryptor()
+                sinks = [decryptor] if digest is None else [digest, decryptor]
+                encrypted = await self._minio.download_archive(
+                    storage_key, sinks=sinks, keep=keep
                 )
-                return None
-            
-            # 4. Decrypt
-            plaintext = self._encryption.decrypt(encrypted)
+                
+                if encrypted is None:
+                    self._logger.error(f"Failed to download archive from MinIO: {storage_key}")
+                    return None
+                
+                if digest is None:
+                    # GCM still authenticates the blob during decrypt
+                    self._logger.warning(
+                        f"⚠️ {checksum_algorithm} unavailable, skipping checksum "
+                        f"for archive {archive_id}"
+                    )
+                else:
+                    actual_checksum = digest.hexdigest()
+                    if actual_checksum != expected_checksum:
+                        self._logger.error(
+                            f"Checksum mismatch for archive {archive_id}: "
+                            f"expected {expected_checksum}, got {actual_checksum}"
+                        )
+                        return None
+                
+                if keep:
+                    self._cache_blob(storage_key, expected_checksum, encrypted)
             
-            # 5. Deserialize
-            json_str = plaintext.decode("utf-8")
-            package = ArchivePackage.from_json(json_str)
+            # 4-6. Decrypt (or just verify the tag), decompress and
+            # deserialize off the event loop
+            if decryptor is not None:
+                try:
+                    package = await asyncio.to_thread(
+                        self._finish_package, decryptor, encrypted or None
+                    )
+                except DecryptionError:
+                    if encrypted:
+                        raise
+                    # The blob wasn't kept, and only the whole blob can be
+                    # tried as a legacy blob with a header-like salt (2^-40)
+                    encrypted = await self._minio.download_archive(storage_key)
+                    if not encrypted:
+                        raise
+                    package = await asyncio.to_thread(self._open_package, encrypted)
+            else:
+                package = await asyncio.to_thread(self._open_package, encrypted)
             
             self._logger.info(f"✅ Retrieved and decrypted archive {archive_id}")
             
@@ -451,7 +817,7 @@ class ArchiveManager:
             self._logger.error(f"❌ Decryption failed for archive {archive_id}: {e}")
             return None
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self._logger.error(f"❌ Invalid JSON in archive {archive_id}: {e}")
             return None
             
@@ -459,6 +825,64 @@ class ArchiveManager:
             self._logger.exception(f"❌ Failed to retrieve archive {archive_id}: {e}")
             return None
     
+    @property
+    def minio_manager(self):
+        """Shared MinIO manager (reuse it instead of opening a new pool)."""
+        return self._minio
+    
+    def _get_cached_blob(self, storage_key: str, checksum: str) -> Optional[bytes]:
+        """
+        Get a cached encrypted blob if it is fresh and matches the checksum.
+        
+        Args:
+            storage_key: MinIO object key
+            checksum: Checksum currently recorded in PostgreSQL
+            
+        Returns:
+            Encrypted blob, or None on a miss
+        """
+        entry = self._blob_cache.get(storage_key)
+        if entry is None:
+            return None
+        
+        cached_at, cached_checksum, blob = entry
+        if (
+            cached_checksum != checksum
+            or time.monotonic() - cached_at > BLOB_CACHE_TTL_SECONDS
+        ):
+            self.discard_cached_archive(storage_key)
+            return None
+        
+        self._blob_cache.move_to_end(storage_key)
+        return blob
+    
+    def _cache_blob(self, storage_key: str, checksum: str, blob: bytes) -> None:
+        """Cache a verified encrypted blob, evicting least recently used."""
+        if len(blob) > BLOB_CACHE_MAX_BYTES:
+            return
+        
+        self.discard_cached_archive(storage_key)
+        self._blob_cache[storage_key] = (time.monotonic(), checksum, blob)
+        self._blob_cache_bytes += len(blob)
+        
+        while (
+            len(self._blob_cache) > BLOB_CACHE_MAX_ENTRIES
+            or self._blob_cache_bytes > BLOB_CACHE_MAX_BYTES
+        ):
+            _, (_, _, evicted) = self._blob_cache.popitem(last=False)
+            self._blob_cache_bytes -= len(evicted)
+    
+    def discard_cached_archive(self, storage_key: str) -> None:
+        """
+        Drop an archive's cached blob (call when the archive is deleted).
+        
+        Args:
+            storage_key: MinIO object key
+        """
+        entry = self._blob_cache.pop(storage_key, None)
+        if entry is not None:
+            self._blob_cache_bytes -= len(entry[2])
+    
     async def get_archive_metadata(
         self,
         archive_id: UUID,
@@ -473,34 +897,8 @@ class ArchiveManager:
             Archive metadata dict or None
         """
         async with self._db.session() as db_session:
-            archive = await self._archive_repo.get(db_session, archive_id)
-            
-            if not archive:
-                return None
-            
-            return {
-                "id": str(archive.id),
-                "session_id": archive.session_id,
-                "storage_key": archive.storage_key,
-                "storage_bucket": archive.storage_bucket,
-                "size_bytes": archive.size_bytes,
-                "size_mb": archive.size_mb,
-                "checksum": archive.checksum,
-                "archived_at": archive.archived_at.isoformat(),
-                "archived_by": str(archive.archived_by) if archive.archived_by else None,
-                "archived_by_name": archive.archived_by_name,
-                "retention_until": archive.retention_until.isoformat() if archive.retention_until else None,
-                "retention_tier": archive.retention_tier,
-                "is_expired": archive.is_retention_expired,
-                "is_permanent": archive.is_permanent,
-                "days_until_expiry": archive.days_until_expiry,
-                "discord_user_id": archive.discord_user_id,
-                "discord_user_name": archive.discord_user_name,
-                "severity": archive.severity,
-                "notes_count": archive.notes_count,
-                "session_started_at": archive.session_started_at.isoformat() if archive.session_started_at else None,
-                "session_ended_at": archive.session_ended_at.isoformat() if archive.session_ended_at else None,
-            }
+            # Projected and serialized by PostgreSQL - no ORM object
+            return await self._archive_repo.get_metadata_dict(db_session, archive_id)
     
     # =========================================================================
     # Listing and Filtering
@@ -511,11 +909,12 @@ class ArchiveManager:
         filters: Optional[ArchiveListFilter] = None,
         skip: int = 0,
         limit: int = 50,
-    ) -> Tuple[List[Dict[str, Any]], int]:
+    ) -> Tuple[bytes, int]:
         """
         List archives with optional filtering.
         
-        Uses dedicated columns for efficient filtering.
+        Uses dedicated columns for efficient filtering. The page is
+        serialized to JSON by PostgreSQL, so no per-row objects are built.
         
         Args:
             filters: Optional filter criteria
@@ -523,7 +922,7 @@ class ArchiveManager:
             limit: Maximum records to return
             
         Returns:
-            Tuple of (list of archive metadata dicts, total count)
+            Tuple of (JSON array of archive list items as bytes, total count)
         """
         async with self._db.session() as db_session:
             # Extract filter values
@@ -534,8 +933,8 @@ class ArchiveManager:
             start_date = filters.start_date if filters else None
             end_date = filters.end_date if filters else None
             
-            # Get archives using column-based filtering
-            archives = await self._archive_repo.get_archives_filtered(
+            # PostgreSQL builds the page JSON; total comes from the same query
+            items_json, total = await self._archive_repo.get_archives_page_json(
                 session=db_session,
                 discord_user_id=discord_user_id,
                 severity=severity,
@@ -547,42 +946,7 @@ class ArchiveManager:
                 limit=limit,
             )
             
-            # Get total count
-            total = await self._archive_repo.count_filtered(
-                session=db_session,
-                discord_user_id=discord_user_id,
-                severity=severity,
-                retention_tier=retention_tier,
-                archived_by=archived_by,
-                start_date=start_date,
-                end_date=end_date,
-            )
-            
-            # Convert to response dicts
-            results = [
-                {
-                    "id": str(archive.id),
-                    "session_id": archive.session_id,
-                    "discord_user_id": archive.discord_user_id,
-                    "discord_user_name": archive.discord_user_name,
-                    "severity": archive.severity,
-                    "session_started_at": archive.session_started_at.isoformat() if archive.session_started_at else None,
-                    "session_ended_at": archive.session_ended_at.isoformat() if archive.session_ended_at else None,
-                    "archived_at": archive.archived_at.isoformat(),
-                    "archived_by_name": archive.archived_by_name,
-                    "size_bytes": archive.size_bytes,
-                    "size_mb": archive.size_mb,
-                    "notes_count": archive.notes_count,
-                    "retention_tier": archive.retention_tier,
-                    "retention_until": archive.retention_until.isoformat() if archive.retention_until else None,
-                    "is_expired": archive.is_retention_expired,
-                    "is_permanent": archive.is_permanent,
-                    "days_until_expiry": archive.days_until_expiry,
-                }
-                for archive in archives
-            ]
-            
-            return results, total
+            return items_json.encode("utf-8"), total
     
     async def get_archives_for_session(
         self,
@@ -598,24 +962,8 @@ class ArchiveManager:
             Archive metadata dict or None
         """
         async with self._db.session() as db_session:
-            archive = await self._archive_repo.get_by_session(db_session, session_id)
-            
-            if not archive:
-                return None
-            
-            return {
-                "id": str(archive.id),
-                "session_id": archive.session_id,
-                "discord_user_id": archive.discord_user_id,
-                "discord_user_name": archive.discord_user_name,
-                "severity": archive.severity,
-                "archived_at": archive.archived_at.isoformat(),
-                "archived_by_name": archive.archived_by_name,
-                "size_bytes": archive.size_bytes,
-                "notes_count": archive.notes_count,
-                "retention_tier": archive.retention_tier,
-                "retention_until": archive.retention_until.isoformat() if archive.retention_until else None,
-            }
+            # Projected and serialized by PostgreSQL - no ORM object
+            return await self._archive_repo.get_session_archive_dict(db_session, session_id)
     
     async def session_has_archive(
         self,
@@ -700,34 +1048,19 @@ class ArchiveManager:
         
         try:
             async with self._db.session() as db_session:
-                archive = await self._archive_repo.get(db_session, archive_id)
-                
-                if not archive:
-                    self._logger.warning(f"Archive not found: {archive_id}")
-                    return False
-                
-                old_tier = archive.retention_tier
-                new_days = self._retention_days.get(new_tier, 365)
-                
-                # Update using dedicated method
-                await self._archive_repo.set_retention_tier(
+                # Tier, retention date and audit trail in one UPDATE
+                old_tier = await self._archive_repo.set_retention_tier_with_audit(
                     db_session,
                     archive_id,
                     tier=new_tier,
-                    retention_days=new_days,
+                    retention_days=self._retention_days[new_tier],
+                    updated_by_name=updated_by_name,
                 )
                 
-                # Log the change in extra_data
-                extra = archive.extra_data or {}
-                extra["retention_updated_at"] = datetime.now(timezone.utc).isoformat()
-                extra["retention_updated_by"] = updated_by_name
-                extra["previous_tier"] = old_tier
+                if old_tier is None:
+                    self._logger.warning(f"Archive not found: {archive_id}")
+                    return False
                 
-                await self._archive_repo.update(
-                    db_session,
-                    archive_id,
-                    {"extra_data": extra},
-                )
                 await db_session.commit()
             
             self._logger.info(
@@ -813,30 +1146,37 @@ class ArchiveManager:
         deleted_count = 0
         
         try:
-            async with self._db.session() as db_session:
-                # Get expired standard-tier archives only
-                expired = await self._archive_repo.get_expired_standard_tier(
-                    db_session,
-                    limit=100,
-                )
+            for _ in range(CLEANUP_MAX_BATCHES):
+                async with self._db.session() as db_session:
+                    # Get expired standard-tier archives only
+                    expired = await self._archive_repo.get_expired_standard_tier(
+                        db_session,
+                        limit=CLEANUP_BATCH_SIZE,
+                    )
+                    if not expired:
+                        break
+                    
+                    # Delete from MinIO in bulk; keep rows whose object survived
+                    failed = set(await self._minio.delete_archives(
+                        [archive.storage_key for archive in expired]
+                    ))
+                    removed_ids = []
+                    for archive in expired:
+                        if archive.storage_key in failed:
+                            continue
+                        self.discard_cached_archive(archive.storage_key)
+                        removed_ids.append(archive.id)
+                    
+                    # Delete from database in one statement
+                    await self._archive_repo.delete_by_ids(db_session, removed_ids)
+                    await db_session.commit()
                 
-                for archive in expired:
-                    try:
-                        # Delete from MinIO
-                        await self._minio.delete_archive(archive.storage_key)
-                        
-                        # Delete from database
-                        await self._archive_repo.delete(db_session, archive.id)
-                        
-                        deleted_count += 1
-                        self._logger.info(f"🗑️ Deleted expired archive: {archive.id}")
-                        
-                    except Exception as e:
-                        self._logger.error(
-                            f"Failed to delete archive {archive.id}: {e}"
-                        )
+                deleted_count += len(removed_ids)
+                self._logger.info(f"🗑️ Deleted {len(removed_ids)} expired archives")
                 
-                await db_session.commit()
+                # A short batch means we are done; failures would be re-selected
+                if failed or len(expired) < CLEANUP_BATCH_SIZE:
+                    break
             
             if deleted_count > 0:
                 self._logger.info(f"🗑️ Cleanup complete: deleted {deleted_count} expired archives")
@@ -931,7 +1271,10 @@ async def create_archive_manager(
     logger.info("🏭 Creating ArchiveManager")
     
     # Create encryption handler
-    encryption = create_archive_encryption(secrets_manager)
+    encryption = create_archive_encryption(
+        secrets_manager,
+        cipher=config_manager.get("archive", "cipher", "auto"),
+    )
     
     # Create manager
     manager = ArchiveManager(
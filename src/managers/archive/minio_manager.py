@@ -32,6 +32,11 @@ MINIO BUCKETS:
 - ash-documents: Document backups
 - ash-exports: PDF exports and reports
 
+ENCRYPTION POLICY:
+- Only ash-archives holds app-layer ciphertext (ArchiveManager encrypts
+  before upload_archive). Documents and exports are stored as given and
+  rely on ZFS native encryption at rest; they are tagged encrypted=false
+
 USAGE:
     minio_manager = await create_minio_manager(
         config_manager=config_manager,
@@ -42,25 +47,118 @@ USAGE:
     # Upload archive
     await minio_manager.upload_archive(session_id, encrypted_data)
     
-    # List archives
-    archives = await minio_manager.list_archives(prefix="2026-01")
+    # List archives of one session
+    archives = await minio_manager.list_archives(prefix="sessions/session_123")
     
     # Download archive
     data = await minio_manager.download_archive(session_id)
 """
 
 import asyncio
+import functools
 import io
+import itertools
+import os
+import socket
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, BinaryIO
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
 
+import certifi
+import urllib3
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
+from urllib3.connection import HTTPConnection
 from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
 
 __version__ = "v5.0-9-9.2-2"
 
+# Archives larger than one part are sent as an S3 multipart upload. 16 MiB
+# parts stay well clear of the many-small-parts overhead (S3 minimum is
+# 5 MiB) while letting large archives upload parts concurrently.
+MULTIPART_PART_SIZE = 16 * 1024 * 1024
+MULTIPART_PARALLEL_UPLOADS = 4
+
+# Read size when streaming downloads (lets a checksum run chunk by chunk
+# while the data is still in cache)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Chunk size for stream_archive/stream_export; each chunk costs one worker
+# thread hop, so these are larger than DOWNLOAD_CHUNK_SIZE
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# S3 DeleteObjects accepts at most 1000 keys; bulk deletes send that many
+# per request with up to BULK_DELETE_CONCURRENCY requests in flight
+BULK_DELETE_MAX_KEYS = 1000
+BULK_DELETE_CONCURRENCY = 4
+
+# Blocking minio-py calls run on a dedicated thread pool, so slow object
+# I/O cannot starve the default executor other code relies on (and vice
+# versa). Overridden by minio.io_workers.
+IO_WORKERS = 32
+
+# One keep-alive connection pool shared by every MinIO call in the process;
+# sized to at least one connection per I/O worker. Overridden by
+# minio.pool_size.
+HTTP_POOL_MAXSIZE = 32
+HTTP_CONNECT_TIMEOUT_SECONDS = 10
+HTTP_READ_TIMEOUT_SECONDS = 300
+HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+
+# health_check reports the bucket list from a cache this old at most
+INVENTORY_TTL_SECONDS = 300.0
+
+# archive_exists answers repeated checks from memory for this long; the
+# cache is kept current by this manager's own uploads and deletes
+STAT_CACHE_TTL_SECONDS = 30.0
+STAT_CACHE_MAX_ENTRIES = 1024
+
+# archives_exist switches from one HEAD per key to a single LIST of the
+# keys' common directory above this many keys
+BULK_EXISTS_LIST_THRESHOLD = 20
+
+# ...and gives up on that listing (falling back to HEADs) once it has
+# seen this many times as many keys as were asked about
+BULK_EXISTS_LIST_MAX_FACTOR = 4
+
+# Marker for objects stored without app-layer encryption (see header)
+UNENCRYPTED_METADATA = {"encrypted": "false"}
+
+
+class _AsyncChunkReader:
+    """
+    Blocking read() over an async iterable of chunks.
+
+    put_object reads its parts in a worker thread; each read() there pulls
+    chunks from the event loop until it has the bytes asked for, so only
+    the part being assembled is buffered.
+    """
+
+    def __init__(self, source: AsyncIterable[bytes], loop: asyncio.AbstractEventLoop):
+        self._source = source.__aiter__()
+        self._loop = loop
+        self._buffer = bytearray()
+        self._exhausted = False
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._exhausted and (size < 0 or len(self._buffer) < size):
+            try:
+                chunk = asyncio.run_coroutine_threadsafe(
+                    self._source.__anext__(), self._loop
+                ).result()
+            except StopAsyncIteration:
+                self._exhausted = True
+            else:
+                self._buffer += chunk
+
+        if size < 0 or size > len(self._buffer):
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
 
 class MinIOManager:
     """
@@ -71,6 +169,7 @@ class MinIOManager:
 
     Attributes:
         _client: MinIO client instance
+        _http: Pooled urllib3 client behind _client
         _config: MinIO configuration
         _logger: Logging manager
         _connected: Connection status flag
@@ -103,6 +202,13 @@ class MinIOManager:
         self._logging_manager = logging_manager
         self._logger = logging_manager.get_logger("minio")
         self._client: Optional[Minio] = None
+        self._http: Optional[urllib3.PoolManager] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._io_workers = int(config.get("io_workers", IO_WORKERS))
+        self._pool_size = int(config.get("pool_size", HTTP_POOL_MAXSIZE))
+        self._stat_cache: Dict[str, Tuple[float, bool]] = {}
+        self._inventory: Optional[List[str]] = None
+        self._inventory_at = 0.0
         self._connected = False
 
         # Get bucket names from config
@@ -134,16 +240,23 @@ class MinIOManager:
             raise ConnectionError("MinIO credentials not configured")
 
         try:
-            # Create MinIO client
+            # Create MinIO client on a long-lived connection pool, with its
+            # own worker threads for the blocking calls
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._io_workers,
+                thread_name_prefix="minio-io",
+            )
+            self._http = self._create_http_pool(max(self._pool_size, self._io_workers))
             self._client = Minio(
                 endpoint=f"{endpoint}:{port}",
                 access_key=self._access_key,
                 secret_key=self._secret_key,
                 secure=secure,
+                http_client=self._http,
             )
 
             # Test connection by listing buckets
-            await asyncio.to_thread(self._client.list_buckets)
+            await self._run(self._client.list_buckets)
             self._connected = True
             self._logger.info("✅ MinIO connection established")
 
@@ -155,28 +268,78 @@ class MinIOManager:
             self._logger.error(f"❌ MinIO connection failed: {e}")
             raise ConnectionError(f"MinIO connection failed: {e}")
 
+    @staticmethod
+    def _create_http_pool(maxsize: int = HTTP_POOL_MAXSIZE) -> urllib3.PoolManager:
+        """
+        Create the keep-alive HTTP pool used by the MinIO client.
+
+        Sockets keep urllib3's TCP_NODELAY and add SO_KEEPALIVE so idle
+        pooled connections to MinIO are not silently dropped.
+
+        Args:
+            maxsize: Connections kept per host
+
+        Returns:
+            Configured urllib3 PoolManager
+        """
+        return urllib3.PoolManager(
+            num_pools=2,
+            maxsize=maxsize,
+            block=False,
+            timeout=urllib3.Timeout(
+                connect=HTTP_CONNECT_TIMEOUT_SECONDS,
+                read=HTTP_READ_TIMEOUT_SECONDS,
+            ),
+            retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=HTTP_RETRY_STATUSES,
+            ),
+            socket_options=HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ],
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=certifi.where(),
+        )
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking minio-py call on the MinIO I/O thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
     async def _ensure_buckets(self) -> None:
-        """Ensure required buckets exist."""
+        """Ensure required buckets exist (all three checked concurrently)."""
         buckets = [
             self._bucket_archives,
             self._bucket_documents,
             self._bucket_exports,
         ]
 
-        for bucket in buckets:
-            try:
-                exists = await asyncio.to_thread(
-                    self._client.bucket_exists, bucket
-                )
-                if exists:
-                    self._logger.debug(f"✓ Bucket exists: {bucket}")
-                else:
-                    self._logger.warning(f"⚠️ Bucket missing: {bucket}")
-            except S3Error as e:
-                self._logger.warning(f"⚠️ Could not check bucket {bucket}: {e}")
+        results = await asyncio.gather(
+            *(self._run(self._client.bucket_exists, b) for b in buckets),
+            return_exceptions=True,
+        )
+
+        for bucket, exists in zip(buckets, results):
+            if isinstance(exists, S3Error):
+                self._logger.warning(f"⚠️ Could not check bucket {bucket}: {exists}")
+            elif isinstance(exists, BaseException):
+                raise exists
+            elif exists:
+                self._logger.debug(f"✓ Bucket exists: {bucket}")
+            else:
+                self._logger.warning(f"⚠️ Bucket missing: {bucket}")
 
     async def close(self) -> None:
         """Close MinIO connection."""
+        if self._http:
+            self._http.clear()
+            self._http = None
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         self._client = None
         self._connected = False
         self._logger.info("🔌 MinIO connection closed")
@@ -199,6 +362,10 @@ class MinIOManager:
         """
         Perform MinIO health check.
 
+        The probe itself is a HEAD on the archives bucket; the bucket list
+        in the result comes from inventory(), refreshed at most every
+        INVENTORY_TTL_SECONDS, so frequent probes stay one round-trip.
+
         Returns:
             Health status dictionary with latency and bucket info
         """
@@ -209,17 +376,18 @@ class MinIOManager:
             }
 
         try:
+            # Liveness is one HEAD on the archives bucket
             start = time.perf_counter()
-            buckets = await asyncio.to_thread(self._client.list_buckets)
+            await self._run(self._client.bucket_exists, self._bucket_archives)
             latency_ms = (time.perf_counter() - start) * 1000
 
-            bucket_names = [b.name for b in buckets]
+            bucket_names = await self.inventory()
 
             return {
                 "healthy": True,
                 "latency_ms": round(latency_ms, 2),
                 "buckets": bucket_names,
-                "bucket_count": len(buckets),
+                "bucket_count": len(bucket_names),
                 "endpoint": f"{self._config.get('endpoint')}:{self._config.get('port')}",
             }
 
@@ -230,6 +398,29 @@ class MinIOManager:
                 "error": str(e),
             }
 
+    async def inventory(self) -> List[str]:
+        """
+        Names of all buckets, cached for INVENTORY_TTL_SECONDS.
+
+        Returns:
+            Bucket names (the last known list if a refresh fails)
+        """
+        if (
+            self._inventory is not None
+            and time.monotonic() - self._inventory_at < INVENTORY_TTL_SECONDS
+        ):
+            return self._inventory
+
+        try:
+            buckets = await self._run(self._client.list_buckets)
+        except (S3Error, MaxRetryError) as e:
+            self._logger.warning(f"⚠️ Could not list buckets: {e}")
+            return self._inventory or []
+
+        self._inventory = [b.name for b in buckets]
+        self._inventory_at = time.monotonic()
+        return self._inventory
+
     # =========================================================================
     # Archive Operations (ash-archives bucket)
     # =========================================================================
@@ -237,16 +428,68 @@ class MinIOManager:
     async def upload_archive(
         self,
         object_name: str,
-        data: bytes,
+        data: Union[bytes, BinaryIO, AsyncIterable[bytes]],
         metadata: Optional[Dict[str, str]] = None,
+        length: Optional[int] = None,
     ) -> bool:
         """
         Upload encrypted archive data.
 
+        Archives above MULTIPART_PART_SIZE are uploaded as a multipart
+        upload with up to MULTIPART_PARALLEL_UPLOADS parts in flight;
+        smaller archives go up in a single PUT. A file object or async
+        iterable is read one part at a time, so memory stays bounded by
+        part size x parallel uploads however large the archive is.
+
         Args:
             object_name: Object key (e.g., "2026/01/session_123.enc")
-            data: Encrypted data bytes
+            data: Encrypted data as bytes, a binary file object or an
+                async iterable of chunks, stored as-is (raw binary - do
+                not base64-encode; S3 objects are binary-safe)
             metadata: Optional metadata dictionary
+            length: Size of a file object, if known (see _upload_source)
+
+        Returns:
+            True if upload successful
+        """
+        uploaded = await self._put(
+            self._bucket_archives,
+            object_name,
+            data,
+            content_type="application/octet-stream",
+            metadata=metadata or {},
+            length=length,
+            kind="archive",
+        )
+        if uploaded:
+            self._remember_exists(object_name, True)
+        return uploaded
+
+    async def _put(
+        self,
+        bucket: str,
+        object_name: str,
+        data: Union[bytes, BinaryIO, AsyncIterable[bytes]],
+        *,
+        content_type: str,
+        metadata: Dict[str, str],
+        length: Optional[int],
+        kind: str,
+    ) -> bool:
+        """
+        Upload an object - the single put path behind every upload_* method.
+
+        Multipart settings, source handling (_upload_source), timing and
+        error logging live here once for all buckets.
+
+        Args:
+            bucket: Target bucket
+            object_name: Object key
+            data: Bytes, binary file object or async iterable of chunks
+            content_type: MIME type
+            metadata: Object user metadata
+            length: Size of a file object, if known
+            kind: Object kind for log messages ("archive", "document", ...)
 
         Returns:
             True if upload successful
@@ -256,72 +499,219 @@ class MinIOManager:
             return False
 
         try:
-            data_stream = io.BytesIO(data)
-            
-            await asyncio.to_thread(
+            data_stream, length = self._upload_source(data, length)
+            start = time.perf_counter()
+
+            await self._run(
                 self._client.put_object,
-                self._bucket_archives,
+                bucket,
                 object_name,
                 data_stream,
-                length=len(data),
-                content_type="application/octet-stream",
-                metadata=metadata or {},
+                length=length,
+                content_type=content_type,
+                metadata=metadata,
+                part_size=MULTIPART_PART_SIZE,
+                num_parallel_uploads=MULTIPART_PARALLEL_UPLOADS,
             )
 
-            self._logger.debug(f"✓ Uploaded archive: {object_name}")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._logger.debug(f"✓ Uploaded {kind}: {object_name} ({elapsed_ms:.0f} ms)")
             return True
 
         except S3Error as e:
-            self._logger.error(f"❌ Upload failed for {object_name}: {e}")
+            self._logger.error(f"❌ {kind.capitalize()} upload failed for {object_name}: {e}")
             return False
 
+    @staticmethod
+    def _upload_source(
+        data: Union[bytes, BinaryIO, AsyncIterable[bytes]],
+        length: Optional[int],
+    ) -> Tuple[BinaryIO, int]:
+        """
+        Stream and length to hand to put_object.
+
+        Bytes are wrapped in BytesIO (a bytes object is shared, not copied).
+        A file object is read directly in MULTIPART_PART_SIZE parts, so an
+        upload of unknown length (-1) never needs the whole payload in
+        memory. An async iterable is bridged to a blocking reader (see
+        _AsyncChunkReader). Must be called on the event loop.
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return io.BytesIO(data), len(data)
+        if hasattr(data, "__aiter__"):
+            data = _AsyncChunkReader(data, asyncio.get_running_loop())
+        return data, length if length is not None else -1
+
     async def download_archive(
         self,
         object_name: str,
+        sinks: Sequence[Any] = (),
+        keep: bool = True,
     ) -> Optional[bytes]:
         """
         Download encrypted archive data.
 
+        The body is streamed in DOWNLOAD_CHUNK_SIZE pieces in a worker
+        thread and each piece is passed to every sink as it arrives, so
+        hashing and decryption overlap the network wait instead of making
+        further passes over the finished blob.
+
         Args:
             object_name: Object key to download
+            sinks: Objects with update(chunk) - hash objects, a
+                StreamDecryptor - fed in order with each piece
+            keep: Join and return the body; pass False when the sinks
+                consume everything, so the whole blob is never held
 
         Returns:
-            Encrypted data bytes or None if not found
+            Encrypted data bytes (b"" if keep is False) or None if not found
+        """
+        return await self._get(self._bucket_archives, object_name, "archive", sinks, keep)
+
+    async def _get(
+        self,
+        bucket: str,
+        object_name: str,
+        kind: str,
+        sinks: Sequence[Any] = (),
+        keep: bool = True,
+    ) -> Optional[bytes]:
+        """
+        Download a whole object - the single get path behind download_*.
+
+        The GET and the body read both run in a worker thread (see
+        _read_object); timing and error logging live here once.
+
+        Args:
+            bucket: Source bucket
+            object_name: Object key
+            kind: Object kind for log messages ("archive", "document", ...)
+            sinks: Objects with update(chunk) fed each piece as it arrives
+            keep: Join and return the body (b"" is returned otherwise)
+
+        Returns:
+            Object bytes or None if not found
         """
         if not self._client:
             return None
 
         try:
-            response = await asyncio.to_thread(
-                self._client.get_object,
-                self._bucket_archives,
-                object_name,
-            )
-            data = response.read()
-            response.close()
-            response.release_conn()
+            start = time.perf_counter()
+            data = await self._run(self._read_object, bucket, object_name, sinks, keep)
 
-            self._logger.debug(f"✓ Downloaded archive: {object_name}")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._logger.debug(f"✓ Downloaded {kind}: {object_name} ({elapsed_ms:.0f} ms)")
             return data
 
         except S3Error as e:
             if e.code == "NoSuchKey":
-                self._logger.debug(f"Archive not found: {object_name}")
+                self._logger.debug(f"{kind.capitalize()} not found: {object_name}")
             else:
+                self._logger.error(f"❌ {kind.capitalize()} download failed for {object_name}: {e}")
+            return None
+
+    async def stream_archive(
+        self,
+        object_name: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Optional[AsyncIterator[bytes]]:
+        """
+        Open an archive for chunked reading.
+
+        Unlike download_archive, the object is never held in memory as a
+        whole - memory stays at about one chunk however large it is.
+
+        Args:
+            object_name: Object key to download
+            chunk_size: Bytes per chunk
+
+        Returns:
+            Async iterator of chunks, or None if not found
+        """
+        return await self._open_stream(self._bucket_archives, object_name, chunk_size)
+
+    def _read_object(
+        self,
+        bucket: str,
+        object_name: str,
+        sinks: Sequence[Any] = (),
+        keep: bool = True,
+    ) -> bytes:
+        """
+        Read a whole object (blocking - run in a worker thread).
+
+        The body is streamed in DOWNLOAD_CHUNK_SIZE pieces, each passed to
+        every sink before the pieces are joined once at the end. With
+        keep=False nothing is retained and b"" is returned.
+        """
+        response = self._client.get_object(bucket, object_name)
+        try:
+            chunks = []
+            for chunk in response.stream(DOWNLOAD_CHUNK_SIZE):
+                for sink in sinks:
+                    sink.update(chunk)
+                if keep:
+                    chunks.append(chunk)
+            return b"".join(chunks)
+        finally:
+            response.close()
+            response.release_conn()
+
+    async def _open_stream(
+        self,
+        bucket: str,
+        object_name: str,
+        chunk_size: int,
+    ) -> Optional[AsyncIterator[bytes]]:
+        """
+        Open an object and return an async iterator over its chunks.
+
+        The GET is sent here, so a missing object is reported as None
+        before the caller starts streaming; each chunk is then read in a
+        worker thread. The connection is released when the iterator is
+        exhausted or closed.
+        """
+        if not self._client:
+            return None
+
+        try:
+            response = await self._run(self._client.get_object, bucket, object_name)
+        except S3Error as e:
+            if e.code != "NoSuchKey":
                 self._logger.error(f"❌ Download failed for {object_name}: {e}")
             return None
 
+        async def _chunks() -> AsyncIterator[bytes]:
+            pieces = response.stream(chunk_size)
+            try:
+                while True:
+                    chunk = await self._run(next, pieces, None)
+                    if chunk is None:
+                        return
+                    yield chunk
+            finally:
+                response.close()
+                response.release_conn()
+
+        return _chunks()
+
     async def list_archives(
         self,
         prefix: Optional[str] = None,
         limit: int = 100,
+        exact_prefix: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         List archives with optional prefix filter.
 
+        The prefix is treated as a "directory" and gets a trailing "/"
+        (see _normalize_prefix); pass exact_prefix=True to match a partial
+        key name instead.
+
         Args:
-            prefix: Object key prefix (e.g., "2026/01/")
+            prefix: Object key prefix (e.g., "sessions/session_123")
             limit: Maximum number of results
+            exact_prefix: Use prefix as given, without the trailing "/"
 
         Returns:
             List of archive metadata dictionaries
@@ -330,24 +720,12 @@ class MinIOManager:
             return []
 
         try:
-            objects = await asyncio.to_thread(
-                self._client.list_objects,
-                self._bucket_archives,
-                prefix=prefix,
-                recursive=True,
+            if not exact_prefix:
+                prefix = self._normalize_prefix(prefix)
+            archives = await self._run(
+                self._list_objects, self._bucket_archives, prefix, limit
             )
 
-            archives = []
-            for obj in objects:
-                if len(archives) >= limit:
-                    break
-                archives.append({
-                    "name": obj.object_name,
-                    "size": obj.size,
-                    "last_modified": obj.last_modified,
-                    "etag": obj.etag,
-                })
-
             self._logger.debug(f"Listed {len(archives)} archives (prefix={prefix})")
             return archives
 
@@ -355,6 +733,48 @@ class MinIOManager:
             self._logger.error(f"❌ List failed: {e}")
             return []
 
+    @staticmethod
+    def _normalize_prefix(prefix: Optional[str]) -> Optional[str]:
+        """
+        End a listing prefix with "/" so it names a key "directory".
+
+        A prefix ending mid-name ("sessions/session_1") makes the server
+        match against every key sharing those characters; ending on the
+        delimiter lets MinIO go straight to one directory, which can be
+        orders of magnitude faster on large buckets.
+        """
+        if not prefix or prefix.endswith("/"):
+            return prefix
+        return prefix + "/"
+
+    def _list_objects(
+        self,
+        bucket: str,
+        prefix: Optional[str],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        List up to limit objects (blocking - run in a worker thread).
+
+        list_objects (ListObjectsV2) is lazy and fetches 1000-key pages as
+        it is iterated; islice stops it after the page holding the limit'th
+        key, so no further LIST requests are sent.
+
+        Entries are built only from fields the listing already carries.
+        Never stat_object per entry here - that is a HEAD request per key;
+        callers wanting user metadata ask for it with stat_archive().
+        """
+        objects = self._client.list_objects(bucket, prefix=prefix, recursive=True)
+        return [
+            {
+                "name": obj.object_name,
+                "size": obj.size,
+                "last_modified": obj.last_modified,
+                "etag": obj.etag,
+            }
+            for obj in itertools.islice(objects, limit)
+        ]
+
     async def delete_archive(
         self,
         object_name: str,
@@ -372,12 +792,13 @@ class MinIOManager:
             return False
 
         try:
-            await asyncio.to_thread(
+            await self._run(
                 self._client.remove_object,
                 self._bucket_archives,
                 object_name,
             )
 
+            self._remember_exists(object_name, False)
             self._logger.debug(f"✓ Deleted archive: {object_name}")
             return True
 
@@ -385,6 +806,66 @@ class MinIOManager:
             self._logger.error(f"❌ Delete failed for {object_name}: {e}")
             return False
 
+    async def delete_archives(
+        self,
+        object_names: List[str],
+    ) -> List[str]:
+        """
+        Delete several archives with S3 multi-object delete.
+
+        Keys are split into DeleteObjects requests of BULK_DELETE_MAX_KEYS
+        that run concurrently (bounded by BULK_DELETE_CONCURRENCY), so a
+        cleanup batch costs a few overlapping round-trips instead of one
+        per archive.
+
+        Args:
+            object_names: Object keys to delete
+
+        Returns:
+            Object keys that could NOT be deleted
+        """
+        if not object_names:
+            return []
+        if not self._client:
+            return list(object_names)
+
+        semaphore = asyncio.Semaphore(BULK_DELETE_CONCURRENCY)
+
+        def _remove(names: List[str]) -> List[str]:
+            errors = self._client.remove_objects(
+                self._bucket_archives,
+                (DeleteObject(name) for name in names),
+            )
+            # remove_objects is lazy - iterating sends the request
+            return [error.name for error in errors]
+
+        async def _remove_chunk(names: List[str]) -> List[str]:
+            async with semaphore:
+                try:
+                    return await self._run(_remove, names)
+                except (S3Error, MaxRetryError) as e:
+                    self._logger.error(f"❌ Bulk delete failed: {e}")
+                    return names
+
+        chunks = await asyncio.gather(*(
+            _remove_chunk(object_names[i:i + BULK_DELETE_MAX_KEYS])
+            for i in range(0, len(object_names), BULK_DELETE_MAX_KEYS)
+        ))
+        failed = [name for chunk in chunks for name in chunk]
+        failed_set = set(failed)
+        for name in object_names:
+            if name in failed_set:
+                self._stat_cache.pop(name, None)
+            else:
+                self._remember_exists(name, False)
+
+        for name in failed:
+            self._logger.error(f"❌ Delete failed for {name}")
+        self._logger.debug(
+            f"✓ Deleted {len(object_names) - len(failed)} archives"
+        )
+        return failed
+
     async def archive_exists(
         self,
         object_name: str,
@@ -401,20 +882,135 @@ class MinIOManager:
         if not self._client:
             return False
 
+        cached = self._stat_cache.get(object_name)
+        if cached is not None and time.monotonic() - cached[0] < STAT_CACHE_TTL_SECONDS:
+            return cached[1]
+
         try:
-            await asyncio.to_thread(
+            await self._run(
                 self._client.stat_object,
                 self._bucket_archives,
                 object_name,
             )
+            self._remember_exists(object_name, True)
             return True
 
         except S3Error as e:
             if e.code == "NoSuchKey":
+                self._remember_exists(object_name, False)
                 return False
             self._logger.error(f"❌ Stat failed for {object_name}: {e}")
             return False
 
+    async def stat_archive(
+        self,
+        object_name: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get one archive's object details, including its user metadata.
+
+        One HEAD request - for single lookups, not inside listing loops.
+
+        Args:
+            object_name: Object key
+
+        Returns:
+            Object details dict, or None if not found
+        """
+        if not self._client:
+            return None
+
+        try:
+            stat = await self._run(
+                self._client.stat_object,
+                self._bucket_archives,
+                object_name,
+            )
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                self._remember_exists(object_name, False)
+            else:
+                self._logger.error(f"❌ Stat failed for {object_name}: {e}")
+            return None
+
+        self._remember_exists(object_name, True)
+        return {
+            "name": stat.object_name,
+            "size": stat.size,
+            "last_modified": stat.last_modified,
+            "etag": stat.etag,
+            "content_type": stat.content_type,
+            "metadata": dict(stat.metadata or {}),
+        }
+
+    async def archives_exist(
+        self,
+        object_names: List[str],
+    ) -> Dict[str, bool]:
+        """
+        Check whether several archives exist.
+
+        Above BULK_EXISTS_LIST_THRESHOLD keys that share a directory at
+        least two levels deep (e.g. ``sessions/<id>``), one listing of that
+        directory replaces a HEAD request per key. The listing is abandoned
+        after BULK_EXISTS_LIST_MAX_FACTOR times as many keys as were asked
+        about, so a broad directory never turns into a bucket scan.
+        Otherwise the keys are checked concurrently with archive_exists.
+
+        Args:
+            object_names: Object keys to check
+
+        Returns:
+            Mapping of object key to existence
+        """
+        if not self._client:
+            return {name: False for name in object_names}
+
+        async def _each() -> Dict[str, bool]:
+            results = await asyncio.gather(
+                *(self.archive_exists(name) for name in object_names)
+            )
+            return dict(zip(object_names, results))
+
+        directory = os.path.commonprefix(object_names).rpartition("/")[0]
+        if len(object_names) <= BULK_EXISTS_LIST_THRESHOLD or "/" not in directory:
+            return await _each()
+
+        max_keys = len(object_names) * BULK_EXISTS_LIST_MAX_FACTOR
+
+        def _list_keys() -> Optional[set]:
+            objects = self._client.list_objects(
+                self._bucket_archives, prefix=directory + "/", recursive=True
+            )
+            present = {
+                obj.object_name for obj in itertools.islice(objects, max_keys + 1)
+            }
+            return present if len(present) <= max_keys else None
+
+        try:
+            present = await self._run(_list_keys)
+        except S3Error as e:
+            self._logger.warning(f"⚠️ List failed for {directory}/, checking keys one by one: {e}")
+            return await _each()
+        if present is None:
+            self._logger.debug(
+                f"{directory}/ holds more than {max_keys} objects, checking keys one by one"
+            )
+            return await _each()
+
+        exists = {name: name in present for name in object_names}
+        for name, found in exists.items():
+            self._remember_exists(name, found)
+        return exists
+
+    def _remember_exists(self, object_name: str, exists: bool) -> None:
+        """Record an archive's existence in the short-TTL stat cache."""
+        self._stat_cache.pop(object_name, None)
+        self._stat_cache[object_name] = (time.monotonic(), exists)
+        while len(self._stat_cache) > STAT_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order - drop the oldest entry
+            del self._stat_cache[next(iter(self._stat_cache))]
+
     # =========================================================================
     # Document Operations (ash-documents bucket)
     # =========================================================================
@@ -422,44 +1018,33 @@ class MinIOManager:
     async def upload_document(
         self,
         object_name: str,
-        data: bytes,
+        data: Union[bytes, BinaryIO],
         content_type: str = "application/octet-stream",
         metadata: Optional[Dict[str, str]] = None,
+        length: Optional[int] = None,
     ) -> bool:
         """
         Upload a document to the documents bucket.
 
         Args:
             object_name: Object key
-            data: Document data bytes
+            data: Document data bytes or a binary file object
             content_type: MIME type
             metadata: Optional metadata
+            length: Size of a file object, if known (see _upload_source)
 
         Returns:
             True if upload successful
         """
-        if not self._client:
-            return False
-
-        try:
-            data_stream = io.BytesIO(data)
-            
-            await asyncio.to_thread(
-                self._client.put_object,
-                self._bucket_documents,
-                object_name,
-                data_stream,
-                length=len(data),
-                content_type=content_type,
-                metadata=metadata or {},
-            )
-
-            self._logger.debug(f"✓ Uploaded document: {object_name}")
-            return True
-
-        except S3Error as e:
-            self._logger.error(f"❌ Document upload failed for {object_name}: {e}")
-            return False
+        return await self._put(
+            self._bucket_documents,
+            object_name,
+            data,
+            content_type=content_type,
+            metadata={**UNENCRYPTED_METADATA, **(metadata or {})},
+            length=length,
+            kind="document",
+        )
 
     async def download_document(
         self,
@@ -474,24 +1059,7 @@ class MinIOManager:
         Returns:
             Document data bytes or None
         """
-        if not self._client:
-            return None
-
-        try:
-            response = await asyncio.to_thread(
-                self._client.get_object,
-                self._bucket_documents,
-                object_name,
-            )
-            data = response.read()
-            response.close()
-            response.release_conn()
-            return data
-
-        except S3Error as e:
-            if e.code != "NoSuchKey":
-                self._logger.error(f"❌ Document download failed: {e}")
-            return None
+        return await self._get(self._bucket_documents, object_name, "document")
 
     # =========================================================================
     # Export Operations (ash-exports bucket)
@@ -500,44 +1068,33 @@ class MinIOManager:
     async def upload_export(
         self,
         object_name: str,
-        data: bytes,
+        data: Union[bytes, BinaryIO],
         content_type: str = "application/pdf",
         metadata: Optional[Dict[str, str]] = None,
+        length: Optional[int] = None,
     ) -> bool:
         """
         Upload a PDF export.
 
         Args:
             object_name: Object key (e.g., "reports/2026-01-09_summary.pdf")
-            data: PDF data bytes
+            data: PDF data bytes or a binary file object
             content_type: MIME type (default: application/pdf)
             metadata: Optional metadata
+            length: Size of a file object, if known (see _upload_source)
 
         Returns:
             True if upload successful
         """
-        if not self._client:
-            return False
-
-        try:
-            data_stream = io.BytesIO(data)
-            
-            await asyncio.to_thread(
-                self._client.put_object,
-                self._bucket_exports,
-                object_name,
-                data_stream,
-                length=len(data),
-                content_type=content_type,
-                metadata=metadata or {},
-            )
-
-            self._logger.debug(f"✓ Uploaded export: {object_name}")
-            return True
-
-        except S3Error as e:
-            self._logger.error(f"❌ Export upload failed for {object_name}: {e}")
-            return False
+        return await self._put(
+            self._bucket_exports,
+            object_name,
+            data,
+            content_type=content_type,
+            metadata={**UNENCRYPTED_METADATA, **(metadata or {})},
+            length=length,
+            kind="export",
+        )
 
     async def download_export(
         self,
@@ -552,36 +1109,41 @@ class MinIOManager:
         Returns:
             PDF data bytes or None
         """
-        if not self._client:
-            return None
+        return await self._get(self._bucket_exports, object_name, "export")
 
-        try:
-            response = await asyncio.to_thread(
-                self._client.get_object,
-                self._bucket_exports,
-                object_name,
-            )
-            data = response.read()
-            response.close()
-            response.release_conn()
-            return data
+    async def stream_export(
+        self,
+        object_name: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Optional[AsyncIterator[bytes]]:
+        """
+        Open a PDF export for chunked reading (see stream_archive).
 
-        except S3Error as e:
-            if e.code != "NoSuchKey":
-                self._logger.error(f"❌ Export download failed: {e}")
-            return None
+        Args:
+            object_name: Object key
+            chunk_size: Bytes per chunk
+
+        Returns:
+            Async iterator of chunks, or None if not found
+        """
+        return await self._open_stream(self._bucket_exports, object_name, chunk_size)
 
     async def list_exports(
         self,
         prefix: Optional[str] = None,
         limit: int = 100,
+        exact_prefix: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         List exports with optional prefix filter.
 
+        The prefix gets a trailing "/" unless exact_prefix is set (see
+        list_archives).
+
         Args:
-            prefix: Object key prefix
+            prefix: Object key prefix (e.g., "reports")
             limit: Maximum number of results
+            exact_prefix: Use prefix as given, without the trailing "/"
 
         Returns:
             List of export metadata dictionaries
@@ -590,26 +1152,12 @@ class MinIOManager:
             return []
 
         try:
-            objects = await asyncio.to_thread(
-                self._client.list_objects,
-                self._bucket_exports,
-                prefix=prefix,
-                recursive=True,
+            if not exact_prefix:
+                prefix = self._normalize_prefix(prefix)
+            return await self._run(
+                self._list_objects, self._bucket_exports, prefix, limit
             )
 
-            exports = []
-            for obj in objects:
-                if len(exports) >= limit:
-                    break
-                exports.append({
-                    "name": obj.object_name,
-                    "size": obj.size,
-                    "last_modified": obj.last_modified,
-                    "etag": obj.etag,
-                })
-
-            return exports
-
         except S3Error as e:
             self._logger.error(f"❌ List exports failed: {e}")
             return []
@@ -628,26 +1176,17 @@ class MinIOManager:
         if not self._client:
             return {"error": "Not connected"}
 
+        def _count(bucket: str) -> int:
+            # list_objects is lazy - drain it here, not on the event loop
+            return sum(1 for _ in self._client.list_objects(bucket, recursive=True))
+
         try:
-            # Count objects in each bucket
-            archive_count = 0
-            document_count = 0
-            export_count = 0
-
-            for obj in await asyncio.to_thread(
-                self._client.list_objects, self._bucket_archives, recursive=True
-            ):
-                archive_count += 1
-
-            for obj in await asyncio.to_thread(
-                self._client.list_objects, self._bucket_documents, recursive=True
-            ):
-                document_count += 1
-
-            for obj in await asyncio.to_thread(
-                self._client.list_objects, self._bucket_exports, recursive=True
-            ):
-                export_count += 1
+            # Count objects in the three buckets concurrently
+            archive_count, document_count, export_count = await asyncio.gather(
+                self._run(_count, self._bucket_archives),
+                self._run(_count, self._bucket_documents),
+                self._run(_count, self._bucket_exports),
+            )
 
             return {
                 "connected": True,
@@ -452,8 +452,10 @@ class ConfigManager:
                     "port": 5432,
                     "database": "ashdash",
                     "user": "ash",
-                    "pool_size": 5,
+                    "pool_size": 20,
                     "max_overflow": 10,
+                    "pool_timeout": 30,
+                    "pool_recycle": 1800,
                 }
             },
             "minio": {
@@ -464,6 +466,14 @@ class ConfigManager:
                     "bucket_archives": "ash-archives",
                     "bucket_documents": "ash-documents",
                     "bucket_exports": "ash-exports",
+                    "io_workers": 32,
+                    "pool_size": 32,
+                }
+            },
+            "archive": {
+                "defaults": {
+                    "compression_level": 3,
+                    "cipher": "auto",
                 }
             },
             "polling": {
@@ -472,6 +482,17 @@ class ConfigManager:
                     "sessions_interval_seconds": 10,
                 }
             },
+            "api": {
+                "defaults": {
+                    "trusted_orm_construct": True,
+                    "background_audit_writes": True,
+                }
+            },
+            "wiki": {
+                "defaults": {
+                    "pdf_workers": 2,
+                }
+            },
             "alerting": {
                 "defaults": {
                     "enabled": True,
@@ -540,6 +561,18 @@ class ConfigManager:
         """Get MinIO archive storage configuration."""
         return self.get_section("minio")
 
+    def get_archive_config(self) -> Dict[str, Any]:
+        """Get session archive packaging configuration."""
+        return self.get_section("archive")
+
+    def get_api_config(self) -> Dict[str, Any]:
+        """Get API serialization and audit write configuration."""
+        return self.get_section("api")
+
+    def get_wiki_config(self) -> Dict[str, Any]:
+        """Get documentation wiki configuration."""
+        return self.get_section("wiki")
+
     def get_alerting_config(self) -> Dict[str, Any]:
         """Get alerting configuration."""
         return self.get_section("alerting")
@@ -159,12 +159,14 @@ class DatabaseManager:
 
             # Get pool configuration
             db_config = self._config_manager.get_database_config()
-            pool_size = db_config.get("pool_size", 5)
+            pool_size = db_config.get("pool_size", 20)
             max_overflow = db_config.get("max_overflow", 10)
+            pool_timeout = db_config.get("pool_timeout", 30)
+            pool_recycle = db_config.get("pool_recycle", 1800)
 
             self._logger.info(
                 f"🔌 Connecting to PostgreSQL (pool_size={pool_size}, "
-                f"max_overflow={max_overflow})"
+                f"max_overflow={max_overflow}, pool_recycle={pool_recycle}s)"
             )
 
             # Create async engine
@@ -172,9 +174,15 @@ class DatabaseManager:
                 database_url,
                 pool_size=pool_size,
                 max_overflow=max_overflow,
-                pool_pre_ping=True,  # Verify connections before use
-                pool_recycle=3600,   # Recycle connections after 1 hour
+                pool_timeout=pool_timeout,
+                pool_pre_ping=True,          # Verify connections before use
+                pool_recycle=pool_recycle,   # Drop connections before proxies/PG idle-kill them
                 echo=self._config_manager.is_debug(),  # SQL logging in debug mode
+                connect_args={
+                    # Dashboard queries are short OLTP lookups - JIT
+                    # compilation only adds planning latency
+                    "server_settings": {"jit": "off"},
+                },
             )
 
             # Create session factory
@@ -518,6 +518,70 @@ class PDFGenerator:
         Returns:
             PDF file as bytes
             
+        Raises:
+            RuntimeError: If WeasyPrint is not available
+        """
+        pdf_bytes = self._write_pdf(self._build_html(document))
+        
+        self._logger.info(
+            f"✅ PDF generated: {len(pdf_bytes):,} bytes"
+        )
+        
+        return pdf_bytes
+    
+    def generate_to_file(
+        self,
+        document: WikiDocument,
+        output_path: str,
+        include_cover: bool = True,
+    ) -> str:
+        """
+        Generate PDF and save to file.
+        
+        WeasyPrint writes straight to the file - the PDF is never held
+        in memory as a separate bytes object.
+        
+        Args:
+            document: WikiDocument to convert
+            output_path: Path to save PDF
+            include_cover: Whether to include cover page
+            
+        Returns:
+            Path to generated PDF file
+        """
+        self._write_pdf(self._build_html(document), target=output_path)
+        
+        self._logger.info(f"📁 PDF saved to: {output_path}")
+        
+        return output_path
+    
+    def generate_to_stream(
+        self,
+        document: WikiDocument,
+        include_cover: bool = True,
+    ) -> BytesIO:
+        """
+        Generate PDF and return as BytesIO stream.
+        
+        Useful for streaming responses in web frameworks. WeasyPrint
+        writes directly into the stream (no intermediate bytes copy).
+        
+        Args:
+            document: WikiDocument to convert
+            include_cover: Whether to include cover page
+            
+        Returns:
+            BytesIO stream containing PDF
+        """
+        stream = BytesIO()
+        self._write_pdf(self._build_html(document), target=stream)
+        stream.seek(0)
+        return stream
+    
+    def _build_html(self, document: WikiDocument) -> str:
+        """
+        Build the full print HTML (template, styles, content) for a document.
+        
         Raises:
             RuntimeError: If WeasyPrint is not available
         """
@@ -551,7 +615,7 @@ class PDFGenerator:
             last_updated_html = f'<span><strong>Last Updated:</strong> {document.last_updated}</span>'
         
         # Generate full HTML
-        full_html = PDF_TEMPLATE.format(
+        return PDF_TEMPLATE.format(
             title=self._escape_html(document.title),
             description_html=description_html,
             category=self._escape_html(document.category),
@@ -561,69 +625,25 @@ class PDFGenerator:
             generated_date=datetime.now().strftime("%Y-%m-%d %H:%M"),
             styles=PDF_STYLES,
         )
-        
-        # Generate PDF
-        try:
-            html_doc = self._weasyprint(string=full_html)
-            pdf_bytes = html_doc.write_pdf()
-            
-            self._logger.info(
-                f"✅ PDF generated: {len(pdf_bytes):,} bytes"
-            )
-            
-            return pdf_bytes
-            
-        except Exception as e:
-            self._logger.error(f"❌ PDF generation failed: {e}")
-            raise RuntimeError(f"PDF generation failed: {e}") from e
     
-    def generate_to_file(
-        self,
-        document: WikiDocument,
-        output_path: str,
-        include_cover: bool = True,
-    ) -> str:
+    def _write_pdf(self, full_html: str, target: Any = None) -> Optional[bytes]:
         """
-        Generate PDF and save to file.
+        Render HTML to PDF with WeasyPrint.
         
         Args:
-            document: WikiDocument to convert
-            output_path: Path to save PDF
-            include_cover: Whether to include cover page
+            full_html: Complete HTML document
+            target: Optional file path or writable file-like object
             
         Returns:
-            Path to generated PDF file
+            PDF bytes if no target was given, otherwise None
         """
-        pdf_bytes = self.generate(document, include_cover)
-        
-        with open(output_path, "wb") as f:
-            f.write(pdf_bytes)
-        
-        self._logger.info(f"📁 PDF saved to: {output_path}")
-        
-        return output_path
-    
-    def generate_to_stream(
-        self,
-        document: WikiDocument,
-        include_cover: bool = True,
-    ) -> BytesIO:
-        """
-        Generate PDF and return as BytesIO stream.
-        
-        Useful for streaming responses in web frameworks.
-        
-        Args:
-            document: WikiDocument to convert
-            include_cover: Whether to include cover page
+        try:
+            html_doc = self._weasyprint(string=full_html)
+            return html_doc.write_pdf(target=target)
             
-        Returns:
-            BytesIO stream containing PDF
-        """
-        pdf_bytes = self.generate(document, include_cover)
-        stream = BytesIO(pdf_bytes)
-        stream.seek(0)
-        return stream
+        except Exception as e:
+            self._logger.error(f"❌ PDF generation failed: {e}")
+            raise RuntimeError(f"PDF generation failed: {e}") from e
     
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters."""
@@ -708,6 +728,33 @@ def create_pdf_generator(
     return PDFGenerator(logging_manager=logging_manager)
 
 
+# =============================================================================
+# PROCESS POOL ENTRY POINT
+# =============================================================================
+
+# Generator reused by each process pool worker (created on first job)
+_worker_generator: Optional[PDFGenerator] = None
+
+
+def generate_pdf_in_worker(document: WikiDocument) -> bytes:
+    """
+    Generate a PDF inside a process pool worker.
+    
+    Module-level so it can be pickled by ProcessPoolExecutor. Each worker
+    process creates its PDFGenerator once and reuses it for later jobs.
+    
+    Args:
+        document: Rendered WikiDocument
+        
+    Returns:
+        PDF file as bytes
+    """
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = create_pdf_generator()
+    return _worker_generator.generate(document)
+
+
 # =============================================================================
 # Export public interface
 # =============================================================================
@@ -715,5 +762,6 @@ def create_pdf_generator(
 __all__ = [
     "PDFGenerator",
     "create_pdf_generator",
+    "generate_pdf_in_worker",
     "PDF_STYLES",
 ]
@@ -49,11 +49,19 @@ USAGE:
 
 import os
 import re
+import time
+import asyncio
 import hashlib
 import logging
+import heapq
+import multiprocessing
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import yaml
 
@@ -129,6 +137,47 @@ EXCLUDED_DIRS: Set[str] = {
 }
 
 
+# How long a docs directory hash check is trusted before walking the tree again
+# (seconds). POST /api/wiki/refresh bypasses this for immediate reloads.
+CACHE_CHECK_TTL_SECONDS = 60.0
+
+# Maximum number of (category, tag) document listings kept in memory
+LIST_CACHE_MAX_ENTRIES = 256
+
+# Default number of processes rendering PDFs (WeasyPrint is CPU-bound)
+DEFAULT_PDF_WORKERS = 2
+
+
+# =============================================================================
+# Search Index Configuration
+# =============================================================================
+
+# Word splitter shared by the search index and incoming queries
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Field flags recorded in the postings (bit mask -> match location name)
+SEARCH_FIELD_TITLE = 1
+SEARCH_FIELD_TAGS = 2
+SEARCH_FIELD_DESCRIPTION = 4
+SEARCH_FIELD_CONTENT = 8
+
+SEARCH_FIELD_LOCATIONS: Tuple[Tuple[int, str], ...] = (
+    (SEARCH_FIELD_TITLE, "title"),
+    (SEARCH_FIELD_TAGS, "tags"),
+    (SEARCH_FIELD_DESCRIPTION, "description"),
+    (SEARCH_FIELD_CONTENT, "content"),
+)
+
+# Query words at least this long also match indexed words they are a
+# prefix of; shorter ones ("a", "to", the "c" of "c++") match exactly
+SEARCH_MIN_PREFIX_LENGTH = 3
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into lowercased word tokens."""
+    return SEARCH_TOKEN_PATTERN.findall(text.lower())
+
+
 class WikiManager:
     """
     Wiki Manager for documentation system.
@@ -185,6 +234,28 @@ class WikiManager:
         # Navigation cache
         self._nav_cache: Optional[WikiNavigation] = None
         
+        # Document listing cache keyed by (category, tag), LRU ordered
+        self._list_cache: "OrderedDict[Tuple[str, str], List[WikiDocumentSummary]]" = OrderedDict()
+        
+        # Caller-derived views (e.g. role-filtered lists), LRU ordered
+        self._view_cache: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+        
+        # Process pool for PDF rendering (created on first PDF request)
+        self._pdf_executor: Optional[ProcessPoolExecutor] = None
+        
+        # Inverted search index: (documents, token -> postings, sorted tokens).
+        # Each posting is (document index, score, field mask). Rebuilt on
+        # every rescan and replaced as a whole.
+        self._search_index: Tuple[
+            List[WikiDocument],
+            Dict[str, List[Tuple[int, float, int]]],
+            List[str],
+        ] = ([], {}, [])
+        
+        # Bumped whenever the document set is rescanned or invalidated
+        self._cache_version: int = 0
+        self._cache_checked_at: float = 0.0
+        
         self._logger.info(
             f"✅ WikiManager v{__version__} initialized "
             f"(docs_path: {self._docs_path})"
@@ -217,6 +288,15 @@ class WikiManager:
             self._logger.warning(f"⚠️ Docs directory not found: {self._docs_path}")
             return documents
         
+        # Build into a fresh dict and swap it in at the end, so readers on
+        # other threads never see a half-built cache (and removed files
+        # drop out of it)
+        cache: Dict[str, WikiDocument] = {}
+        
+        # Hash before reading, so an edit made mid-scan leaves the hash
+        # stale and triggers another rescan rather than being missed
+        docs_hash = self._compute_docs_hash()
+        
         for root, dirs, files in os.walk(self._docs_path):
             # Remove excluded directories from walk
             dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
@@ -235,12 +315,21 @@ class WikiManager:
                 
                 if doc:
                     documents.append(doc)
-                    self._cache[doc.slug] = doc
+                    cache[doc.slug] = doc
+        
+        self._cache = cache
+        self._search_index = self._build_search_index(documents)
         
         # Update cache metadata
         self._cache_time = datetime.now()
-        self._cache_hash = self._compute_docs_hash()
+        self._cache_hash = docs_hash
+        self._cache_checked_at = time.monotonic()
+        self._cache_version += 1
         self._nav_cache = None  # Invalidate navigation cache
+        # Swapped, not cleared: this runs in worker threads while readers
+        # on the event loop may be between a lookup and move_to_end()
+        self._list_cache = OrderedDict()
+        self._view_cache = OrderedDict()
         
         self._logger.info(f"✅ Scanned {len(documents)} documents")
         
@@ -498,6 +587,15 @@ class WikiManager:
         """
         docs = self.scan_documents()
         
+        # Local reference: a rescan swaps in a new dict rather than
+        # clearing this one, so the lookup below can't lose its key
+        list_cache = self._list_cache
+        cache_key = ((category or "").lower(), (tag or "").lower())
+        cached = list_cache.get(cache_key)
+        if cached is not None:
+            list_cache.move_to_end(cache_key)
+            return list(cached)
+        
         # Apply filters
         if category:
             category_lower = category.lower()
@@ -511,12 +609,58 @@ class WikiManager:
         summaries = [self.get_document_summary(d) for d in docs]
         summaries.sort(key=lambda x: x.title.lower())
         
-        return summaries
+        list_cache[cache_key] = summaries
+        if len(list_cache) > LIST_CACHE_MAX_ENTRIES:
+            list_cache.popitem(last=False)
+        
+        return list(summaries)
     
     # =========================================================================
     # Navigation
     # =========================================================================
     
+    def get_cached_view(
+        self,
+        key: Tuple[Any, ...],
+        build: Callable[[], Any],
+    ) -> Any:
+        """
+        Get a derived view of the documents, rebuilt only after a rescan.
+        
+        Lets callers (e.g. role-filtered API views) memoize results whose
+        lifetime matches the document cache. Returned values are shared
+        between callers and must not be mutated.
+        
+        Does not check the docs tree for changes (that may walk and hash
+        it); async callers run scan_documents() in a worker thread first.
+        
+        Args:
+            key: Hashable key identifying the view
+            build: Zero-argument function producing the view on a miss
+            
+        Returns:
+            The cached (or freshly built) view
+        """
+        # Local reference: a rescan swaps in a new dict rather than
+        # clearing this one, so a hit can't vanish before move_to_end()
+        view_cache = self._view_cache
+        view = view_cache.get(key)
+        if view is not None:
+            view_cache.move_to_end(key)
+            return view
+        
+        # A rescan in a worker thread may land while build() runs; a view
+        # built from the old documents must not outlive that rescan
+        version = self._cache_version
+        view = build()
+        if self._cache_version == version:
+            view_cache = self._view_cache
+            view_cache[key] = view
+            if len(view_cache) > LIST_CACHE_MAX_ENTRIES:
+                view_cache.popitem(last=False)
+        
+        return view
+    
     def get_navigation(self) -> WikiNavigation:
         """
         Get navigation structure grouped by category.
@@ -581,15 +725,68 @@ class WikiManager:
     # Search
     # =========================================================================
     
-    def search(self, query: str, limit: int = 20) -> List[WikiSearchResult]:
+    def _build_search_index(
+        self,
+        documents: List[WikiDocument],
+    ) -> Tuple[
+        List[WikiDocument],
+        Dict[str, List[Tuple[int, float, int]]],
+        List[str],
+    ]:
         """
-        Search documents by query.
+        Build the inverted search index for a freshly scanned document set.
         
-        Searches in order of weight:
+        Each token maps to postings of (document index, score, field mask).
+        The score is precomputed from field weights:
         1. Title (weight: 10)
         2. Tags (weight: 5)
         3. Description (weight: 3)
-        4. Content (weight: 1 + occurrence count)
+        4. Content (weight: 1 + 0.5 per occurrence, capped at +5)
+        
+        Args:
+            documents: Scanned documents (index order defines document ids)
+            
+        Returns:
+            Tuple of (documents, postings, sorted vocabulary)
+        """
+        postings: Dict[str, List[Tuple[int, float, int]]] = {}
+        
+        for doc_id, doc in enumerate(documents):
+            # token -> [score, field mask] for this document
+            entries: Dict[str, List[Any]] = {}
+            
+            for flag, weight, text in (
+                (SEARCH_FIELD_TITLE, 10.0, doc.title),
+                (SEARCH_FIELD_TAGS, 5.0, " ".join(doc.tags)),
+                (SEARCH_FIELD_DESCRIPTION, 3.0, doc.description),
+            ):
+                for token in set(_tokenize(text)):
+                    entry = entries.setdefault(token, [0.0, 0])
+                    entry[0] += weight
+                    entry[1] |= flag
+            
+            for token, occurrences in Counter(_tokenize(doc.content_md)).items():
+                entry = entries.setdefault(token, [0.0, 0])
+                entry[0] += 1 + min(occurrences * 0.5, 5)  # Cap at +5
+                entry[1] |= SEARCH_FIELD_CONTENT
+            
+            for token, (score, mask) in entries.items():
+                postings.setdefault(token, []).append((doc_id, score, mask))
+        
+        return documents, postings, sorted(postings)
+    
+    def search(self, query: str, limit: int = 20) -> List[WikiSearchResult]:
+        """
+        Search documents by query.
+        
+        Looks each query word up in the inverted index built at scan time
+        (see _build_search_index for field weights). A query word of
+        SEARCH_MIN_PREFIX_LENGTH or more characters also matches indexed
+        words it is a prefix of, keeping the best score per document.
+        Queries with punctuation ("on-call", "c++") only match documents
+        that contain them verbatim. Documents whose title contains the
+        whole multi-word query get a +10 bonus. If the index finds nothing,
+        the query is matched as a substring (e.g. "sponse").
         
         Args:
             query: Search query string
@@ -601,62 +798,120 @@ class WikiManager:
         if not query or not query.strip():
             return []
         
-        docs = self.scan_documents()
-        results: List[WikiSearchResult] = []
+        # Ensure the index reflects the current docs directory
+        self.scan_documents()
+        docs, postings, vocabulary = self._search_index
+        
         query_lower = query.lower().strip()
-        query_words = query_lower.split()
+        query_words = _tokenize(query_lower)
         
-        for doc in docs:
+        scores: Counter = Counter()
+        masks: Dict[int, int] = {}
+        
+        for word in set(query_words):
+            if len(word) < SEARCH_MIN_PREFIX_LENGTH:
+                terms: List[str] = [word] if word in postings else []
+            else:
+                start = bisect_left(vocabulary, word)
+                end = start
+                while end < len(vocabulary) and vocabulary[end].startswith(word):
+                    end += 1
+                terms = vocabulary[start:end]
+            
+            best: Dict[int, float] = {}
+            for term in terms:
+                for doc_id, score, mask in postings[term]:
+                    if score > best.get(doc_id, 0.0):
+                        best[doc_id] = score
+                    masks[doc_id] = masks.get(doc_id, 0) | mask
+            
+            scores.update(best)
+        
+        # Punctuation is lost in tokenizing - require the literal query
+        if " ".join(query_words) != " ".join(query_lower.split()):
+            for doc_id in list(scores):
+                if not self._contains_phrase(docs[doc_id], query_lower):
+                    del scores[doc_id]
+        
+        if not scores:
+            scores, masks = self._search_substring(docs, query_lower)
+        
+        # Whole-phrase title bonus (only checked for matched documents)
+        if len(query_words) > 1:
+            for doc_id in scores:
+                if query_lower in docs[doc_id].title.lower():
+                    scores[doc_id] += 10
+        
+        results: List[WikiSearchResult] = []
+        for doc_id, score in heapq.nlargest(limit, scores.items(), key=itemgetter(1)):
+            doc = docs[doc_id]
+            results.append(WikiSearchResult(
+                document=self.get_document_summary(doc),
+                score=score,
+                snippet=self._extract_snippet(doc.content_md, query),
+                match_locations=[
+                    name for flag, name in SEARCH_FIELD_LOCATIONS
+                    if masks[doc_id] & flag
+                ],
+            ))
+        
+        return results
+    
+    @staticmethod
+    def _contains_phrase(doc: WikiDocument, phrase: str) -> bool:
+        """Check whether any searchable field contains phrase (lowercased)."""
+        return (
+            phrase in doc.title.lower()
+            or any(phrase in tag.lower() for tag in doc.tags)
+            or phrase in doc.description.lower()
+            or phrase in doc.content_md.lower()
+        )
+    
+    @staticmethod
+    def _search_substring(
+        docs: List[WikiDocument],
+        query_lower: str,
+    ) -> Tuple[Counter, Dict[int, int]]:
+        """
+        Score documents containing the query as a raw substring.
+        
+        Fallback for partial words the index cannot find (not at a word
+        start), using the same field weights as the index.
+        
+        Args:
+            docs: Indexed documents (list order defines document ids)
+            query_lower: Lowercased, stripped query
+            
+        Returns:
+            Tuple of (document id -> score, document id -> field mask)
+        """
+        scores: Counter = Counter()
+        masks: Dict[int, int] = {}
+        
+        for doc_id, doc in enumerate(docs):
             score = 0.0
-            match_locations: List[str] = []
+            mask = 0
             
-            # Title match (highest weight)
-            title_lower = doc.title.lower()
-            if query_lower in title_lower:
+            if query_lower in doc.title.lower():
                 score += 10
-                match_locations.append("title")
-            else:
-                # Partial word matches in title
-                for word in query_words:
-                    if word in title_lower:
-                        score += 3
-                        if "title" not in match_locations:
-                            match_locations.append("title")
-            
-            # Tag matches
-            for tag in doc.tags:
-                tag_lower = tag.lower()
-                if query_lower in tag_lower or tag_lower in query_lower:
-                    score += 5
-                    if "tags" not in match_locations:
-                        match_locations.append("tags")
-            
-            # Description match
+                mask |= SEARCH_FIELD_TITLE
+            if any(query_lower in tag.lower() for tag in doc.tags):
+                score += 5
+                mask |= SEARCH_FIELD_TAGS
             if query_lower in doc.description.lower():
                 score += 3
-                match_locations.append("description")
-            
-            # Content match
-            content_lower = doc.content_md.lower()
-            if query_lower in content_lower:
-                score += 1
-                # Bonus for multiple occurrences
-                occurrences = content_lower.count(query_lower)
-                score += min(occurrences * 0.5, 5)  # Cap at +5
-                match_locations.append("content")
-            
-            if score > 0:
-                results.append(WikiSearchResult(
-                    document=self.get_document_summary(doc),
-                    score=score,
-                    snippet=self._extract_snippet(doc.content_md, query),
-                    match_locations=match_locations,
-                ))
-        
-        # Sort by score descending
-        results.sort(key=lambda x: x.score, reverse=True)
-        
-        return results[:limit]
+                mask |= SEARCH_FIELD_DESCRIPTION
+            
+            occurrences = doc.content_md.lower().count(query_lower)
+            if occurrences:
+                score += 1 + min(occurrences * 0.5, 5)  # Cap at +5
+                mask |= SEARCH_FIELD_CONTENT
+            
+            if score:
+                scores[doc_id] = score
+                masks[doc_id] = mask
+        
+        return scores, masks
     
     def _extract_snippet(
         self,
@@ -791,14 +1046,26 @@ class WikiManager:
         - Cache is empty
         - Docs directory hash changed
         
+        The directory hash is only recomputed once per
+        CACHE_CHECK_TTL_SECONDS, so hot read paths don't walk the
+        docs tree on every request.
+        
         Returns:
             True if cache is valid
         """
         if not self._cache or not self._cache_hash:
             return False
         
+        now = time.monotonic()
+        if now - self._cache_checked_at < CACHE_CHECK_TTL_SECONDS:
+            return True
+        
         current_hash = self._compute_docs_hash()
-        return current_hash == self._cache_hash
+        if current_hash != self._cache_hash:
+            return False
+        
+        self._cache_checked_at = now
+        return True
     
     def _compute_docs_hash(self) -> str:
         """
@@ -832,10 +1099,15 @@ class WikiManager:
         
         Call this when you know documents have changed.
         """
-        self._cache.clear()
+        self._cache = {}
+        self._search_index = ([], {}, [])
         self._cache_hash = None
         self._cache_time = None
+        self._cache_checked_at = 0.0
+        self._cache_version += 1
         self._nav_cache = None
+        self._list_cache = OrderedDict()
+        self._view_cache = OrderedDict()
         self._logger.info("🔄 Wiki cache invalidated")
     
     # =========================================================================
@@ -879,6 +1151,64 @@ class WikiManager:
         
         return generator.generate(doc)
     
+    async def generate_pdf_async(
+        self,
+        slug: str,
+        base_path: str = "/wiki",
+    ) -> bytes:
+        """
+        Generate a PDF in the PDF process pool without blocking the event loop.
+        
+        The document is rendered to HTML here (cached); WeasyPrint layout
+        and PDF writing run in a worker process.
+        
+        Args:
+            slug: Document slug
+            base_path: Base path for internal links
+            
+        Returns:
+            PDF file as bytes
+            
+        Raises:
+            ValueError: If document not found
+            RuntimeError: If PDF generation fails
+        """
+        from .pdf_generator import generate_pdf_in_worker
+        
+        doc = self.get_rendered_document(slug, base_path)
+        if not doc:
+            raise ValueError(f"Document not found: {slug}")
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_pdf_executor(),
+            generate_pdf_in_worker,
+            doc,
+        )
+    
+    def _get_pdf_executor(self) -> ProcessPoolExecutor:
+        """Get (or lazily create) the PDF rendering process pool."""
+        if self._pdf_executor is None:
+            workers = DEFAULT_PDF_WORKERS
+            if self._config is not None:
+                workers = self._config.get("wiki", "pdf_workers", DEFAULT_PDF_WORKERS)
+            
+            # spawn: don't fork the running event loop and its threads
+            self._pdf_executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            self._logger.info(f"🖨️ PDF process pool started ({workers} workers)")
+        
+        return self._pdf_executor
+    
+    def close(self) -> None:
+        """Shut down the PDF process pool (call at application shutdown)."""
+        if self._pdf_executor is not None:
+            self._pdf_executor.shutdown(wait=False, cancel_futures=True)
+            self._pdf_executor = None
+            self._logger.info("🖨️ PDF process pool stopped")
+    
     def is_pdf_available(self) -> bool:
         """
         Check if PDF generation is available.
@@ -902,6 +1232,16 @@ class WikiManager:
         """Get the documentation directory path."""
         return self._docs_path
     
+    @property
+    def cache_hash(self) -> Optional[str]:
+        """
+        Get the hash of the docs tree the cache was built from.
+        
+        Derived from file paths and modification times, so unlike the
+        in-process cache version it is stable across restarts.
+        """
+        return self._cache_hash
+    
     @property
     def document_count(self) -> int:
         """Get total number of cached documents."""
@@ -52,7 +52,7 @@ __version__ = "v5.0-9-9.4-1"
 # Default MinIO bucket
 DEFAULT_BUCKET = "ash-archives"
 
-# SHA-256 checksum length
+# Checksum length (hex SHA-256 or BLAKE3 digest)
 CHECKSUM_LENGTH = 64
 
 # Valid retention tiers
@@ -113,7 +113,7 @@ class Archive(Base):
         nullable=True,
     )
 
-    # SHA-256 checksum of the encrypted blob
+    # SHA-256 or BLAKE3 checksum of the encrypted blob (see extra_data)
     checksum: Mapped[str] = mapped_column(String(64))
 
     # Size of encrypted blob in bytes
@@ -245,6 +245,9 @@ class Archive(Base):
         Index("ix_archives_discord_user", "discord_user_id"),
         Index("ix_archives_severity", "severity"),
         Index("ix_archives_retention", "retention_tier", "retention_until"),
+        # Per-user history in archived_at order (list filter + sort)
+        Index("ix_archives_user_date", "discord_user_id", "archived_at"),
+        Index("ix_archives_archived_by", "archived_by"),
         # Composite index for common filter combinations
         Index(
             "ix_archives_filter_combo",
@@ -27,18 +27,38 @@ PHASE 9 CHANGES:
 """
 
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_
+import orjson
+from sqlalchemy import (
+    Float, Integer, String, Text,
+    and_, case, cast, exists, func, literal_column, select, update,
+)
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from src.models.archive import Archive
 from src.repositories.base import BaseRepository
 
 __version__ = "v5.0-9-9.4-1"
 
+# Response shapes built in SQL by ArchiveRepository._json_object()
+LIST_ITEM_FIELDS = (
+    "id", "session_id", "discord_user_id", "discord_user_name", "severity",
+    "session_started_at", "session_ended_at", "archived_at", "archived_by_name",
+    "size_bytes", "size_mb", "notes_count", "retention_tier", "retention_until",
+    "is_expired", "is_permanent", "days_until_expiry",
+)
+METADATA_FIELDS = LIST_ITEM_FIELDS + (
+    "storage_key", "storage_bucket", "checksum", "archived_by",
+)
+SESSION_ARCHIVE_FIELDS = (
+    "id", "session_id", "discord_user_id", "discord_user_name", "severity",
+    "archived_at", "archived_by_name", "size_bytes", "notes_count",
+    "retention_tier", "retention_until",
+)
+
 
 class ArchiveRepository(BaseRepository[Archive, UUID]):
     """
@@ -58,6 +78,109 @@ class ArchiveRepository(BaseRepository[Archive, UUID]):
         """
         super().__init__(Archive, db_manager, logging_manager)
 
+    # =========================================================================
+    # SQL-side Response Projection
+    # =========================================================================
+
+    @staticmethod
+    def _response_fields() -> Dict[str, Any]:
+        """
+        SQL expressions for every archive field the API returns.
+
+        The derived fields mirror the Archive properties size_mb,
+        is_retention_expired, is_permanent and days_until_expiry.
+        """
+        seconds_left = func.extract("epoch", Archive.retention_until - func.now())
+        return {
+            "id": Archive.id,
+            "session_id": Archive.session_id,
+            "discord_user_id": Archive.discord_user_id,
+            "discord_user_name": Archive.discord_user_name,
+            "severity": Archive.severity,
+            "session_started_at": Archive.session_started_at,
+            "session_ended_at": Archive.session_ended_at,
+            "archived_at": Archive.archived_at,
+            "archived_by": Archive.archived_by,
+            "archived_by_name": Archive.archived_by_name,
+            "storage_key": Archive.storage_key,
+            "storage_bucket": Archive.storage_bucket,
+            "checksum": Archive.checksum,
+            "size_bytes": Archive.size_bytes,
+            "size_mb": cast(Archive.size_bytes, Float) / (1024 * 1024),
+            "notes_count": Archive.notes_count,
+            "retention_tier": Archive.retention_tier,
+            "retention_until": Archive.retention_until,
+            "is_expired": func.coalesce(Archive.retention_until < func.now(), False),
+            "is_permanent": Archive.retention_tier == "permanent",
+            "days_until_expiry": case(
+                (Archive.retention_until.is_(None), None),
+                else_=cast(func.greatest(0, func.floor(seconds_left / 86400)), Integer),
+            ),
+        }
+
+    @classmethod
+    def _json_object(cls, names: Tuple[str, ...]) -> Any:
+        """
+        json_build_object() of the named response fields.
+
+        UUIDs come out as strings and timestamptz as ISO-8601, matching
+        the dicts the manager used to build from ORM objects.
+        """
+        fields = cls._response_fields()
+        args = []
+        for name in names:
+            args.extend((literal_column(f"'{name}'"), fields[name]))
+        return func.json_build_object(*args)
+
+    async def _fetch_json_dict(
+        self,
+        session: AsyncSession,
+        condition: Any,
+        names: Tuple[str, ...],
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch one archive as a response dict, or None if no row matches."""
+        query = select(cast(self._json_object(names), Text)).where(condition).limit(1)
+        row_json = (await session.execute(query)).scalar_one_or_none()
+        return orjson.loads(row_json) if row_json is not None else None
+
+    async def get_metadata_dict(
+        self,
+        session: AsyncSession,
+        archive_id: UUID,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get archive metadata as a response dict (no ORM object built).
+
+        Args:
+            session: Database session
+            archive_id: Archive UUID
+
+        Returns:
+            Dict of METADATA_FIELDS or None if not found
+        """
+        return await self._fetch_json_dict(
+            session, Archive.id == archive_id, METADATA_FIELDS
+        )
+
+    async def get_session_archive_dict(
+        self,
+        session: AsyncSession,
+        session_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a session's archive as a response dict (no ORM object built).
+
+        Args:
+            session: Database session
+            session_id: Crisis session ID
+
+        Returns:
+            Dict of SESSION_ARCHIVE_FIELDS or None if not archived
+        """
+        return await self._fetch_json_dict(
+            session, Archive.session_id == session_id, SESSION_ARCHIVE_FIELDS
+        )
+
     # =========================================================================
     # Archive Queries
     # =========================================================================
@@ -108,11 +231,15 @@ class ArchiveRepository(BaseRepository[Archive, UUID]):
             session: Database session
             session_id: Crisis session ID
 
+        Uses EXISTS against ix_archives_session, so PostgreSQL can answer
+        from the index without loading the archive row.
+
         Returns:
             True if archive exists
         """
-        archive = await self.get_by_session(session, session_id)
-        return archive is not None
+        query = select(exists().where(Archive.session_id == session_id))
+        result = await session.execute(query)
+        return bool(result.scalar())
 
     async def get_by_archived_by(
         self,
@@ -146,6 +273,45 @@ class ArchiveRepository(BaseRepository[Archive, UUID]):
     # Filtered Queries (Phase 9)
     # =========================================================================
 
+    @staticmethod
+    def _filter_conditions(
+        discord_user_id: Optional[int] = None,
+        severity: Optional[str] = None,
+        retention_tier: Optional[str] = None,
+        archived_by: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Any]:
+        """
+        Build bound WHERE clauses for the archive list filters.
+
+        Shared by the page and count queries so both hit the same indexes
+        (ix_archives_user_date, ix_archives_filter_combo, ...).
+
+        Returns:
+            List of SQLAlchemy conditions (empty when unfiltered)
+        """
+        conditions = []
+
+        if discord_user_id is not None:
+            conditions.append(Archive.discord_user_id == discord_user_id)
+
+        if severity is not None:
+            conditions.append(Archive.severity == severity)
+
+        if retention_tier is not None:
+            conditions.append(Archive.retention_tier == retention_tier)
+
+        if archived_by is not None:
+            conditions.append(Archive.archived_by == archived_by)
+
+        if start_date is not None:
+            conditions.append(Archive.archived_at >= start_date)
+
+        if end_date is not None:
+            conditions.append(Archive.archived_at <= end_date)
+        return conditions
+
     async def get_archives_filtered(
         self,
         session: AsyncSession,
@@ -175,36 +341,92 @@ class ArchiveRepository(BaseRepository[Archive, UUID]):
         Returns:
             List of matching archives
         """
-        conditions = []
+        conditions = self._filter_conditions(
+            discord_user_id=discord_user_id,
+            severity=severity,
+            retention_tier=retention_tier,
+            archived_by=archived_by,
+            start_date=start_date,
+            end_date=end_date,
+        )
 
-        if discord_user_id is not None:
-            conditions.append(Archive.discord_user_id == discord_user_id)
+        query = (
+            select(Archive)
+            .where(and_(*conditions) if conditions else True)
+            .order_by(Archive.archived_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
 
-        if severity is not None:
-            conditions.append(Archive.severity == severity)
+        result = await session.execute(query)
+        return list(result.scalars().all())
 
-        if retention_tier is not None:
-            conditions.append(Archive.retention_tier == retention_tier)
+    async def get_archives_page_json(
+        self,
+        session: AsyncSession,
+        discord_user_id: Optional[int] = None,
+        severity: Optional[str] = None,
+        retention_tier: Optional[str] = None,
+        archived_by: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> Tuple[str, int]:
+        """
+        Get a page of archive list items already serialized by PostgreSQL.
 
-        if archived_by is not None:
-            conditions.append(Archive.archived_by == archived_by)
+        json_build_object() projects each row into the ArchiveListItem shape
+        (including the derived size/expiry fields) and json_agg() collects
+        the page, so no ORM objects or Python dicts are built per row.
+        Timestamps come out as ISO-8601 straight from timestamptz. The
+        result is cast to text so the driver hands back the JSON verbatim
+        instead of decoding it.
 
-        if start_date is not None:
-            conditions.append(Archive.archived_at >= start_date)
+        Args:
+            Same as get_archives_filtered()
 
-        if end_date is not None:
-            conditions.append(Archive.archived_at <= end_date)
+        Returns:
+            Tuple of (JSON array text for this page, total matching archives)
+        """
+        filters = {
+            "discord_user_id": discord_user_id,
+            "severity": severity,
+            "retention_tier": retention_tier,
+            "archived_by": archived_by,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        conditions = self._filter_conditions(**filters)
 
-        query = (
-            select(Archive)
+        item = self._json_object(LIST_ITEM_FIELDS)
+
+        page = (
+            select(
+                item.label("item"),
+                Archive.archived_at,
+                func.count().over().label("total"),
+            )
             .where(and_(*conditions) if conditions else True)
             .order_by(Archive.archived_at.desc())
             .offset(skip)
             .limit(limit)
+            .subquery()
+        )
+        query = select(
+            cast(
+                func.json_agg(aggregate_order_by(page.c.item, page.c.archived_at.desc())),
+                Text,
+            ),
+            func.max(page.c.total),
         )
 
-        result = await session.execute(query)
-        return list(result.scalars().all())
+        items_json, total = (await session.execute(query)).one()
+        if items_json is not None:
+            return items_json, total
+        if skip == 0:
+            return "[]", 0
+        return "[]", await self.count_filtered(session, **filters)
 
     async def count_filtered(
         self,
@@ -231,25 +453,14 @@ class ArchiveRepository(BaseRepository[Archive, UUID]):
         Returns:
             Count of matching archives
         """
-        conditions = []
-
-        if discord_user_id is not None:
-            conditions.append(Archive.discord_user_id == discord_user_id)
-
-        if severity is not None:
-            conditions.append(Archive.severity == severity)
-
-        if retention_tier is not None:
-            conditions.append(Archive.retention_tier == retention_tier)
-
-        if archived_by is not None:
-            conditions.append(Archive.archived_by == archived_by)
-
-        if start_date is not None:
-            conditions.append(Archive.archived_at >= start_date)
-
-        if end_date is not None:
-            conditions.append(Archive.archived_at <= end_date)
+        conditions = self._filter_conditions(
+            discord_user_id=discord_user_id,
+            severity=severity,
+            retention_tier=retention_tier,
+            archived_by=archived_by,
+            start_date=start_date,
+            end_date=end_date,
+        )
 
         query = (
             select(func.count(Archive.id))
@@ -516,6 +727,58 @@ class ArchiveRepository(BaseRepository[Archive, UUID]):
             },
         )
 
+    async def set_retention_tier_with_audit(
+        self,
+        session: AsyncSession,
+        archive_id: UUID,
+        tier: str,
+        retention_days: int,
+        updated_by_name: str,
+    ) -> Optional[str]:
+        """
+        Change retention tier and record the change in extra_data atomically.
+
+        One UPDATE ... FROM ... RETURNING sets the tier and retention date,
+        merges the audit fields into extra_data with jsonb ||, and returns
+        the tier the archive had before - no prior SELECT, no second UPDATE.
+
+        Args:
+            session: Database session
+            archive_id: Archive UUID
+            tier: New retention tier
+            retention_days: Days for new retention period
+            updated_by_name: Display name of user making the change
+
+        Returns:
+            Previous retention tier, or None if the archive was not found
+        """
+        now = datetime.now(timezone.utc)
+        previous = (
+            select(Archive.id, Archive.retention_tier.label("previous_tier"))
+            .where(Archive.id == archive_id)
+            .subquery()
+        )
+        audit = func.jsonb_build_object(
+            literal_column("'retention_updated_at'"), cast(now.isoformat(), String),
+            literal_column("'retention_updated_by'"), cast(updated_by_name, String),
+            literal_column("'previous_tier'"), previous.c.previous_tier,
+        )
+        query = (
+            update(Archive)
+            .where(Archive.id == previous.c.id)
+            .values(
+                retention_tier=tier,
+                retention_until=now + timedelta(days=retention_days),
+                extra_data=func.coalesce(
+                    Archive.extra_data, cast(literal_column("'{}'"), JSONB)
+                ).op("||")(audit),
+            )
+            .returning(previous.c.previous_tier)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
+
     # =========================================================================
     # Archive Creation
     # =========================================================================
@@ -548,7 +811,7 @@ class ArchiveRepository(BaseRepository[Archive, UUID]):
             session: Database session
             session_id: Crisis session ID
             storage_key: MinIO object key
-            checksum: SHA-256 checksum of data
+            checksum: Checksum of the encrypted data (SHA-256 or BLAKE3)
             size_bytes: Size in bytes
             archived_by: User UUID who created the archive
             archived_by_name: Display name of archiving user
@@ -591,6 +854,41 @@ class ArchiveRepository(BaseRepository[Archive, UUID]):
         
         return await self.create(session, archive_data)
 
+    async def create_archives(
+        self,
+        session: AsyncSession,
+        archives: List[Dict[str, Any]],
+    ) -> List[Archive]:
+        """
+        Create several archive records in one flush.
+
+        Every column default is computed in Python, so no per-row refresh is
+        needed and SQLAlchemy sends the rows as a batched multi-row INSERT.
+
+        Args:
+            session: Database session
+            archives: Dicts taking the same keyword arguments as
+                create_archive() (without session); a dict may give
+                retention_until directly instead of retention_days
+
+        Returns:
+            Created archives, in input order
+        """
+        now = datetime.now(timezone.utc)
+        db_objects = []
+        for fields in archives:
+            fields = dict(fields)
+            retention_days = fields.pop("retention_days", 365)
+            if "retention_until" not in fields:
+                fields["retention_until"] = now + timedelta(days=retention_days)
+            fields["extra_data"] = fields.get("extra_data") or {}
+            db_objects.append(Archive(**fields))
+
+        session.add_all(db_objects)
+        await session.flush()
+        self._logger.debug(f"Created {len(db_objects)} Archive records")
+        return db_objects
+
     # =========================================================================
     # Archive Verification
     # =========================================================================
@@ -48,6 +48,9 @@ __version__ = "v5.0-2-2.5-1"
 ModelType = TypeVar("ModelType", bound=Base)
 PrimaryKeyType = TypeVar("PrimaryKeyType", UUID, str, int)
 
+# Primary keys per DELETE statement in delete_by_ids()
+DELETE_BY_IDS_CHUNK_SIZE = 1000
+
 
 class BaseRepository(Generic[ModelType, PrimaryKeyType], ABC):
     """
@@ -453,5 +456,31 @@ class BaseRepository(Generic[ModelType, PrimaryKeyType], ABC):
         self._logger.debug(f"Deleted {result.rowcount} {self._model.__name__} records")
         return result.rowcount
 
+    async def delete_by_ids(
+        self,
+        session: AsyncSession,
+        ids: List[PrimaryKeyType],
+    ) -> int:
+        """
+        Delete multiple records by primary key with one statement per 1000 ids.
+
+        Args:
+            session: Database session
+            ids: List of primary key values
+
+        Returns:
+            Number of deleted records
+        """
+        deleted = 0
+        # Chunked so each statement stays well inside driver bind-parameter limits
+        for i in range(0, len(ids), DELETE_BY_IDS_CHUNK_SIZE):
+            chunk = ids[i:i + DELETE_BY_IDS_CHUNK_SIZE]
+            query = delete(self._model).where(self._model.id.in_(chunk))
+            result = await session.execute(query)
+            deleted += result.rowcount
+        if deleted:
+            self._logger.debug(f"Deleted {deleted} {self._model.__name__} records")
+        return deleted
+
 
 __all__ = ["BaseRepository", "ModelType", "PrimaryKeyType"]
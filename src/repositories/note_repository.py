@@ -22,7 +22,7 @@ Repository: https://github.com/the-alphabet-cartel/ash-dash
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import select, func
@@ -86,6 +86,35 @@ class NoteRepository(BaseRepository[Note, UUID]):
         result = await session.execute(query)
         return list(result.scalars().all())
 
+    async def get_by_session_as_mappings(
+        self,
+        session: AsyncSession,
+        session_id: str,
+        columns: Tuple[str, ...],
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all notes for a session as plain dicts of the requested columns.
+
+        Skips ORM hydration entirely - intended for read-only list
+        endpoints that serialize straight to JSON.
+
+        Args:
+            session: Database session
+            session_id: Crisis session ID
+            columns: Note column names to select
+
+        Returns:
+            List of column dicts ordered by creation time
+        """
+        query = (
+            select(*(getattr(Note, c) for c in columns))
+            .where(Note.session_id == session_id)
+            .order_by(Note.created_at.asc())
+        )
+        
+        result = await session.execute(query)
+        return [dict(row) for row in result.mappings().all()]
+
     async def get_latest_by_session(
         self,
         session: AsyncSession,
@@ -300,11 +329,12 @@ class NoteRepository(BaseRepository[Note, UUID]):
             session_id: Crisis session ID
 
         Returns:
-            Number of notes locked
+            Number of notes newly locked
         """
+        # Single UPDATE; skip rows already locked to avoid rewriting them
         return await self.update_many(
             session,
-            filters={"session_id": session_id},
+            filters={"session_id": session_id, "is_locked": False},
             values={"is_locked": True},
         )
 
@@ -323,11 +353,12 @@ class NoteRepository(BaseRepository[Note, UUID]):
             session_id: Crisis session ID
 
         Returns:
-            Number of notes unlocked
+            Number of notes newly unlocked
         """
+        # Single UPDATE; skip rows already unlocked to avoid rewriting them
         return await self.update_many(
             session,
-            filters={"session_id": session_id},
+            filters={"session_id": session_id, "is_locked": True},
             values={"is_locked": False},
         )
 
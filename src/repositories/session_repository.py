@@ -26,10 +26,12 @@ from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_, case, cast, String
+from sqlalchemy import select, update, func, and_, or_, case, cast, extract, Integer, String
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 
+from src.models.note import Note
 from src.models.session import Session, SEVERITY_LEVELS, SESSION_STATUSES
 from src.repositories.base import BaseRepository
 
@@ -372,6 +374,37 @@ class SessionRepository(BaseRepository[Session, str]):
             limit=1000,
         )
 
+    async def count_by_crt_user(
+        self,
+        session: AsyncSession,
+        crt_user_id: UUID,
+        since: datetime,
+    ) -> Dict[str, int]:
+        """
+        Count a CRT user's assigned sessions in a single aggregate query.
+
+        Args:
+            session: Database session
+            crt_user_id: CRT user UUID
+            since: Cutoff for the "recent" count (created_at >= since)
+
+        Returns:
+            Dict with total, active, and since counts
+        """
+        query = select(
+            func.count(Session.id),
+            func.count(Session.id).filter(Session.status == "active"),
+            func.count(Session.id).filter(Session.created_at >= since),
+        ).where(Session.crt_user_id == crt_user_id)
+
+        result = await session.execute(query)
+        total, active, recent = result.one()
+        return {
+            "total": total or 0,
+            "active": active or 0,
+            "since": recent or 0,
+        }
+
     async def get_unassigned_sessions(
         self,
         session: AsyncSession,
@@ -501,6 +534,45 @@ class SessionRepository(BaseRepository[Session, str]):
         result = await session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_detail_version(
+        self,
+        session: AsyncSession,
+        session_id: str,
+    ) -> Optional[Row]:
+        """
+        Get the values that change whenever a session's detail view changes.
+
+        Cheap pre-check for conditional GETs: one indexed lookup instead
+        of loading the session with all relations.
+
+        Args:
+            session: Database session
+            session_id: Session ID
+
+        Returns:
+            Row with status, updated_at, notes_updated_at and note_count,
+            or None if not found
+        """
+        notes_updated_at = (
+            select(func.max(Note.updated_at))
+            .where(Note.session_id == Session.id)
+            .scalar_subquery()
+        )
+        note_count = (
+            select(func.count(Note.id))
+            .where(Note.session_id == Session.id)
+            .scalar_subquery()
+        )
+        query = select(
+            Session.status,
+            Session.updated_at,
+            notes_updated_at.label("notes_updated_at"),
+            note_count.label("note_count"),
+        ).where(Session.id == session_id)
+
+        result = await session.execute(query)
+        return result.first()
+
     async def get_with_all_relations(
         self,
         session: AsyncSession,
@@ -535,12 +607,55 @@ class SessionRepository(BaseRepository[Session, str]):
     # Session Actions
     # =========================================================================
 
+    async def _update_returning_previous(
+        self,
+        session: AsyncSession,
+        session_id: str,
+        values: Dict[str, Any],
+        previous_columns: Tuple[str, ...],
+        status: Optional[str] = None,
+    ) -> Optional[Row]:
+        """
+        Update a session and return selected column values from before the update.
+
+        Locks the row and applies the update in a single
+        UPDATE ... FROM (SELECT ... FOR UPDATE) ... RETURNING statement,
+        so callers don't need a separate SELECT for audit old_values.
+
+        Args:
+            session: Database session
+            session_id: Session ID
+            values: Column values (or SQL expressions) to set
+            previous_columns: Column names to return from the pre-update row
+            status: Only update if the session currently has this status
+
+        Returns:
+            Row of previous values (by column name), or None if no
+            session matched
+        """
+        previous = (
+            select(Session.id, *(getattr(Session, c) for c in previous_columns))
+            .where(Session.id == session_id)
+        )
+        if status is not None:
+            previous = previous.where(Session.status == status)
+        previous = previous.with_for_update().subquery()
+        query = (
+            update(Session)
+            .where(Session.id == previous.c.id)
+            .values(**values)
+            .returning(*(previous.c[c] for c in previous_columns))
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(query)
+        return result.first()
+
     async def assign_to_crt(
         self,
         session: AsyncSession,
         session_id: str,
         crt_user_id: UUID,
-    ) -> Optional[Session]:
+    ) -> Optional[Row]:
         """
         Assign a session to a CRT user.
 
@@ -550,15 +665,20 @@ class SessionRepository(BaseRepository[Session, str]):
             crt_user_id: CRT user UUID
 
         Returns:
-            Updated session or None
+            Row with the previous crt_user_id, or None if session not found
         """
-        return await self.update(session, session_id, {"crt_user_id": crt_user_id})
+        return await self._update_returning_previous(
+            session,
+            session_id,
+            {"crt_user_id": crt_user_id},
+            ("crt_user_id",),
+        )
 
     async def unassign(
         self,
         session: AsyncSession,
         session_id: str,
-    ) -> Optional[Session]:
+    ) -> Optional[Row]:
         """
         Remove CRT assignment from a session.
 
@@ -567,18 +687,26 @@ class SessionRepository(BaseRepository[Session, str]):
             session_id: Session ID
 
         Returns:
-            Updated session or None
+            Row with the previous crt_user_id, or None if session not found
         """
-        return await self.update(session, session_id, {"crt_user_id": None})
+        return await self._update_returning_previous(
+            session,
+            session_id,
+            {"crt_user_id": None},
+            ("crt_user_id",),
+        )
 
     async def close_session(
         self,
         session: AsyncSession,
         session_id: str,
         summary: Optional[str] = None,
-    ) -> Optional[Session]:
+    ) -> Optional[Row]:
         """
-        Close a session.
+        Close an active session.
+
+        Sets ended_at and computes duration_seconds from started_at in the
+        same UPDATE statement.
 
         Args:
             session: Database session
@@ -586,26 +714,29 @@ class SessionRepository(BaseRepository[Session, str]):
             summary: Optional closing summary
 
         Returns:
-            Updated session or None
+            Row with the previous status, or None if the session does not
+            exist or is not active
         """
-        db_session = await self.get(session, session_id)
-        if not db_session:
-            return None
-        
         now = datetime.now(timezone.utc)
         updates = {
             "status": "closed",
             "ended_at": now,
+            # floor() first: a bare cast rounds, int(total_seconds()) truncated
+            "duration_seconds": cast(
+                func.floor(extract("epoch", now - Session.started_at)), Integer
+            ),
         }
         
-        if db_session.started_at:
-            duration = now - db_session.started_at
-            updates["duration_seconds"] = int(duration.total_seconds())
-        
         if summary:
             updates["ash_summary"] = summary
         
-        return await self.update(session, session_id, updates)
+        return await self._update_returning_previous(
+            session,
+            session_id,
+            updates,
+            ("status",),
+            status="active",
+        )
 
     async def mark_archived(
         self,
@@ -755,9 +886,10 @@ class SessionRepository(BaseRepository[Session, str]):
         Returns:
             Tuple of (list of sessions, pattern analysis dict)
         """
-        # Build query for user sessions
+        # Build query for user sessions - COUNT(*) OVER () is evaluated
+        # before LIMIT, so each row also carries the user's total count
         query = (
-            select(Session)
+            select(Session, func.count(Session.id).over().label("total_sessions"))
             .where(Session.discord_user_id == discord_user_id)
         )
 
@@ -767,17 +899,9 @@ class SessionRepository(BaseRepository[Session, str]):
         query = query.order_by(Session.started_at.desc()).limit(limit)
 
         result = await session.execute(query)
-        sessions = list(result.scalars().all())
-
-        # Get total count for this user
-        count_query = (
-            select(func.count(Session.id))
-            .where(Session.discord_user_id == discord_user_id)
-        )
-        if exclude_session_id:
-            count_query = count_query.where(Session.id != exclude_session_id)
-        count_result = await session.execute(count_query)
-        total_sessions = count_result.scalar() or 0
+        rows = result.all()
+        sessions = [row[0] for row in rows]
+        total_sessions = rows[0].total_sessions if rows else 0
 
         # Calculate pattern analysis
         patterns = await self._analyze_user_patterns(session, discord_user_id, sessions)
@@ -874,7 +998,7 @@ class SessionRepository(BaseRepository[Session, str]):
         self,
         session: AsyncSession,
         session_id: str,
-    ) -> Optional[Session]:
+    ) -> Optional[Row]:
         """
         Reopen a closed session (admin action).
 
@@ -883,22 +1007,22 @@ class SessionRepository(BaseRepository[Session, str]):
             session_id: Session ID
 
         Returns:
-            Updated session or None
+            Row with the previous status, or None if the session does not
+            exist or is not closed
         """
-        db_session = await self.get(session, session_id)
-        if not db_session:
-            return None
-
-        if db_session.status not in ("closed", "archived"):
-            raise ValueError(f"Cannot reopen session with status: {db_session.status}")
-
         updates = {
             "status": "active",
             "ended_at": None,
             "duration_seconds": None,
         }
 
-        return await self.update(session, session_id, updates)
+        return await self._update_returning_previous(
+            session,
+            session_id,
+            updates,
+            ("status",),
+            status="closed",
+        )
 
     # =========================================================================
     # Statistics
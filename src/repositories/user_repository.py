@@ -22,10 +22,10 @@ Repository: https://github.com/the-alphabet-cartel/ash-dash
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, or_
+from sqlalchemy import select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.user import User
@@ -239,6 +239,71 @@ class UserRepository(BaseRepository[User, UUID]):
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def list_users(
+        self,
+        session: AsyncSession,
+        role: Optional[str] = None,
+        active_only: bool = True,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> Tuple[List[User], int]:
+        """
+        List users with optional filters and pagination.
+
+        Returns both the requested page and the total match count, so
+        callers never need to load every row just to report a total.
+
+        Args:
+            session: Database session
+            role: Filter by role (e.g., "admin", "crt_member")
+            active_only: If True, only return active users
+            search: Search string (matches display name or email)
+            skip: Records to skip (pagination offset)
+            limit: Maximum records to return
+
+        Returns:
+            Tuple of (list of users, total count)
+        """
+        conditions = []
+
+        if search:
+            search_pattern = f"%{search}%"
+            conditions.append(
+                or_(
+                    User.display_name.ilike(search_pattern),
+                    User.email.ilike(search_pattern),
+                )
+            )
+
+        if role:
+            conditions.append(User.role == role)
+
+        if active_only:
+            conditions.append(User.is_active == True)
+
+        query = select(User)
+        count_query = select(func.count(User.id))
+
+        if conditions:
+            query = query.where(and_(*conditions))
+            count_query = count_query.where(and_(*conditions))
+
+        # Get total count
+        count_result = await session.execute(count_query)
+        total = count_result.scalar() or 0
+
+        # Apply ordering and pagination
+        query = (
+            query
+            .order_by(User.display_name, User.id)
+            .offset(skip)
+            .limit(limit)
+        )
+
+        result = await session.execute(query)
+        return list(result.scalars().all()), total
+
     # =========================================================================
     # User Actions
     # =========================================================================
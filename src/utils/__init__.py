@@ -22,6 +22,8 @@ Repository: https://github.com/the-alphabet-cartel/ash-dash
 
 AVAILABLE UTILITIES:
 - encryption.py: AES-256-GCM encryption/decryption for archives (Phase 9)
+- serialization.py: Trusted ORM → response model conversion (Phase 11)
+- http_cache.py: ETag generation and If-None-Match matching (Phase 11)
 
 PLANNED UTILITIES:
 - validators.py: Common validation functions
@@ -37,6 +39,7 @@ __version__ = "v5.0-9-9.2-1"
 from .encryption import (
     # Classes
     ArchiveEncryption,
+    StreamDecryptor,
     # Factory functions
     create_archive_encryption,
     create_archive_encryption_from_key,
@@ -51,6 +54,29 @@ from .encryption import (
     PBKDF2_ITERATIONS,
 )
 
+# =============================================================================
+# Serialization Utilities (Phase 11)
+# =============================================================================
+
+from .serialization import (
+    from_orm,
+    model_field_names,
+    trusted_construct_enabled,
+)
+
+# =============================================================================
+# HTTP Cache Utilities (Phase 11)
+# =============================================================================
+
+from .http_cache import (
+    make_etag,
+    etag_matches,
+    PRIVATE_REVALIDATE,
+    compress_variants,
+    pick_encoding,
+    encoding_headers,
+)
+
 # =============================================================================
 # Module Exports
 # =============================================================================
@@ -58,6 +84,7 @@ from .encryption import (
 __all__ = [
     # Encryption
     "ArchiveEncryption",
+    "StreamDecryptor",
     "create_archive_encryption",
     "create_archive_encryption_from_key",
     "EncryptionError",
@@ -67,4 +94,15 @@ __all__ = [
     "IV_LENGTH",
     "KEY_LENGTH",
     "PBKDF2_ITERATIONS",
+    # Serialization
+    "from_orm",
+    "model_field_names",
+    "trusted_construct_enabled",
+    # HTTP cache
+    "make_etag",
+    "etag_matches",
+    "PRIVATE_REVALIDATE",
+    "compress_variants",
+    "pick_encoding",
+    "encoding_headers",
 ]
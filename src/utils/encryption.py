@@ -22,22 +22,35 @@ Repository: https://github.com/the-alphabet-cartel/ash-dash
 
 RESPONSIBILITIES:
 - AES-256-GCM encryption/decryption for session archives
-- PBKDF2 key derivation with unique salt per archive
+- Two-tier keys: PBKDF2 KEK (once) → HKDF per-archive key (unique salt)
 - Secure random generation for salt and IV
 - Integrity verification via GCM authentication tag
 
 ENCRYPTION FORMAT:
-    [Salt: 16 bytes][IV: 12 bytes][Ciphertext + Auth Tag]
+    [Magic "ASHE": 4 bytes][Format: 1 byte][Salt: 16 bytes][IV: 12 bytes]
+    [Ciphertext + Auth Tag]
     
-    - Salt: Random bytes for PBKDF2 key derivation
-    - IV: Initialization vector for AES-GCM (nonce)
+    - Magic + Format: Envelope header (also authenticated as AEAD AAD)
+    - Format 0x02: AES-256-GCM, 0x03: ChaCha20-Poly1305 (both HKDF keys)
+    - Salt: Random bytes for HKDF per-archive key derivation
+    - IV: 12-byte nonce for the AEAD
     - Ciphertext: Encrypted data with 16-byte auth tag appended
 
+LEGACY FORMAT (decrypt only):
+    [Salt: 16 bytes][IV: 12 bytes][Ciphertext + Auth Tag]
+    
+    - Per-archive key is PBKDF2(master_key, salt) - ~100k SHA-256 rounds
+      per archive, so new archives no longer use it
+
 SECURITY NOTES:
-- Each archive gets a unique derived key (master_key + random salt)
-- PBKDF2 with 100,000 iterations provides key stretching
+- KEK = PBKDF2(master_key) with 100,000 iterations, derived once per process
+- Each archive gets a unique key: HKDF-SHA256(KEK, random salt)
 - AES-GCM provides both confidentiality and authenticity
 - 12-byte IV is the recommended size for GCM mode
+- AESGCM from `cryptography` runs on OpenSSL, which uses AES-NI/CLMUL
+  (x86) or ARMv8 crypto extensions when the CPU has them
+- CPUs without AES instructions get ChaCha20-Poly1305 instead
+  (archive.cipher = auto), which is much faster in software
 
 USAGE:
     from src.utils.encryption import create_archive_encryption
@@ -55,15 +68,25 @@ USAGE:
     session_data = json.loads(decrypted.decode('utf-8'))
 """
 
+import hashlib
 import logging
 import os
-from typing import Optional
+from typing import Optional, Tuple
 
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.backends import default_backend
 
+# BLAKE3 is optional - without it archive checksums fall back to SHA-256
+try:
+    import blake3
+except ImportError:  # pragma: no cover - depends on environment
+    blake3 = None
+
 # Module version
 __version__ = "v5.0-9-9.2-1"
 
@@ -86,8 +109,150 @@ KEY_LENGTH = 32
 # PBKDF2 iterations (OWASP recommends 100,000+ for SHA-256)
 PBKDF2_ITERATIONS = 100_000
 
+# GCM authentication tag length (16 bytes = 128 bits)
+TAG_LENGTH = 16
+
 # Minimum size of encrypted blob: salt + iv + auth_tag (no ciphertext)
-MIN_ENCRYPTED_SIZE = SALT_LENGTH + IV_LENGTH + 16  # 16-byte auth tag
+MIN_ENCRYPTED_SIZE = SALT_LENGTH + IV_LENGTH + TAG_LENGTH
+
+# Envelope header for current-format blobs: magic + format byte
+ENVELOPE_MAGIC = b"ASHE"
+FORMAT_HKDF_AES_GCM = 0x02
+FORMAT_HKDF_CHACHA20_POLY1305 = 0x03
+HEADER_LENGTH = len(ENVELOPE_MAGIC) + 1
+
+# Domain-separation labels for the two-tier key derivation
+KEK_SALT = b"ash-dash/archive-kek/v2"
+DEK_INFO = b"ash-dash/archive-dek/v2"
+
+# OpenSSL 3.2 added the stitched AVX-512 VAES/VPCLMULQDQ AES-GCM loop;
+# older builds still use AES-NI + CLMUL, just without that ~2x on new CPUs
+OPENSSL_FAST_GCM_VERSION = (3, 2)
+
+# Envelope format byte -> AEAD (same key, nonce and tag sizes for both)
+AEAD_BY_FORMAT = {
+    FORMAT_HKDF_AES_GCM: AESGCM,
+    FORMAT_HKDF_CHACHA20_POLY1305: ChaCha20Poly1305,
+}
+
+# archive.cipher config values ("auto" picks by CPU support)
+CIPHER_AUTO = "auto"
+CIPHER_AES_GCM = "aes-gcm"
+CIPHER_CHACHA20_POLY1305 = "chacha20-poly1305"
+FORMAT_BY_CIPHER = {
+    CIPHER_AES_GCM: FORMAT_HKDF_AES_GCM,
+    CIPHER_CHACHA20_POLY1305: FORMAT_HKDF_CHACHA20_POLY1305,
+}
+
+# Slice size for the fused encrypt + checksum pass (stays cache-resident
+# between the cipher and the hash)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Integrity checksum for new archives. Both digests are 32 bytes (64 hex
+# chars), so either fits the archives.checksum column; the algorithm is
+# recorded alongside each archive. GCM already authenticates the payload,
+# so this is a storage-integrity check, not a security boundary.
+CHECKSUM_SHA256 = "sha256"
+CHECKSUM_BLAKE3 = "blake3"
+CHECKSUM_ALGORITHM = CHECKSUM_BLAKE3 if blake3 is not None else CHECKSUM_SHA256
+
+
+# =============================================================================
+# Checksums
+# =============================================================================
+
+def new_checksum(algorithm: str = CHECKSUM_ALGORITHM):
+    """
+    Create a hash object for an archive checksum algorithm.
+    
+    Args:
+        algorithm: "blake3" or "sha256" (archives without a recorded
+            algorithm predate BLAKE3 and use "sha256")
+        
+    Returns:
+        Object with update()/hexdigest(), or None if the algorithm is
+        not available in this deployment
+    """
+    if algorithm == CHECKSUM_BLAKE3:
+        return blake3.blake3() if blake3 is not None else None
+    if algorithm == CHECKSUM_SHA256:
+        return hashlib.sha256()
+    return None
+
+
+# =============================================================================
+# Backend Probe
+# =============================================================================
+
+
+def has_aes_acceleration() -> bool:
+    """
+    Check whether the CPU has AES instructions (AES-NI / ARMv8 AES).
+    
+    Reads the Linux /proc/cpuinfo flags. Where that is unavailable the
+    answer is assumed True, keeping AES-GCM as the default.
+    
+    Returns:
+        False only when the CPU is known to lack AES instructions
+    """
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                # x86 lists "flags", ARM lists "Features"
+                if key.strip() in ("flags", "Features"):
+                    return "aes" in value.split()
+    except OSError:
+        pass
+    return True
+
+
+def select_cipher(cipher: str = CIPHER_AUTO) -> str:
+    """
+    Resolve the archive.cipher setting to a concrete AEAD.
+    
+    Without AES instructions, software AES-GCM is several times slower
+    than ChaCha20-Poly1305, so "auto" falls back to ChaCha20 there.
+    
+    Args:
+        cipher: "auto", "aes-gcm" or "chacha20-poly1305"
+        
+    Returns:
+        "aes-gcm" or "chacha20-poly1305"
+    """
+    if cipher in FORMAT_BY_CIPHER:
+        return cipher
+    if cipher != CIPHER_AUTO:
+        logger.warning(f"⚠️ Unknown archive cipher '{cipher}', using auto-detection")
+    return CIPHER_AES_GCM if has_aes_acceleration() else CIPHER_CHACHA20_POLY1305
+
+
+def get_openssl_version() -> Tuple[int, int]:
+    """
+    Get the (major, minor) version of the OpenSSL behind `cryptography`.
+    
+    Returns:
+        Version tuple, or (0, 0) if it cannot be determined
+    """
+    try:
+        number = default_backend().openssl_version_number()
+    except Exception:
+        return (0, 0)
+    # OPENSSL_VERSION_NUMBER layout: 0xMNN00PP0L (3.x) / 0xMNNFFPPS (1.x)
+    return (number >> 28, (number >> 20) & 0xFF)
+
+
+def get_crypto_backend_info() -> str:
+    """
+    Describe the OpenSSL build behind AESGCM (for startup logging).
+    
+    Returns:
+        OpenSSL version text, or "unknown" if it cannot be determined
+    """
+    try:
+        return default_backend().openssl_version_text()
+    except Exception:
+        return "unknown"
 
 
 # =============================================================================
@@ -117,14 +282,18 @@ class InvalidKeyError(EncryptionError):
 
 class ArchiveEncryption:
     """
-    Handles AES-256-GCM encryption for session archives.
+    Handles AES-256-GCM (or ChaCha20-Poly1305) encryption for session archives.
     
-    Uses PBKDF2 key derivation with unique salt per archive,
-    ensuring each archive has a unique encryption key even
-    with the same master key.
+    Derives a key-encryption key (KEK) from the master key with PBKDF2
+    once, then a unique per-archive key from the KEK and a random salt
+    with HKDF - microseconds per archive instead of 100k PBKDF2 rounds.
+    Legacy blobs (per-archive PBKDF2) still decrypt, and blobs of either
+    AEAD format decrypt regardless of which one this instance writes.
     
     Attributes:
         _master_key: The master encryption key (32+ bytes)
+        _kek: PBKDF2-derived key-encryption key (32 bytes)
+        _format: Envelope format byte written by encrypt()
         
     Example:
         >>> encryption = ArchiveEncryption(master_key)
@@ -133,12 +302,13 @@ class ArchiveEncryption:
         >>> assert decrypted == b"sensitive data"
     """
     
-    def __init__(self, master_key: bytes):
+    def __init__(self, master_key: bytes, cipher: str = CIPHER_AES_GCM):
         """
         Initialize with master encryption key.
         
         Args:
             master_key: Master key from Docker secret (must be 32+ bytes)
+            cipher: AEAD for new blobs ("aes-gcm" or "chacha20-poly1305")
             
         Raises:
             InvalidKeyError: If master_key is too short
@@ -154,14 +324,84 @@ class ArchiveEncryption:
             )
         
         self._master_key = master_key
+        self._kek = self._derive_key(KEK_SALT)
+        self._format = FORMAT_BY_CIPHER.get(cipher, FORMAT_HKDF_AES_GCM)
+        self._aead = AEAD_BY_FORMAT[self._format]
         logger.debug(f"ArchiveEncryption initialized with {len(master_key)}-byte key")
     
+    @property
+    def cipher(self) -> str:
+        """AEAD written by encrypt() ("aes-gcm" or "chacha20-poly1305")."""
+        return next(
+            name for name, fmt in FORMAT_BY_CIPHER.items() if fmt == self._format
+        )
+    
+    def worker_state(self) -> Tuple[bytes, str]:
+        """
+        State for rebuilding an encrypting instance in a worker process.
+        
+        Hand it to from_worker_state() once, as a process pool initializer
+        argument; per-archive keys are then derived inside the worker, so
+        neither they nor the master key are pickled per job.
+        
+        Returns:
+            Tuple of (KEK, cipher name)
+        """
+        return self._kek, self.cipher
+    
+    @classmethod
+    def from_worker_state(cls, kek: bytes, cipher: str) -> "ArchiveEncryption":
+        """
+        Rebuild an instance from worker_state() without PBKDF2.
+        
+        The instance encrypts normally and decrypts headered blobs, but
+        has no master key, so legacy (per-archive PBKDF2) blobs fail to
+        decrypt with it.
+        
+        Args:
+            kek: Key-encryption key from worker_state()
+            cipher: Cipher name from worker_state()
+            
+        Raises:
+            InvalidKeyError: If kek is not KEY_LENGTH bytes
+        """
+        if len(kek) != KEY_LENGTH:
+            raise InvalidKeyError(f"KEK must be {KEY_LENGTH} bytes, got {len(kek)} bytes")
+        
+        encryption = cls.__new__(cls)
+        encryption._master_key = None
+        encryption._kek = kek
+        encryption._format = FORMAT_BY_CIPHER.get(cipher, FORMAT_HKDF_AES_GCM)
+        encryption._aead = AEAD_BY_FORMAT[encryption._format]
+        return encryption
+    
+    def _derive_archive_key(self, salt: bytes) -> bytes:
+        """
+        Derive a per-archive key from the cached KEK with HKDF-SHA256.
+        
+        Args:
+            salt: Random salt for this specific archive (16 bytes)
+            
+        Returns:
+            Derived 256-bit (32-byte) key
+        """
+        return HKDF(
+            algorithm=hashes.SHA256(),
+            length=KEY_LENGTH,
+            salt=salt,
+            info=DEK_INFO,
+            backend=default_backend(),
+        ).derive(self._kek)
+    
+    def _header(self) -> bytes:
+        """Envelope header for newly encrypted blobs."""
+        return ENVELOPE_MAGIC + bytes((self._format,))
+    
     def _derive_key(self, salt: bytes) -> bytes:
         """
-        Derive encryption key from master key and salt using PBKDF2.
+        Derive a key from the master key and salt using PBKDF2.
         
-        This ensures each archive has a unique encryption key,
-        even when encrypted with the same master key.
+        Used once for the KEK, and per archive for legacy-format blobs.
         
         Args:
             salt: Random salt for this specific archive (16 bytes)
@@ -190,7 +430,7 @@ class ArchiveEncryption:
             plaintext: Data to encrypt (any bytes)
             
         Returns:
-            Encrypted blob in format: [salt][iv][ciphertext + auth_tag]
+            Encrypted blob in format: [header][salt][iv][ciphertext + auth_tag]
             
         Raises:
             EncryptionError: If encryption fails
@@ -209,16 +449,18 @@ class ArchiveEncryption:
             iv = os.urandom(IV_LENGTH)
             
             # Derive unique key for this archive
-            derived_key = self._derive_key(salt)
+            derived_key = self._derive_archive_key(salt)
             
-            # Encrypt with AES-256-GCM
-            aesgcm = AESGCM(derived_key)
+            # Encrypt with the configured AEAD
+            aead = self._aead(derived_key)
             
-            # GCM mode appends a 16-byte authentication tag to ciphertext
-            ciphertext_with_tag = aesgcm.encrypt(iv, plaintext, None)
+            # Both AEADs append a 16-byte authentication tag to ciphertext;
+            # the header is authenticated too
+            header = self._header()
+            ciphertext_with_tag = aead.encrypt(iv, plaintext, header)
             
-            # Pack: salt + iv + ciphertext (includes auth tag)
-            encrypted_blob = salt + iv + ciphertext_with_tag
+            # Pack: header + salt + iv + ciphertext (includes auth tag) in one copy
+            encrypted_blob = b"".join((header, salt, iv, ciphertext_with_tag))
             
             logger.debug(
                 f"Encrypted {len(plaintext):,} bytes → "
@@ -232,11 +474,85 @@ class ArchiveEncryption:
             logger.error(f"Encryption failed: {e}")
             raise EncryptionError(f"Encryption failed: {e}") from e
     
+    def encrypt_with_checksum(self, plaintext: bytes) -> Tuple[bytes, str]:
+        """
+        Encrypt data and checksum the encrypted blob in one pass.
+        
+        Produces exactly the same format as encrypt(), but feeds each
+        ciphertext slice to the hash while it is still in cache instead of
+        hashing the finished blob in a second full pass.
+        
+        Args:
+            plaintext: Data to encrypt (any bytes)
+            
+        Returns:
+            Tuple of (encrypted blob, hex CHECKSUM_ALGORITHM digest of the blob)
+            
+        Raises:
+            EncryptionError: If encryption fails
+        """
+        if plaintext is None:
+            raise EncryptionError("Cannot encrypt None")
+        
+        if self._format != FORMAT_HKDF_AES_GCM:
+            # ChaCha20Poly1305 has no incremental API - encrypt, then hash
+            blob = self.encrypt(plaintext)
+            digest = new_checksum()
+            digest.update(blob)
+            return blob, digest.hexdigest()
+        
+        try:
+            salt = os.urandom(SALT_LENGTH)
+            iv = os.urandom(IV_LENGTH)
+            derived_key = self._derive_archive_key(salt)
+            header = self._header()
+            
+            encryptor = Cipher(
+                algorithms.AES(derived_key),
+                modes.GCM(iv),
+                backend=default_backend(),
+            ).encryptor()
+            encryptor.authenticate_additional_data(header)
+            digest = new_checksum()
+            
+            # Allocate the whole envelope once and encrypt straight into it;
+            # the tag slot leaves update_into the block_size - 1 slack it needs
+            prefix = header + salt + iv
+            blob = bytearray(len(prefix) + len(plaintext) + TAG_LENGTH)
+            out = memoryview(blob)
+            out[:len(prefix)] = prefix
+            digest.update(prefix)
+            
+            view = memoryview(plaintext)
+            pos = len(prefix)
+            for offset in range(0, len(view), STREAM_CHUNK_SIZE):
+                written = encryptor.update_into(
+                    view[offset:offset + STREAM_CHUNK_SIZE], out[pos:]
+                )
+                digest.update(out[pos:pos + written])
+                pos += written
+            
+            encryptor.finalize()  # GCM emits no trailing ciphertext
+            out[pos:] = encryptor.tag
+            digest.update(encryptor.tag)
+            
+            logger.debug(
+                f"Encrypted {len(plaintext):,} bytes → {len(blob):,} bytes "
+                f"(+{len(blob) - len(plaintext)} overhead, checksum fused)"
+            )
+            
+            return bytes(blob), digest.hexdigest()
+            
+        except Exception as e:
+            logger.error(f"Encryption failed: {e}")
+            raise EncryptionError(f"Encryption failed: {e}") from e
+    
     def decrypt(self, encrypted_blob: bytes) -> bytes:
         """
         Decrypt data encrypted with encrypt().
         
-        Extracts salt and IV from the blob, derives the key,
+        Accepts both the current (headered, HKDF) and legacy (PBKDF2)
+        formats. Extracts salt and IV from the blob, derives the key,
         and decrypts with authentication verification.
         
         Args:
@@ -268,17 +584,29 @@ class ArchiveEncryption:
             )
         
         try:
-            # Unpack components
-            salt = encrypted_blob[:SALT_LENGTH]
-            iv = encrypted_blob[SALT_LENGTH:SALT_LENGTH + IV_LENGTH]
-            ciphertext_with_tag = encrypted_blob[SALT_LENGTH + IV_LENGTH:]
+            # Work on a view so the ciphertext is never copied
+            view = memoryview(encrypted_blob)
+            plaintext = None
             
-            # Derive key using same salt
-            derived_key = self._derive_key(salt)
+            if (
+                len(view) >= HEADER_LENGTH + MIN_ENCRYPTED_SIZE
+                and view[:len(ENVELOPE_MAGIC)] == ENVELOPE_MAGIC
+                and view[len(ENVELOPE_MAGIC)] in AEAD_BY_FORMAT
+            ):
+                try:
+                    plaintext = self._open(
+                        view[HEADER_LENGTH:],
+                        self._derive_archive_key,
+                        bytes(view[:HEADER_LENGTH]),
+                        AEAD_BY_FORMAT[view[len(ENVELOPE_MAGIC)]],
+                    )
+                except InvalidTag:
+                    # A legacy blob's random salt can (2^-40) start with the
+                    # header bytes - fall through and try it as legacy
+                    pass
             
-            # Decrypt and verify authentication tag
-            aesgcm = AESGCM(derived_key)
-            plaintext = aesgcm.decrypt(iv, ciphertext_with_tag, None)
+            if plaintext is None:
+                plaintext = self._open(view, self._derive_key, None, AESGCM)
             
             logger.debug(
                 f"Decrypted {len(encrypted_blob):,} bytes → "
@@ -295,6 +623,29 @@ class ArchiveEncryption:
                 "Decryption failed - wrong key, corrupted data, or tampering detected"
             ) from e
     
+    @staticmethod
+    def _open(body: memoryview, derive_key, aad: Optional[bytes], aead_cls) -> bytes:
+        """Decrypt [salt][iv][ciphertext + tag] with the given key derivation and AEAD."""
+        salt = bytes(body[:SALT_LENGTH])
+        iv = bytes(body[SALT_LENGTH:SALT_LENGTH + IV_LENGTH])
+        ciphertext_with_tag = body[SALT_LENGTH + IV_LENGTH:]
+        
+        # Decrypt and verify authentication tag
+        aead = aead_cls(derive_key(salt))
+        return aead.decrypt(iv, ciphertext_with_tag, aad)
+    
+    def stream_decryptor(self) -> "StreamDecryptor":
+        """
+        Create an incremental decryptor to feed a blob chunk by chunk.
+        
+        Lets a download decrypt while it is still arriving - see
+        StreamDecryptor.
+        
+        Returns:
+            New StreamDecryptor bound to this instance's keys
+        """
+        return StreamDecryptor(self)
+    
     def verify(self, encrypted_blob: bytes) -> bool:
         """
         Verify that encrypted data can be decrypted.
@@ -321,9 +672,129 @@ class ArchiveEncryption:
         
         Returns:
             Number of bytes added to plaintext during encryption
-            (salt + iv + auth_tag = 16 + 12 + 16 = 44 bytes)
+            (header + salt + iv + auth_tag = 5 + 16 + 12 + 16 = 49 bytes)
+        """
+        return HEADER_LENGTH + SALT_LENGTH + IV_LENGTH + TAG_LENGTH
+
+
+class StreamDecryptor:
+    """
+    Incremental decryption of a blob that arrives in chunks.
+    
+    Headered AES-GCM blobs are decrypted as each chunk is fed in, holding
+    back only the trailing tag until finalize() verifies it; once the
+    envelope prefix shows a blob is streamable, the ciphertext chunks are
+    not kept. ChaCha20-Poly1305 and legacy blobs have no incremental API;
+    they are collected and handed to ArchiveEncryption.decrypt() in
+    finalize(). Either way the plaintext is released only after
+    authentication succeeds.
+    
+    Example:
+        >>> decryptor = encryption.stream_decryptor()
+        >>> for chunk in chunks:
+        ...     decryptor.update(chunk)
+        >>> plaintext = decryptor.finalize()
+    """
+    
+    def __init__(self, encryption: ArchiveEncryption):
+        self._encryption = encryption
+        self._chunks = []
+        self._received = 0
+        self._decryptor = None
+        self._streaming = None  # None until the envelope prefix is seen
+        self._pending = b""
+        self._plaintext = bytearray()
+    
+    def update(self, chunk: bytes) -> None:
+        """
+        Feed the next chunk of the encrypted blob.
+        
+        Args:
+            chunk: Next bytes of the blob, in order
+        """
+        if self._streaming:
+            self._feed(chunk)
+            return
+        
+        # Kept by reference: the non-streaming paths need the whole blob
+        self._chunks.append(chunk)
+        self._received += len(chunk)
+        
+        if self._streaming is None:
+            prefix_length = HEADER_LENGTH + SALT_LENGTH + IV_LENGTH
+            if self._received < prefix_length:
+                return
+            self._start(b"".join(self._chunks), prefix_length)
+            if self._streaming:
+                self._chunks = []
+    
+    def _start(self, received: bytes, prefix_length: int) -> None:
+        """Decide from the envelope prefix whether the blob can be streamed."""
+        magic_length = len(ENVELOPE_MAGIC)
+        self._streaming = (
+            received[:magic_length] == ENVELOPE_MAGIC
+            and received[magic_length] == FORMAT_HKDF_AES_GCM
+        )
+        if not self._streaming:
+            return
+        
+        salt = received[HEADER_LENGTH:HEADER_LENGTH + SALT_LENGTH]
+        iv = received[HEADER_LENGTH + SALT_LENGTH:prefix_length]
+        try:
+            self._decryptor = Cipher(
+                algorithms.AES(self._encryption._derive_archive_key(salt)),
+                modes.GCM(iv),
+                backend=default_backend(),
+            ).decryptor()
+            self._decryptor.authenticate_additional_data(received[:HEADER_LENGTH])
+        except Exception as e:
+            raise DecryptionError(f"Decryption failed: {type(e).__name__}") from e
+        self._feed(received[prefix_length:])
+    
+    def _feed(self, data: bytes) -> None:
+        """Decrypt everything except the last TAG_LENGTH bytes seen so far."""
+        data = self._pending + data
+        ready = len(data) - TAG_LENGTH
+        if ready > 0:
+            self._plaintext += self._decryptor.update(data[:ready])
+            data = data[ready:]
+        self._pending = data
+    
+    def finalize(self, blob: Optional[bytes] = None) -> bytes:
         """
-        return SALT_LENGTH + IV_LENGTH + 16  # 16-byte auth tag
+        Verify the blob and return its plaintext.
+        
+        A streamed blob whose tag fails may still be a legacy blob whose
+        random salt happens (2^-40) to look like a header. Streamed chunks
+        are not kept, so that fallback needs the caller's copy of the blob.
+        
+        Args:
+            blob: The whole encrypted blob, if the caller holds it anyway
+            
+        Returns:
+            Original plaintext (a bytearray on the streaming path)
+            
+        Raises:
+            DecryptionError: If the blob is too short, corrupted, tampered
+                with, or was encrypted with a different key (or, when
+                streamed without blob, needs the legacy fallback)
+        """
+        if self._streaming:
+            try:
+                self._decryptor.finalize_with_tag(self._pending)
+                return self._plaintext
+            except (InvalidTag, ValueError) as e:
+                self._plaintext = bytearray()
+                if blob is None:
+                    raise DecryptionError(
+                        "Decryption failed - wrong key, corrupted data, or tampering detected"
+                    ) from e
+            # Let decrypt() report it - or open the look-alike legacy blob
+            return self._encryption.decrypt(blob)
+        
+        return self._encryption.decrypt(
+            blob if blob is not None else b"".join(self._chunks)
+        )
 
 
 # =============================================================================
@@ -331,7 +802,10 @@ class ArchiveEncryption:
 # =============================================================================
 
 
-def create_archive_encryption(secrets_manager) -> ArchiveEncryption:
+def create_archive_encryption(
+    secrets_manager,
+    cipher: str = CIPHER_AUTO,
+) -> ArchiveEncryption:
     """
     Factory function to create ArchiveEncryption instance.
     
@@ -339,6 +813,8 @@ def create_archive_encryption(secrets_manager) -> ArchiveEncryption:
     
     Args:
         secrets_manager: SecretsManager instance to get master key
+        cipher: archive.cipher setting ("auto", "aes-gcm",
+            "chacha20-poly1305")
         
     Returns:
         Configured ArchiveEncryption instance
@@ -361,8 +837,16 @@ def create_archive_encryption(secrets_manager) -> ArchiveEncryption:
             "Generate with: openssl rand 32 > secrets/archive_master_key"
         )
     
-    encryption = ArchiveEncryption(master_key)
-    logger.info("✅ ArchiveEncryption initialized")
+    cipher = select_cipher(cipher)
+    if cipher == CIPHER_AES_GCM and get_openssl_version() < OPENSSL_FAST_GCM_VERSION:
+        logger.info(
+            "ℹ️ OpenSSL < 3.2: AES-GCM uses AES-NI/CLMUL without the "
+            "AVX-512 VAES stitched path"
+        )
+    encryption = ArchiveEncryption(master_key, cipher=cipher)
+    logger.info(
+        f"✅ ArchiveEncryption initialized ({cipher} via {get_crypto_backend_info()})"
+    )
     
     return encryption
 
@@ -395,6 +879,11 @@ __all__ = [
     # Factory functions
     "create_archive_encryption",
     "create_archive_encryption_from_key",
+    "get_crypto_backend_info",
+    "get_openssl_version",
+    "has_aes_acceleration",
+    "select_cipher",
+    "new_checksum",
     # Exceptions
     "EncryptionError",
     "DecryptionError",
@@ -403,5 +892,14 @@ __all__ = [
     "SALT_LENGTH",
     "IV_LENGTH",
     "KEY_LENGTH",
+    "TAG_LENGTH",
+    "HEADER_LENGTH",
+    "ENVELOPE_MAGIC",
     "PBKDF2_ITERATIONS",
+    "CHECKSUM_ALGORITHM",
+    "CIPHER_AUTO",
+    "CIPHER_AES_GCM",
+    "CIPHER_CHACHA20_POLY1305",
+    "CHECKSUM_SHA256",
+    "CHECKSUM_BLAKE3",
 ]
@@ -0,0 +1,204 @@
+"""
+============================================================================
+Ash-DASH: Discord Crisis Detection Dashboard
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Reveal   → Surface crisis alerts and user escalation patterns in real-time
+    Enable   → Equip Crisis Response Teams with tools for swift intervention
+    Clarify  → Translate detection data into actionable intelligence
+    Protect  → Safeguard our LGBTQIA+ community through vigilant oversight
+
+============================================================================
+HTTP Cache Utilities - ETags, conditional GETs and pre-compressed bodies
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-11-11.12-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 11 - Polish & Documentation
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-dash
+============================================================================
+
+RESPONSIBILITIES:
+- Build strong ETags from the values that identify a resource version
+- Match ETags against If-None-Match request headers
+- Pre-compress static/cached bodies and pick the variant a client accepts
+
+USAGE:
+    from src.utils.http_cache import make_etag, etag_matches, PRIVATE_REVALIDATE
+
+    etag = make_etag(session_id, row.updated_at)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": PRIVATE_REVALIDATE},
+        )
+
+    variants = compress_variants(body)
+    encoding = pick_encoding(request.headers.get("accept-encoding"), variants)
+    headers = encoding_headers(encoding, etag)
+    return Response(content=variants[encoding], headers=headers)
+"""
+
+import gzip
+import hashlib
+from typing import Any, Dict, Optional
+
+# Brotli is optional - without it clients get gzip
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
+
+__version__ = "v5.0-11-11.12-1"
+
+# Cache-Control for per-user data: browsers may keep a copy but must
+# revalidate with the ETag on every use; shared proxies must not store it
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from resource version parts.
+
+    Args:
+        *parts: Values identifying the resource version (ids, timestamps,
+            counts, cache versions). None is allowed.
+
+    Returns:
+        Quoted ETag header value
+    """
+    key = "|".join(
+        p.isoformat() if hasattr(p, "isoformat") else str(p)
+        for p in parts
+    )
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Uses weak comparison (RFC 9110 §13.1.2), so W/ prefixes added by
+    compressing proxies still match.
+
+    Args:
+        if_none_match: Raw If-None-Match header value (may be None)
+        etag: Current ETag for the resource
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+
+    return False
+
+
+# Bodies smaller than this are served uncompressed (not worth the overhead)
+MIN_COMPRESS_BYTES = 1024
+
+# Preferred order when a client accepts several encodings
+_ENCODING_PREFERENCE = ("br", "gzip")
+
+
+def compress_variants(
+    body: bytes,
+    gzip_level: int = 9,
+    brotli_quality: int = 11,
+) -> Dict[str, bytes]:
+    """
+    Pre-compress a response body once so requests only pick a variant.
+
+    Args:
+        body: Uncompressed response body
+        gzip_level: gzip compression level (1-9)
+        brotli_quality: Brotli quality (0-11), used if brotli is installed
+
+    Returns:
+        Dict of content-coding -> bytes, always including "identity"
+    """
+    variants = {"identity": body}
+    if len(body) < MIN_COMPRESS_BYTES:
+        return variants
+
+    # mtime=0 keeps the gzip bytes (and so the ETag) stable across restarts
+    variants["gzip"] = gzip.compress(body, compresslevel=gzip_level, mtime=0)
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=brotli_quality)
+
+    return variants
+
+
+def pick_encoding(accept_encoding: Optional[str], variants: Dict[str, bytes]) -> str:
+    """
+    Choose the best available variant for an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Raw Accept-Encoding header value (may be None)
+        variants: Output of compress_variants()
+
+    Returns:
+        Content-coding key into variants ("identity" if nothing matches)
+    """
+    if not accept_encoding or len(variants) == 1:
+        return "identity"
+
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q=") and params[2:] in ("0", "0.0", "0.00", "0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+
+    for coding in _ENCODING_PREFERENCE:
+        if coding in variants and (coding in accepted or "*" in accepted):
+            return coding
+
+    return "identity"
+
+
+def encoding_headers(encoding: str, etag: Optional[str] = None) -> Dict[str, str]:
+    """
+    Build Content-Encoding/Vary (and ETag) headers for a variant.
+
+    Compressed variants get the weak form of the ETag (as nginx does), so
+    they stay valid validators while etag_matches() still accepts them.
+
+    Args:
+        encoding: Key returned by pick_encoding()
+        etag: Base ETag for the uncompressed body, if any
+
+    Returns:
+        Headers to add to the response
+    """
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    if etag:
+        headers["ETag"] = etag if encoding == "identity" else f"W/{etag}"
+    return headers
+
+
+__all__ = [
+    "make_etag",
+    "etag_matches",
+    "PRIVATE_REVALIDATE",
+    "MIN_COMPRESS_BYTES",
+    "compress_variants",
+    "pick_encoding",
+    "encoding_headers",
+]
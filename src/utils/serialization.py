@@ -0,0 +1,128 @@
+"""
+============================================================================
+Ash-DASH: Discord Crisis Detection Dashboard
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Reveal   → Surface crisis alerts and user escalation patterns in real-time
+    Enable   → Equip Crisis Response Teams with tools for swift intervention
+    Clarify  → Translate detection data into actionable intelligence
+    Protect  → Safeguard our LGBTQIA+ community through vigilant oversight
+
+============================================================================
+Serialization Utilities - Fast ORM → response model conversion
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-11-11.12-1
+LAST MODIFIED: 2026-01-18
+PHASE: Phase 11 - Polish & Documentation
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-dash
+============================================================================
+
+RESPONSIBILITIES:
+- Build Pydantic response models from SQLAlchemy rows without re-validation
+- Read the api.trusted_orm_construct flag from configuration
+
+TRUSTED-SOURCE CONTRACT:
+    from_orm() uses model_construct(), which skips ALL Pydantic validation.
+    Only pass objects loaded from our own database (SQLAlchemy rows whose
+    column types already match the response schema). The one coercion
+    applied is Numeric -> float: Decimal columns (e.g. crisis_score) back
+    float response fields and would otherwise serialize as JSON strings.
+    Request bodies and any other client-supplied data MUST keep using
+    model_validate().
+
+USAGE:
+    from src.utils.serialization import (
+        from_orm,
+        model_field_names,
+        trusted_construct_enabled,
+    )
+
+    _USER_FIELDS = model_field_names(UserResponse)  # once, at import
+
+    trusted = trusted_construct_enabled(request.app.state.config_manager)
+    users = [from_orm(UserResponse, _USER_FIELDS, u, trusted) for u in rows]
+"""
+
+from decimal import Decimal
+from typing import Any, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+__version__ = "v5.0-11-11.12-1"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def trusted_construct_enabled(config_manager: Optional[Any]) -> bool:
+    """
+    Check whether trusted ORM rows may skip Pydantic validation.
+
+    Args:
+        config_manager: ConfigManager instance (may be None during startup)
+
+    Returns:
+        True if api.trusted_orm_construct is enabled (default: True)
+    """
+    if config_manager is None:
+        return True
+    return bool(config_manager.get("api", "trusted_orm_construct", True))
+
+
+def model_field_names(model_cls: Type[BaseModel]) -> Tuple[str, ...]:
+    """
+    Get a response model's field names as a tuple.
+
+    Call once at import time and pass the result to from_orm() so rows
+    are built without re-walking model_fields on every call.
+
+    Args:
+        model_cls: Pydantic response model class
+
+    Returns:
+        Tuple of field names in declaration order
+    """
+    return tuple(model_cls.model_fields)
+
+
+def from_orm(
+    model_cls: Type[ModelT],
+    fields: Tuple[str, ...],
+    obj: Any,
+    trusted: bool = True,
+) -> ModelT:
+    """
+    Convert a SQLAlchemy row into a response model.
+
+    Args:
+        model_cls: Pydantic response model class
+        fields: Cached field names from model_field_names(model_cls)
+        obj: ORM instance loaded from the database
+        trusted: If True, use model_construct() and skip validation
+            (Decimal values are still converted to float)
+
+    Returns:
+        Populated response model instance
+
+    Raises:
+        AttributeError: If obj lacks one of fields (trusted path)
+    """
+    if not trusted:
+        return model_cls.model_validate(obj)
+
+    values = {}
+    for field in fields:
+        # No default: a schema field the row lacks must fail loudly, not
+        # silently serialize as null
+        value = getattr(obj, field)
+        # Numeric columns load as Decimal; the schemas declare float
+        if isinstance(value, Decimal):
+            value = float(value)
+        values[field] = value
+
+    return model_cls.model_construct(**values)
+
+
+__all__ = ["from_orm", "model_field_names", "trusted_construct_enabled"]
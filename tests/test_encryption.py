@@ -0,0 +1,268 @@
+"""
+============================================================================
+Ash-DASH: Discord Crisis Detection Dashboard
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Reveal   → Surface crisis alerts and user escalation patterns in real-time
+    Enable   → Equip Crisis Response Teams with tools for swift intervention
+    Clarify  → Translate detection data into actionable intelligence
+    Protect  → Safeguard our LGBTQIA+ community through vigilant oversight
+
+============================================================================
+Encryption Tests - Archive envelope formats, legacy blobs, streaming
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-9-9.2-1
+LAST MODIFIED: 2026-01-09
+PHASE: Phase 9 - Archive System Implementation
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-dash
+============================================================================
+
+USAGE:
+    pytest tests/test_encryption.py
+"""
+
+import os
+from typing import Optional
+
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+from src.utils.encryption import (
+    CIPHER_AES_GCM,
+    CIPHER_CHACHA20_POLY1305,
+    ENVELOPE_MAGIC,
+    FORMAT_HKDF_AES_GCM,
+    FORMAT_HKDF_CHACHA20_POLY1305,
+    HEADER_LENGTH,
+    IV_LENGTH,
+    KEY_LENGTH,
+    PBKDF2_ITERATIONS,
+    SALT_LENGTH,
+    ArchiveEncryption,
+    DecryptionError,
+    InvalidKeyError,
+)
+
+MASTER_KEY = bytes(range(KEY_LENGTH))
+OTHER_KEY = bytes(reversed(range(KEY_LENGTH)))
+
+# Spans several STREAM_CHUNK_SIZE slices and is not block-aligned
+PLAINTEXT = os.urandom(200_003)
+
+CIPHERS = [CIPHER_AES_GCM, CIPHER_CHACHA20_POLY1305]
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def legacy_encrypt(master_key: bytes, plaintext: bytes, salt: Optional[bytes] = None) -> bytes:
+    """
+    Encrypt the way archives were written before the envelope header.
+
+    Format: [salt][iv][ciphertext + tag], per-archive PBKDF2 key, no AAD.
+    """
+    salt = salt or os.urandom(SALT_LENGTH)
+    iv = os.urandom(IV_LENGTH)
+    key = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=KEY_LENGTH,
+        salt=salt,
+        iterations=PBKDF2_ITERATIONS,
+    ).derive(master_key)
+    return salt + iv + AESGCM(key).encrypt(iv, plaintext, None)
+
+
+def stream_decrypt(
+    encryption: ArchiveEncryption,
+    blob: bytes,
+    chunk_size: int,
+    keep: bool = False,
+) -> bytes:
+    """Feed a blob to a StreamDecryptor in chunk_size pieces."""
+    decryptor = encryption.stream_decryptor()
+    for offset in range(0, len(blob), chunk_size):
+        decryptor.update(blob[offset:offset + chunk_size])
+    return bytes(decryptor.finalize(blob if keep else None))
+
+
+def flip_byte(blob: bytes, index: int) -> bytes:
+    """Return blob with one byte inverted."""
+    tampered = bytearray(blob)
+    tampered[index] ^= 0xFF
+    return bytes(tampered)
+
+
+# =============================================================================
+# Round Trips
+# =============================================================================
+
+@pytest.mark.parametrize("cipher", CIPHERS)
+def test_round_trip(cipher):
+    encryption = ArchiveEncryption(MASTER_KEY, cipher=cipher)
+    blob = encryption.encrypt(PLAINTEXT)
+
+    assert len(blob) == len(PLAINTEXT) + ArchiveEncryption.get_overhead()
+    assert encryption.decrypt(blob) == PLAINTEXT
+
+
+@pytest.mark.parametrize("cipher", CIPHERS)
+def test_envelope_header(cipher):
+    blob = ArchiveEncryption(MASTER_KEY, cipher=cipher).encrypt(b"data")
+    expected_format = {
+        CIPHER_AES_GCM: FORMAT_HKDF_AES_GCM,
+        CIPHER_CHACHA20_POLY1305: FORMAT_HKDF_CHACHA20_POLY1305,
+    }[cipher]
+
+    assert blob[:HEADER_LENGTH] == ENVELOPE_MAGIC + bytes((expected_format,))
+
+
+@pytest.mark.parametrize("cipher", CIPHERS)
+def test_encrypt_with_checksum_round_trip(cipher):
+    encryption = ArchiveEncryption(MASTER_KEY, cipher=cipher)
+    blob, checksum = encryption.encrypt_with_checksum(PLAINTEXT)
+
+    assert len(checksum) == 64
+    assert encryption.decrypt(blob) == PLAINTEXT
+
+
+def test_empty_plaintext_round_trip():
+    encryption = ArchiveEncryption(MASTER_KEY)
+
+    assert encryption.decrypt(encryption.encrypt(b"")) == b""
+
+
+def test_same_plaintext_encrypts_differently():
+    encryption = ArchiveEncryption(MASTER_KEY)
+
+    assert encryption.encrypt(b"secret") != encryption.encrypt(b"secret")
+
+
+@pytest.mark.parametrize("writer,reader", [
+    (CIPHER_AES_GCM, CIPHER_CHACHA20_POLY1305),
+    (CIPHER_CHACHA20_POLY1305, CIPHER_AES_GCM),
+])
+def test_decrypts_either_format(writer, reader):
+    blob = ArchiveEncryption(MASTER_KEY, cipher=writer).encrypt(PLAINTEXT)
+
+    assert ArchiveEncryption(MASTER_KEY, cipher=reader).decrypt(blob) == PLAINTEXT
+
+
+# =============================================================================
+# Legacy Format
+# =============================================================================
+
+def test_decrypts_legacy_blob():
+    blob = legacy_encrypt(MASTER_KEY, PLAINTEXT)
+
+    assert ArchiveEncryption(MASTER_KEY).decrypt(blob) == PLAINTEXT
+
+
+def test_stream_decrypts_legacy_blob():
+    blob = legacy_encrypt(MASTER_KEY, PLAINTEXT)
+    encryption = ArchiveEncryption(MASTER_KEY)
+
+    assert stream_decrypt(encryption, blob, 4096) == PLAINTEXT
+
+
+def test_legacy_blob_with_header_like_salt():
+    # The streaming path takes this for a headered blob; only the caller's
+    # copy of the blob lets finalize() retry it as legacy
+    salt = ENVELOPE_MAGIC + bytes((FORMAT_HKDF_AES_GCM,)) + os.urandom(SALT_LENGTH - HEADER_LENGTH)
+    blob = legacy_encrypt(MASTER_KEY, PLAINTEXT, salt=salt)
+    encryption = ArchiveEncryption(MASTER_KEY)
+
+    assert encryption.decrypt(blob) == PLAINTEXT
+    assert stream_decrypt(encryption, blob, 4096, keep=True) == PLAINTEXT
+    with pytest.raises(DecryptionError):
+        stream_decrypt(encryption, blob, 4096)
+
+
+def test_legacy_blob_wrong_key_rejected():
+    blob = legacy_encrypt(MASTER_KEY, b"secret")
+
+    with pytest.raises(DecryptionError):
+        ArchiveEncryption(OTHER_KEY).decrypt(blob)
+
+
+# =============================================================================
+# Streaming
+# =============================================================================
+
+@pytest.mark.parametrize("cipher", CIPHERS)
+@pytest.mark.parametrize("chunk_size", [1, 7, HEADER_LENGTH + SALT_LENGTH, 4096, 65_537])
+def test_stream_decrypt_chunk_splits(cipher, chunk_size):
+    encryption = ArchiveEncryption(MASTER_KEY, cipher=cipher)
+    plaintext = PLAINTEXT if chunk_size > 1 else PLAINTEXT[:2048]
+    blob = encryption.encrypt(plaintext)
+
+    assert stream_decrypt(encryption, blob, chunk_size) == plaintext
+
+
+def test_stream_decrypt_single_chunk():
+    encryption = ArchiveEncryption(MASTER_KEY)
+    blob = encryption.encrypt(PLAINTEXT)
+
+    assert stream_decrypt(encryption, blob, len(blob)) == PLAINTEXT
+
+
+# =============================================================================
+# Tamper Rejection
+# =============================================================================
+
+@pytest.mark.parametrize("cipher", CIPHERS)
+@pytest.mark.parametrize("index", [
+    len(ENVELOPE_MAGIC),                         # format byte
+    HEADER_LENGTH,                               # salt
+    HEADER_LENGTH + SALT_LENGTH,                 # iv
+    HEADER_LENGTH + SALT_LENGTH + IV_LENGTH,     # ciphertext
+    -1,                                          # auth tag
+])
+def test_tampered_blob_rejected(cipher, index):
+    encryption = ArchiveEncryption(MASTER_KEY, cipher=cipher)
+    blob = flip_byte(encryption.encrypt(PLAINTEXT), index)
+
+    with pytest.raises(DecryptionError):
+        encryption.decrypt(blob)
+    with pytest.raises(DecryptionError):
+        stream_decrypt(encryption, blob, 4096)
+    with pytest.raises(DecryptionError):
+        stream_decrypt(encryption, blob, 4096, keep=True)
+    assert encryption.verify(blob) is False
+
+
+def test_tampered_legacy_blob_rejected():
+    encryption = ArchiveEncryption(MASTER_KEY)
+    blob = flip_byte(legacy_encrypt(MASTER_KEY, PLAINTEXT), -1)
+
+    with pytest.raises(DecryptionError):
+        encryption.decrypt(blob)
+
+
+def test_truncated_blob_rejected():
+    encryption = ArchiveEncryption(MASTER_KEY)
+    blob = encryption.encrypt(PLAINTEXT)
+
+    with pytest.raises(DecryptionError):
+        encryption.decrypt(blob[:-1])
+    with pytest.raises(DecryptionError):
+        stream_decrypt(encryption, blob[:-1], 4096)
+    with pytest.raises(DecryptionError):
+        encryption.decrypt(blob[:HEADER_LENGTH])
+
+
+def test_wrong_key_rejected():
+    blob = ArchiveEncryption(MASTER_KEY).encrypt(b"secret")
+
+    with pytest.raises(DecryptionError):
+        ArchiveEncryption(OTHER_KEY).decrypt(blob)
+
+
+def test_short_master_key_rejected():
+    with pytest.raises(InvalidKeyError):
+        ArchiveEncryption(b"too-short")
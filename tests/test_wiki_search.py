@@ -0,0 +1,127 @@
+"""
+============================================================================
+Ash-DASH: Discord Crisis Detection Dashboard
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Reveal   → Surface crisis alerts and user escalation patterns in real-time
+    Enable   → Equip Crisis Response Teams with tools for swift intervention
+    Clarify  → Translate detection data into actionable intelligence
+    Protect  → Safeguard our LGBTQIA+ community through vigilant oversight
+
+============================================================================
+Wiki Search Tests - Indexed search against the shipped docs/wiki content
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-11-11.11-1
+LAST MODIFIED: 2026-01-09
+PHASE: Phase 11 - Wiki Documentation System
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-dash
+============================================================================
+
+Result sets below were recorded from the substring search that predates
+the inverted index; the indexed search must not drift from them for
+punctuated, partial-word, or single-phrase queries.
+
+USAGE:
+    pytest tests/test_wiki_search.py
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from src.managers.wiki import create_wiki_manager
+
+DOCS_PATH = Path(__file__).parent.parent / "docs" / "wiki"
+
+
+@pytest.fixture(scope="module")
+def wiki():
+    """WikiManager over the repository's docs/wiki directory."""
+    return create_wiki_manager(config_manager=None, docs_path=str(DOCS_PATH))
+
+
+def search_slugs(wiki, query: str) -> set:
+    """Slugs of every document matching query."""
+    return {result.document.slug for result in wiki.search(query, limit=100)}
+
+
+# =============================================================================
+# Parity With The Substring Search
+# =============================================================================
+
+@pytest.mark.parametrize("query,expected", [
+    ("C++", set()),
+    ("on-call", {"operations/runbook"}),
+    ("safety-plan", set()),
+    ("de-escalation", set()),
+    ("self-care", {
+        "crt/ash-bot_crisis-response-guide",
+        "crt/ash-dash_crisis-response-guide",
+        "crt/self-care",
+        "crt/session-management",
+        "training/onboarding",
+    }),
+])
+def test_punctuated_query_matches_literally(wiki, query, expected):
+    assert search_slugs(wiki, query) == expected
+
+
+def test_mid_word_query_falls_back_to_substring(wiki):
+    expected = {
+        doc.slug for doc in wiki.scan_documents()
+        if "sponse" in doc.content_md.lower() or "sponse" in doc.title.lower()
+    }
+
+    assert len(expected) == 28
+    assert search_slugs(wiki, "sponse") == expected
+
+
+def test_phrase_results_kept(wiki):
+    previous = {
+        "admin/ash-bot_system_architecture",
+        "crt/ash-bot_crisis-response-guide",
+        "crt/ash-dash_crisis-response-guide",
+        "crt/ash-nlp_crisis-response-guide",
+        "crt/getting-started",
+        "crt/notes-best-practices",
+        "crt/self-care",
+        "future/ash-bot/enhancements",
+        "future/ash-bot/roadmap",
+        "future/ash-dash/roadmap",
+        "future/ash-nlp/enhancements",
+        "future/ash-thrash/enhancements",
+        "future/ash/roadmap",
+        "operations/configuration",
+        "reference/faq",
+        "reference/glossary",
+        "training/onboarding",
+    }
+
+    assert previous <= search_slugs(wiki, "crisis response")
+
+
+# =============================================================================
+# Word Matching
+# =============================================================================
+
+def test_short_word_is_not_prefix_expanded(wiki):
+    # "ai" must not pull in "aim", "available", ...
+    results = wiki.search("ai", limit=100)
+
+    assert results
+    for result in results:
+        doc = wiki.get_document(result.document.slug)
+        text = " ".join((doc.title, " ".join(doc.tags), doc.description, doc.content_md))
+        assert "ai" in re.findall(r"\w+", text.lower())
+
+
+def test_long_word_is_prefix_expanded(wiki):
+    assert search_slugs(wiki, "escalat") >= search_slugs(wiki, "escalation")
+
+
+def test_blank_query_returns_nothing(wiki):
+    assert wiki.search("   ") == []